@@ -0,0 +1,56 @@
+"""
+Load agent modules (handlers, strategy, game logic) from agent directories.
+
+Agent directories are script directories: their modules import each other by
+bare name (``from handlers import ...``). Several agents use the same module
+names, so tools that combine agents in one interpreter load each directory
+through this helper instead of putting every directory on ``sys.path``.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional
+
+
+# Default agents root (sibling of the SHARED directory)
+DEFAULT_AGENTS_ROOT = Path(__file__).parent.parent.parent / "agents"
+
+# Module names that several agent directories define
+AMBIGUOUS_MODULES = ("handlers", "main")
+
+
+def load_agent_modules(
+    agent_name: str,
+    module_names: Iterable[str],
+    agents_root: Optional[Path] = None,
+) -> Dict[str, ModuleType]:
+    """
+    Import modules from one agent directory.
+
+    Modules with names shared between agents (``handlers``, ``main``) are
+    removed from ``sys.modules`` again so the next agent can load its own.
+    Other modules (``strategy``, ``game_logic``) stay registered, because agent
+    code imports them lazily inside functions.
+
+    Args:
+        agent_name: Directory name under the agents root (e.g., "player_template")
+        module_names: Module names to import, dependencies first
+        agents_root: Optional custom agents root directory
+
+    Returns:
+        Dict mapping module name to the imported module
+    """
+    root = Path(agents_root) if agents_root else DEFAULT_AGENTS_ROOT
+    agent_dir = str(root / agent_name)
+
+    saved = {name: sys.modules.pop(name) for name in AMBIGUOUS_MODULES if name in sys.modules}
+    sys.path.insert(0, agent_dir)
+    try:
+        return {name: importlib.import_module(name) for name in module_names}
+    finally:
+        sys.path.remove(agent_dir)
+        for name in AMBIGUOUS_MODULES:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
@@ -0,0 +1,128 @@
+"""Message batcher that coalesces outgoing items into batched calls."""
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, List, Optional
+
+
+class MessageBatcher:
+    """
+    Coalesce items into batches flushed by size or by time window.
+
+    Items are added without waiting for delivery. A batch is flushed as soon as
+    it reaches ``max_batch_size`` items, or ``max_wait_sec`` seconds after the
+    first item of the batch was added, whichever comes first.
+
+    A batch whose delivery fails is put back in front of the pending items and
+    flushed again after an exponential backoff (``retry_delay`` doubling per
+    consecutive failure, up to ``max_retry_delay``). Items are never dropped,
+    so the flush callback must tolerate receiving an item twice.
+    """
+
+    def __init__(
+        self,
+        flush_callback: Callable[[List[Any]], Awaitable[None]],
+        max_batch_size: int = 16,
+        max_wait_sec: float = 0.1,
+        name: str = "batcher",
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 10.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush_callback: Coroutine function receiving the list of batched items
+            max_batch_size: Flush immediately once this many items are pending
+            max_wait_sec: Maximum time an item waits before its batch is flushed
+            name: Name used in log messages
+            retry_delay: Delay before the first redelivery of a failed batch
+            max_retry_delay: Longest delay between redeliveries
+        """
+        self.flush_callback = flush_callback
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_sec = max(0.0, float(max_wait_sec))
+        self.name = name
+        self.retry_delay = max(0.0, float(retry_delay))
+        self.max_retry_delay = max(self.retry_delay, float(max_retry_delay))
+        self.logger = logging.getLogger(__name__)
+        self._pending: List[Any] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+        self._failures = 0  # consecutive failed deliveries
+
+    @property
+    def pending_count(self) -> int:
+        """Number of items waiting for the next flush."""
+        return len(self._pending)
+
+    def add(self, item: Any) -> None:
+        """Queue an item for the next batch."""
+        self._pending.append(item)
+        if self._failures:
+            # Backing off: the retry flushes this item with the failed batch
+            return
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after(self.max_wait_sec))
+
+    async def flush(self) -> None:
+        """
+        Flush pending items now and wait for all in-flight batches.
+
+        Items of a batch that failed again are still pending afterwards.
+        """
+        self._schedule_flush()
+        if self._in_flight:
+            await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush everything that is still pending."""
+        await self.flush()
+
+    async def _flush_after(self, delay: float) -> None:
+        """Flush the current batch once ``delay`` seconds have elapsed."""
+        await asyncio.sleep(delay)
+        self._timer = None
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Detach the pending items and deliver them in a background task."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._deliver(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _deliver(self, batch: List[Any]) -> None:
+        """Invoke the flush callback; requeue the batch if it fails."""
+        try:
+            await self.flush_callback(batch)
+        except Exception as e:
+            self._requeue(batch, e)
+        else:
+            if self._failures:
+                self._failures = 0
+                if self._pending and self._timer is None:
+                    # Items added while a retry was in flight
+                    self._timer = asyncio.create_task(self._flush_after(self.max_wait_sec))
+
+    def _requeue(self, batch: List[Any], error: Exception) -> None:
+        """Put a failed batch back in front and flush it again after a backoff."""
+        # Exponential backoff with jitter: between half and all of the step
+        step = min(self.max_retry_delay, self.retry_delay * 2 ** self._failures)
+        delay = step / 2 + random.uniform(0, step / 2)
+        self._failures += 1
+        self.logger.warning(
+            f"{self.name}: failed to flush batch of {len(batch)} "
+            f"(attempt {self._failures}), retrying in {delay:.2f}s: {error}"
+        )
+        self._pending = batch + self._pending
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.create_task(self._flush_after(delay))
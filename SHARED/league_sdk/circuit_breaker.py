@@ -0,0 +1,168 @@
+"""
+Per-endpoint health tracking and circuit breakers for MCPClient.
+
+Every endpoint's breaker starts closed. After ``failure_threshold``
+consecutive transport failures (timeouts, refused connections, HTTP 5xx) it
+opens, and calls fail at once with CircuitOpenError instead of waiting for
+another timeout. The open period starts at ``open_sec`` and doubles with every
+trip that follows a failed probe, with jitter, up to ``max_open_sec``. Once it
+has passed the breaker is half-open: one probe call goes through, and other
+calls still fail fast. A successful probe closes the breaker; a failed one
+opens it again.
+
+A JSON-RPC error is still an answer, so it counts as a success here.
+
+The state of every endpoint is exported as ``mcp_client_circuit_state``
+(0 closed, 1 half-open, 2 open) and returned by ``HealthTracker.snapshot``.
+The league manager uses it to forfeit matches of players known to be down.
+"""
+
+import random
+import time
+from typing import Callable, Dict, Optional
+
+from .metrics import MCPMetrics
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(ConnectionError):
+    """Call refused without being sent: the endpoint's breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        wait = f"next probe in {retry_in:.1f}s" if retry_in > 0 else "probe in flight"
+        super().__init__(f"Circuit open for {endpoint} ({wait})")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: Callable[[float, float], float] = random.uniform) -> float:
+    """Exponential backoff with jitter: between half and all of min(cap, base * 2**attempt)."""
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + rng(0, delay / 2)
+
+
+class EndpointHealth:
+    """Breaker state and call counts of one endpoint."""
+
+    __slots__ = ("state", "consecutive_failures", "trips", "open_until", "probing",
+                 "successes", "failures", "last_error", "last_failure_at")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0  # consecutive openings without a successful call in between
+        self.open_until = 0.0
+        self.probing = False
+        self.successes = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.last_failure_at: Optional[float] = None
+
+
+class HealthTracker:
+    """Circuit breakers of every endpoint one MCPClient calls."""
+
+    def __init__(self, failure_threshold: int = 3, open_sec: float = 2.0, max_open_sec: float = 60.0,
+                 metrics: Optional[MCPMetrics] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a breaker
+            open_sec: First open period in seconds
+            max_open_sec: Longest open period
+            metrics: Where to export breaker state (None = not exported)
+            clock: Monotonic time source
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_sec = open_sec
+        self.max_open_sec = max_open_sec
+        self.metrics = metrics
+        self.clock = clock
+        self.endpoints: Dict[str, EndpointHealth] = {}
+
+    def get(self, endpoint: str) -> EndpointHealth:
+        health = self.endpoints.get(endpoint)
+        if health is None:
+            health = self.endpoints[endpoint] = EndpointHealth()
+        return health
+
+    def state(self, endpoint: str) -> str:
+        """Current state; an open breaker whose period has passed reads as half-open."""
+        health = self.endpoints.get(endpoint)
+        if health is None:
+            return CLOSED
+        if health.state == OPEN and self.clock() >= health.open_until:
+            return HALF_OPEN
+        return health.state
+
+    def is_down(self, endpoint: str) -> bool:
+        """True while calls to ``endpoint`` fail fast."""
+        return self.state(endpoint) == OPEN
+
+    def acquire(self, endpoint: str) -> None:
+        """Admit one call to ``endpoint`` or raise CircuitOpenError."""
+        health = self.endpoints.get(endpoint)
+        if health is None or health.state == CLOSED:
+            return
+        now = self.clock()
+        if health.state == OPEN:
+            if now < health.open_until:
+                raise CircuitOpenError(endpoint, health.open_until - now)
+            self._set_state(endpoint, health, HALF_OPEN)
+        if health.probing:
+            raise CircuitOpenError(endpoint, 0.0)
+        health.probing = True
+
+    def release(self, endpoint: str) -> None:
+        """End a call that neither succeeded nor failed (e.g., cancelled)."""
+        health = self.endpoints.get(endpoint)
+        if health is not None:
+            health.probing = False
+
+    def record_success(self, endpoint: str) -> None:
+        health = self.get(endpoint)
+        health.successes += 1
+        health.consecutive_failures = 0
+        health.trips = 0
+        health.probing = False
+        if health.state != CLOSED:
+            self._set_state(endpoint, health, CLOSED)
+
+    def record_failure(self, endpoint: str, error: str) -> None:
+        health = self.get(endpoint)
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.last_error = error
+        health.last_failure_at = time.time()
+        health.probing = False
+        if health.state == HALF_OPEN or (health.state == CLOSED
+                                         and health.consecutive_failures >= self.failure_threshold):
+            self._open(endpoint, health)
+
+    def _open(self, endpoint: str, health: EndpointHealth) -> None:
+        health.open_until = self.clock() + backoff_delay(health.trips, self.open_sec, self.max_open_sec)
+        health.trips += 1
+        self._set_state(endpoint, health, OPEN)
+        if self.metrics is not None:
+            self.metrics.circuit_opened.labels(endpoint).inc()
+
+    def _set_state(self, endpoint: str, health: EndpointHealth, state: str) -> None:
+        health.state = state
+        if self.metrics is not None:
+            self.metrics.circuit_state.labels(endpoint).set(STATE_VALUES[state])
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """State and counts of every endpoint called so far."""
+        now = self.clock()
+        return {
+            endpoint: {
+                "state": self.state(endpoint),
+                "consecutive_failures": health.consecutive_failures,
+                "successes": health.successes,
+                "failures": health.failures,
+                "last_error": health.last_error,
+                "retry_in_sec": round(max(health.open_until - now, 0.0), 3) if health.state == OPEN else 0.0,
+            }
+            for endpoint, health in self.endpoints.items()
+        }
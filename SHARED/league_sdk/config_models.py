@@ -26,6 +26,22 @@ class TimeoutsConfig:
     move_timeout_sec: int
     generic_response_timeout_sec: int
 
+    def for_tool(self, tool_name: str) -> float:
+        """Seconds a caller waits for ``tool_name`` before giving up."""
+        if tool_name == "register_referee":
+            return self.register_referee_timeout_sec
+        if tool_name == "register_player":
+            return self.register_player_timeout_sec
+        if tool_name == "receive_game_invitation":
+            return self.game_join_ack_timeout_sec
+        if tool_name == "choose_parity":
+            return self.move_timeout_sec
+        if tool_name == "start_match":
+            # The referee answers after inviting, collecting moves and reporting
+            return (self.game_join_ack_timeout_sec + self.move_timeout_sec
+                    + self.generic_response_timeout_sec)
+        return self.generic_response_timeout_sec
+
 @dataclass
 class SystemConfig:
     """Global system configuration."""
@@ -0,0 +1,110 @@
+"""
+Per-call deadlines.
+
+A deadline is the absolute UTC time after which the caller stops waiting for
+an answer. MCPClient derives it from the tool's timeout profile
+(``TimeoutsConfig.for_tool``) and sends it with every request as
+``params._meta.deadline`` (ISO-8601, millisecond precision, like the
+envelope's ``timestamp``). Messages such as ``choose_parity_call`` also carry
+a protocol-level ``deadline`` argument; the earlier of the two applies.
+
+MCPServer answers a request whose deadline has already passed with JSON-RPC
+error -32001 without running the handler. While a handler runs its deadline
+is current, so the calls it makes are capped by it: a referee never waits on
+a player longer than the league manager waits on the referee. Work that
+outlives the request (queued matches, batched reports) runs ``detached()``.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# JSON-RPC error code of a request dropped because its deadline passed
+DEADLINE_EXCEEDED = -32001
+
+_current: contextvars.ContextVar = contextvars.ContextVar("league_deadline", default=None)
+
+
+def format_deadline(deadline: float) -> str:
+    """ISO-8601 UTC form of an epoch-seconds deadline."""
+    moment = datetime.fromtimestamp(deadline, tz=timezone.utc)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def parse_deadline(value) -> Optional[float]:
+    """Epoch seconds of an ISO-8601 deadline, or None if absent or malformed."""
+    if not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def earliest(*deadlines: Optional[float]) -> Optional[float]:
+    """The first of the given deadlines to pass, ignoring None."""
+    present = [d for d in deadlines if d is not None]
+    return min(present) if present else None
+
+
+def current() -> Optional[float]:
+    """Deadline of the request being handled in this context, if any."""
+    return _current.get()
+
+
+def remaining(deadline: float) -> float:
+    """Seconds left until ``deadline`` (negative once it has passed)."""
+    return deadline - time.time()
+
+
+def activate(deadline: Optional[float]) -> contextvars.Token:
+    """Make ``deadline`` current; pass the token to ``deactivate``."""
+    return _current.set(deadline)
+
+
+def deactivate(token: contextvars.Token) -> None:
+    _current.reset(token)
+
+
+def call_deadline(timeout: Optional[float], arguments: Optional[Dict] = None) -> Optional[float]:
+    """Deadline of an outgoing call: its own timeout, capped by the current
+    deadline and by a ``deadline`` argument in the message."""
+    own = time.time() + timeout if timeout is not None else None
+    declared = parse_deadline(arguments.get("deadline")) if isinstance(arguments, dict) else None
+    return earliest(own, current(), declared)
+
+
+def request_deadline(payload) -> Optional[float]:
+    """Deadline of an incoming JSON-RPC request, or None if it carries none."""
+    if not isinstance(payload, dict):
+        return None
+    params = payload.get("params")
+    if not isinstance(params, dict):
+        return None
+    meta = params.get("_meta")
+    arguments = params.get("arguments")
+    return earliest(
+        parse_deadline(meta.get("deadline")) if isinstance(meta, dict) else None,
+        parse_deadline(arguments.get("deadline")) if isinstance(arguments, dict) else None,
+    )
+
+
+def inject(params: Dict, deadline: float) -> None:
+    """Carry ``deadline`` in a JSON-RPC request's params."""
+    params.setdefault("_meta", {})["deadline"] = format_deadline(deadline)
+
+
+@contextmanager
+def detached():
+    """Run calls without the current deadline, for work that outlives the
+    request that started it (queued matches, batched reports, notifications)."""
+    token = _current.set(None)
+    try:
+        yield
+    finally:
+        _current.reset(token)
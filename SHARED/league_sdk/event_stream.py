@@ -0,0 +1,166 @@
+"""
+Server-Sent Events push channel.
+
+An MCPServer keeps one EventHub. Each authenticated subscriber holds a
+long-lived ``GET /mcp/events`` response and gets a bounded queue. The server
+publishes notifications to it as SSE frames:
+
+    id: 17
+    event: notify_round
+    data: {"message_type": "ROUND_ANNOUNCEMENT", ...}
+
+The event name is the tool that would otherwise have been called with a POST,
+and ``data`` holds that tool's arguments, so subscribers reuse their tool
+handlers unchanged.
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+
+
+def format_sse(event: str, data: Dict, event_id: Optional[int] = None) -> bytes:
+    """Encode one SSE frame (data is compact JSON on a single line)."""
+    frame = f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+    if event_id is not None:
+        frame = f"id: {event_id}\n" + frame
+    return frame.encode("utf-8")
+
+
+async def parse_sse(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[str, Dict]]:
+    """Decode SSE frames from text lines into (event, data) pairs; comments are skipped."""
+    event, data = "message", []
+    async for line in lines:
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+
+
+class Subscription:
+    """Queue of encoded frames for one connected subscriber."""
+
+    __slots__ = ("key", "queue", "closed", "_closed_event")
+
+    def __init__(self, key: str, max_queue: int):
+        self.key = key
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.closed = False
+        # Out of band, so closing never needs room in a full queue
+        self._closed_event = asyncio.Event()
+
+    def close(self) -> None:
+        """End the stream after the frames already queued."""
+        self.closed = True
+        self._closed_event.set()
+
+    async def next_frame(self, timeout: float) -> Optional[bytes]:
+        """
+        Next queued frame, or None once closed and drained.
+
+        Raises:
+            asyncio.TimeoutError: Nothing arrived within ``timeout`` seconds
+        """
+        if not self.queue.empty():
+            return self.queue.get_nowait()
+        if self.closed:
+            return None
+        getter = asyncio.ensure_future(self.queue.get())
+        closer = asyncio.ensure_future(self._closed_event.wait())
+        try:
+            done, _ = await asyncio.wait((getter, closer), timeout=timeout,
+                                         return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            getter.cancel()
+            closer.cancel()
+        if getter in done:
+            return getter.result()
+        if closer in done:
+            return self.queue.get_nowait() if not self.queue.empty() else None
+        raise asyncio.TimeoutError
+
+
+class EventHub:
+    """
+    Subscribers of one server, keyed by an id chosen at authentication.
+
+    A subscriber that reconnects replaces its previous subscription. A
+    subscriber that falls ``max_queue`` frames behind is disconnected, so a
+    slow reader cannot make the server buffer without limit; it reconnects
+    and the publisher falls back to POST in the meantime.
+    """
+
+    def __init__(self, max_queue: int = 256):
+        self.max_queue = max_queue
+        self.subscriptions: Dict[str, Subscription] = {}
+        self.published = 0
+        self.dropped = 0
+        self._next_id = 0
+        self.logger = logging.getLogger(__name__)
+
+    def subscribe(self, key: str) -> Subscription:
+        """Open (or replace) the subscription of ``key``."""
+        previous = self.subscriptions.get(key)
+        if previous is not None:
+            previous.close()
+        subscription = Subscription(key, self.max_queue)
+        self.subscriptions[key] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Forget a subscription once its stream has ended."""
+        subscription.close()
+        if self.subscriptions.get(subscription.key) is subscription:
+            del self.subscriptions[subscription.key]
+
+    def is_subscribed(self, key: str) -> bool:
+        return key in self.subscriptions
+
+    def publish(self, key: str, event: str, data: Dict) -> bool:
+        """
+        Queue an event for one subscriber.
+
+        Returns:
+            False if ``key`` has no live subscription (the caller should POST instead)
+        """
+        subscription = self.subscriptions.get(key)
+        if subscription is None or subscription.closed:
+            return False
+        self._next_id += 1
+        try:
+            subscription.queue.put_nowait(format_sse(event, data, self._next_id))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self.logger.warning(f"Subscriber {key} is {self.max_queue} events behind, disconnecting")
+            self.unsubscribe(subscription)
+            return False
+        self.published += 1
+        return True
+
+    def broadcast(self, event: str, data: Dict, keys: Optional[Iterable[str]] = None) -> int:
+        """Publish to several subscribers (all by default) and return how many got it."""
+        targets = list(self.subscriptions) if keys is None else keys
+        return sum(self.publish(key, event, data) for key in targets)
+
+    async def stream(self, subscription: Subscription, heartbeat_sec: float = 15.0) -> AsyncIterator[bytes]:
+        """Frames of one subscription, with comment heartbeats while idle."""
+        try:
+            yield format_sse("subscribed", {"subscriber": subscription.key})
+            while True:
+                try:
+                    frame = await subscription.next_frame(heartbeat_sec)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
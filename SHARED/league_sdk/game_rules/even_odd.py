@@ -1,13 +1,90 @@
 """Even/Odd game rules implementation."""
 import random
-from typing import Tuple, Optional, Dict
+from dataclasses import dataclass
+from typing import Tuple, Optional, Dict, Sequence, Any
+
+from .rng import RandomProvider, SystemRandomProvider, match_stream_key
+
+try:  # NumPy is optional; batch evaluation falls back to pure Python
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+
+# Winner codes used by the batch API
+WINNER_DRAW = 0
+WINNER_A = 1
+WINNER_B = 2
+
+# Choice codes used by the batch API
+CHOICE_EVEN = 0
+CHOICE_ODD = 1
+
+WINNER_LABELS = {WINNER_DRAW: None, WINNER_A: "PLAYER_A", WINNER_B: "PLAYER_B"}
+CHOICE_LABELS = {CHOICE_EVEN: "even", CHOICE_ODD: "odd"}
+
+
+@dataclass
+class BatchOutcome:
+    """
+    Outcome of many matches evaluated in one call.
+    
+    Arrays are NumPy arrays when NumPy is installed, lists otherwise:
+    choices are codes (0 = even, 1 = odd) and winners are WINNER_* codes.
+    Reasons are only formatted on request via reason().
+    """
+    choices_A: Any
+    choices_B: Any
+    drawn_numbers: Any
+    winners: Any
+    points_A: Any
+    points_B: Any
+    
+    def __len__(self) -> int:
+        return len(self.winners)
+    
+    def winner(self, index: int) -> Optional[str]:
+        """Winner of one match as "PLAYER_A", "PLAYER_B" or None for draw."""
+        return WINNER_LABELS[int(self.winners[index])]
+    
+    def reason(self, index: int) -> str:
+        """Build the human readable reason for one match."""
+        return format_reason(
+            CHOICE_LABELS[int(self.choices_A[index])],
+            CHOICE_LABELS[int(self.choices_B[index])],
+            int(self.drawn_numbers[index]),
+            self.winner(index)
+        )
+
+
+def format_reason(choice_A: str, choice_B: str, drawn_number: int, winner: Optional[str]) -> str:
+    """Format the reason string reported for a match outcome."""
+    if winner is None:
+        return f"Both chose '{choice_A}' - draw"
+    parity = "even" if drawn_number % 2 == 0 else "odd"
+    if winner == "PLAYER_A":
+        return f"Player A chose '{choice_A}', number was {drawn_number} ({parity})"
+    return f"Player B chose '{choice_B}', number was {drawn_number} ({parity})"
 
 
 class EvenOddRules:
     """Game rules for Even/Odd game."""
     
-    def __init__(self):
-        self.rng = random.SystemRandom()  # Cryptographically secure random
+    WIN_POINTS = 3
+    DRAW_POINTS = 1
+    LOSS_POINTS = 0
+    
+    def __init__(self, rng_provider: Optional[RandomProvider] = None):
+        """
+        Initialize the rules.
+        
+        Args:
+            rng_provider: Source of randomness (default: secure SystemRandom).
+                Pass a SeededRandomProvider for reproducible, replayable draws.
+        """
+        self.rng_provider = rng_provider or SystemRandomProvider()
+        self.rng = self.rng_provider.stream()
+        self._batch_rng = None
     
     def validate_choice(self, choice: str) -> Tuple[bool, str]:
         """
@@ -23,9 +100,20 @@ class EvenOddRules:
             return False, f"Invalid choice '{choice}'. Must be 'even' or 'odd' (lowercase)."
         return True, ""
     
-    def draw_number(self) -> int:
-        """Draw a random number between 1 and 10 (inclusive)."""
-        return self.rng.randint(1, 10)
+    def draw_number(self, match_id: Optional[str] = None, league_id: Optional[str] = None) -> int:
+        """
+        Draw a random number between 1 and 10 (inclusive).
+        
+        Args:
+            match_id: Optional match identifier. With a seeded provider the
+                number comes from that match's own stream and can be replayed.
+            league_id: League of the match; part of the stream key, since
+                every league has matches with the same ids
+        """
+        if match_id is None:
+            return self.rng.randint(1, 10)
+        key = match_stream_key(league_id, match_id) if league_id else match_id
+        return self.rng_provider.draw(key, 1, 10)
     
     def determine_parity(self, number: int) -> str:
         """Determine if number is even or odd."""
@@ -50,19 +138,11 @@ class EvenOddRules:
         """
         # Same choice = always draw (regardless of number)
         if choice_A == choice_B:
-            reason = f"Both chose '{choice_A}' - draw"
-            return None, reason
-        
-        # Determine parity
-        parity = self.determine_parity(drawn_number)
+            return None, format_reason(choice_A, choice_B, drawn_number, None)
         
         # Winner is whoever matches parity
-        if choice_A == parity:
-            reason = f"Player A chose '{choice_A}', number was {drawn_number} ({parity})"
-            return "PLAYER_A", reason
-        else:
-            reason = f"Player B chose '{choice_B}', number was {drawn_number} ({parity})"
-            return "PLAYER_B", reason
+        winner = "PLAYER_A" if choice_A == self.determine_parity(drawn_number) else "PLAYER_B"
+        return winner, format_reason(choice_A, choice_B, drawn_number, winner)
     
     def calculate_score(self, winner: Optional[str]) -> Dict[str, int]:
         """
@@ -77,10 +157,116 @@ class EvenOddRules:
         """
         if winner is None:
             # Draw
-            return {"PLAYER_A": 1, "PLAYER_B": 1}
+            return {"PLAYER_A": self.DRAW_POINTS, "PLAYER_B": self.DRAW_POINTS}
         elif winner == "PLAYER_A":
             # Player A wins
-            return {"PLAYER_A": 3, "PLAYER_B": 0}
+            return {"PLAYER_A": self.WIN_POINTS, "PLAYER_B": self.LOSS_POINTS}
         else:
             # Player B wins
-            return {"PLAYER_A": 0, "PLAYER_B": 3}
+            return {"PLAYER_A": self.LOSS_POINTS, "PLAYER_B": self.WIN_POINTS}
+    
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+    
+    def draw_numbers(self, count: int, stream_key: Optional[str] = None) -> Any:
+        """
+        Draw `count` numbers between 1 and 10 (inclusive) in one call.
+        
+        Uses a fast PRNG seeded once from the provider, so large simulations do
+        not pay for a system call per draw. With a seeded provider and a
+        `stream_key` the numbers are reproducible for that key.
+        """
+        if stream_key is not None and self.rng_provider.seed is not None:
+            generator = self._new_batch_rng(self.rng_provider.seed_for(stream_key))
+        else:
+            if self._batch_rng is None:
+                self._batch_rng = self._new_batch_rng(self.rng.getrandbits(128))
+            generator = self._batch_rng
+        if np is not None:
+            return generator.integers(1, 11, size=count, dtype=np.int64)
+        return [generator.randint(1, 10) for _ in range(count)]
+    
+    @staticmethod
+    def _new_batch_rng(seed: int):
+        """Create the batch generator for a seed."""
+        return np.random.default_rng(seed) if np is not None else random.Random(seed)
+    
+    def encode_choices(self, choices: Sequence) -> Any:
+        """
+        Convert parity choices to codes (0 = even, 1 = odd).
+        
+        Accepts "even"/"odd" strings or already encoded 0/1 codes.
+        
+        Raises:
+            ValueError: If any choice is not a valid parity choice
+        """
+        if np is not None:
+            array = np.asarray(choices)
+            if array.dtype.kind in "US":
+                is_odd = array == "odd"
+                if not np.all(is_odd | (array == "even")):
+                    raise ValueError("Invalid choice in batch. Must be 'even' or 'odd' (lowercase).")
+                return is_odd.astype(np.int8)
+            if array.size and not np.all((array == CHOICE_EVEN) | (array == CHOICE_ODD)):
+                raise ValueError("Invalid choice code in batch. Must be 0 (even) or 1 (odd).")
+            return array.astype(np.int8, copy=False)
+        codes = []
+        for choice in choices:
+            if choice in ("even", CHOICE_EVEN):
+                codes.append(CHOICE_EVEN)
+            elif choice in ("odd", CHOICE_ODD):
+                codes.append(CHOICE_ODD)
+            else:
+                raise ValueError(f"Invalid choice '{choice}'. Must be 'even' or 'odd' (lowercase).")
+        return codes
+    
+    def evaluate_batch(
+        self,
+        choices_A: Sequence,
+        choices_B: Sequence,
+        drawn_numbers: Optional[Sequence[int]] = None
+    ) -> BatchOutcome:
+        """
+        Draw numbers, determine winners and score many matches at once.
+        
+        Args:
+            choices_A: Player A choices ("even"/"odd" or 0/1 codes)
+            choices_B: Player B choices, same length as choices_A
+            drawn_numbers: Optional pre-drawn numbers (drawn here if omitted)
+        
+        Returns:
+            BatchOutcome with per-match winners and points
+        """
+        codes_A = self.encode_choices(choices_A)
+        codes_B = self.encode_choices(choices_B)
+        if len(codes_A) != len(codes_B):
+            raise ValueError("choices_A and choices_B must have the same length")
+        if drawn_numbers is None:
+            drawn_numbers = self.draw_numbers(len(codes_A))
+        
+        if np is not None:
+            numbers = np.asarray(drawn_numbers)
+            draw = codes_A == codes_B
+            a_wins = ~draw & (codes_A == (numbers & 1))
+            winners = np.where(draw, WINNER_DRAW, np.where(a_wins, WINNER_A, WINNER_B)).astype(np.int8)
+            points_A = np.where(draw, self.DRAW_POINTS, np.where(a_wins, self.WIN_POINTS, self.LOSS_POINTS))
+            points_B = np.where(draw, self.DRAW_POINTS, np.where(a_wins, self.LOSS_POINTS, self.WIN_POINTS))
+            return BatchOutcome(codes_A, codes_B, numbers, winners, points_A, points_B)
+        
+        numbers = list(drawn_numbers)
+        winners, points_A, points_B = [], [], []
+        for a, b, number in zip(codes_A, codes_B, numbers):
+            if a == b:
+                winners.append(WINNER_DRAW)
+                points_A.append(self.DRAW_POINTS)
+                points_B.append(self.DRAW_POINTS)
+            elif a == number & 1:
+                winners.append(WINNER_A)
+                points_A.append(self.WIN_POINTS)
+                points_B.append(self.LOSS_POINTS)
+            else:
+                winners.append(WINNER_B)
+                points_A.append(self.LOSS_POINTS)
+                points_B.append(self.WIN_POINTS)
+        return BatchOutcome(codes_A, codes_B, numbers, winners, points_A, points_B)
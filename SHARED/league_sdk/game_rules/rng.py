@@ -0,0 +1,124 @@
+"""
+Random number providers for game rules.
+
+The default provider draws from the operating system's secure generator, which
+is unpredictable but cannot be reproduced. The seeded provider derives an
+independent seed per key from a single seed, so draws no longer cost a system
+call each. A single draw for a key (``draw``) comes straight from that key's
+64-bit seed; several draws for a key come from a Mersenne Twister seeded with
+it (``stream``). A match's key is ``"<league_id>:<match_id>"``
+(see ``match_stream_key``): match ids repeat in every league, so a referee
+serving several leagues draws independent numbers for each, and any match can
+be replayed from the seed, its league and its match_id.
+"""
+
+import hashlib
+import random
+from typing import Dict, Optional, Union
+
+
+Seed = Union[int, str]
+
+
+def derive_seed(league_seed: Seed, key: str) -> int:
+    """
+    Derive a 64-bit seed for one stream from the league seed.
+
+    Args:
+        league_seed: League-wide seed
+        key: Stream key (e.g., "league_2025_even_odd:R1M1")
+
+    Returns:
+        Integer seed, stable across processes and Python versions
+    """
+    digest = hashlib.sha256(f"{league_seed}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def match_stream_key(league_id: str, match_id: str) -> str:
+    """Stream key of one match of one league."""
+    return f"{league_id}:{match_id}"
+
+
+class SystemRandomProvider:
+    """Secure, non-reproducible provider backed by random.SystemRandom."""
+
+    name = "system"
+    seed = None
+
+    def __init__(self):
+        self._rng = random.SystemRandom()
+
+    def stream(self, key: Optional[str] = None) -> random.Random:
+        """Return the shared secure generator (keys are ignored)."""
+        return self._rng
+
+    def draw(self, key: str, low: int, high: int) -> int:
+        """Draw an integer in [low, high] (the key is ignored)."""
+        return self._rng.randint(low, high)
+
+
+class SeededRandomProvider:
+    """Reproducible provider with one independent stream per key."""
+
+    name = "seeded"
+
+    def __init__(self, seed: Seed):
+        self.seed = seed
+        self._default: Optional[random.Random] = None
+        # Hash state after "<seed>:", shared by every key (see derive_seed)
+        self._prefix = hashlib.sha256(f"{seed}:".encode("utf-8"))
+
+    def seed_for(self, key: str) -> int:
+        """Seed of the stream for a key; equals ``derive_seed(seed, key)``."""
+        digest = self._prefix.copy()
+        digest.update(key.encode("utf-8"))
+        return int.from_bytes(digest.digest()[:8], "big")
+
+    def draw(self, key: str, low: int, high: int) -> int:
+        """
+        Draw an integer in [low, high] for a key, the same on every call.
+
+        Taken from the key's 64-bit seed instead of a generator seeded with it,
+        which costs far more than the hash. The modulo bias is below
+        (high - low + 1) / 2**64.
+        """
+        return low + self.seed_for(key) % (high - low + 1)
+
+    def stream(self, key: Optional[str] = None) -> random.Random:
+        """
+        Return the stream for a key.
+
+        Each call with a key starts that key's stream from the beginning, so the
+        first draw for a match is always the same. Without a key a single
+        long-lived default stream is returned.
+        """
+        if key is None:
+            if self._default is None:
+                self._default = random.Random(self.seed_for("default"))
+            return self._default
+        return random.Random(self.seed_for(key))
+
+
+RandomProvider = Union[SystemRandomProvider, SeededRandomProvider]
+
+
+def create_rng_provider(seed: Optional[Seed] = None) -> RandomProvider:
+    """Create the seeded provider when a seed is given, else the secure default."""
+    if seed is None:
+        return SystemRandomProvider()
+    return SeededRandomProvider(seed)
+
+
+def replay_draw(seed: Seed, league_id: str, match_id: str) -> int:
+    """Rebuild the number drawn for a match of a league by a seeded referee."""
+    return SeededRandomProvider(seed).draw(match_stream_key(league_id, match_id), 1, 10)
+
+
+def replay_draws(seed: Seed, league_id: str, match_ids) -> Dict[str, int]:
+    """Rebuild the drawn numbers for several matches of one league."""
+    provider = SeededRandomProvider(seed)
+    return {
+        match_id: provider.draw(match_stream_key(league_id, match_id), 1, 10)
+        for match_id in match_ids
+    }
@@ -0,0 +1,65 @@
+"""
+Hedged requests: a second copy of a slow call, first answer wins.
+
+With a HedgePolicy, MCPClient sends a call to a hedged tool as usual. If no
+answer has arrived by the ``percentile`` of that tool's recent latencies, it
+sends one duplicate over a second connection (HTTP even when the client uses
+WebSocket). The first copy to answer is returned and the other is cancelled.
+A failed copy is not an answer: the other one is still awaited.
+
+Both copies carry the same request id and idempotency key, so the server
+runs the tool once (see ``idempotency``). Only idempotent tools should be
+hedged. ``start_match`` is not one: a referee runs the match even after the
+league manager has stopped waiting, so a duplicate sent to another referee
+would play the match twice.
+
+Until ``min_samples`` latencies of a tool have been seen, its calls are not
+hedged. Loopback calls never are: they do not cross the network.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+# Tools whose handlers give the same answer when called twice with one key
+DEFAULT_HEDGED_TOOLS = ("choose_parity",)
+
+
+class HedgePolicy:
+    """Which tools are hedged, and after how long."""
+
+    def __init__(self, tools: Iterable[str] = DEFAULT_HEDGED_TOOLS, percentile: float = 95.0,
+                 window: int = 256, min_samples: int = 20, min_delay_sec: float = 0.005):
+        """
+        Args:
+            tools: Tool names to hedge
+            percentile: Latency percentile (of the last ``window`` calls) after
+                which the duplicate is sent
+            window: Recent latencies kept per tool
+            min_samples: Latencies needed before a tool is hedged
+            min_delay_sec: Shortest wait before hedging
+        """
+        self.tools = frozenset(tools)
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay_sec = min_delay_sec
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def applies(self, tool_name: str) -> bool:
+        return tool_name in self.tools
+
+    def observe(self, tool_name: str, seconds: float) -> None:
+        """Record the latency of an answered call."""
+        latencies = self._latencies.get(tool_name)
+        if latencies is None:
+            latencies = self._latencies[tool_name] = deque(maxlen=self.window)
+        latencies.append(seconds)
+
+    def delay(self, tool_name: str) -> Optional[float]:
+        """Seconds to wait before hedging a call, or None to not hedge it."""
+        latencies = self._latencies.get(tool_name)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay_sec, ordered[index])
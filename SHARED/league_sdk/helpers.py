@@ -1,10 +1,11 @@
 """Helper utility functions."""
+import json
 import uuid
 import logging
 import hashlib
 import secrets
 from datetime import datetime, timezone
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Dict, Tuple, Optional
 from pathlib import Path
 
 
@@ -22,6 +23,7 @@ ERROR_CODES = {
     "E012": "AUTH_TOKEN_INVALID",
     "E013": "REFEREE_NOT_REGISTERED",
     "E018": "PROTOCOL_VERSION_MISMATCH",
+    "E019": "LEAGUE_NOT_FOUND",
     "E021": "INVALID_TIMESTAMP",
 }
 
@@ -60,6 +62,25 @@ def create_match_id(round_id: int, match_num: int) -> str:
     return f"R{round_id}M{match_num}"
 
 
+# ============================================================================
+# MCP Tool Results
+# ============================================================================
+
+def tool_result(response: Dict) -> Dict:
+    """
+    Extract the JSON payload from an MCP tool result.
+    
+    A result without content is returned as is; one that cannot be parsed
+    gives an empty dict.
+    """
+    try:
+        if 'content' in response and len(response['content']) > 0:
+            return json.loads(response['content'][0].get('text', '{}'))
+    except (TypeError, ValueError):
+        return {}
+    return response if isinstance(response, dict) else {}
+
+
 # ============================================================================
 # Authentication and Validation
 # ============================================================================
@@ -103,17 +124,22 @@ def validate_parity_choice(choice: str) -> bool:
     return choice in ["even", "odd"]
 
 
-def generate_round_robin_schedule(player_ids: List[str]) -> List[Tuple[str, str, int, int]]:
+def generate_round_robin_schedule(
+    player_ids: List[str],
+    max_rounds: Optional[int] = None
+) -> List[Tuple[str, str, int, int]]:
     """
     Generate round-robin schedule for players.
+    Optionally stop after `max_rounds` rounds (partial round robin).
     Returns: List of (player_A_id, player_B_id, round_id, match_num)
     """
     n = len(player_ids)
     matches = []
     match_counter = 1
+    last_round = n - 1 if max_rounds is None else min(n - 1, max_rounds)
     
     # Round-robin algorithm
-    for round_id in range(1, n):
+    for round_id in range(1, last_round + 1):
         for i in range(n // 2):
             j = n - 1 - i
             if i != j:  # Skip self-matches
@@ -151,14 +177,16 @@ def calculate_standings(results: Dict[str, Dict]) -> List[Dict]:
     # Calculate statistics
     for match_id, result in results.items():
         winner = result.get('winner')
+        # Players that missed a deadline lose even when nobody won
+        technical_loss = result.get('details', {}).get('technical_loss', ())
         for player_id, points in result['score'].items():
             stats[player_id]['played'] += 1
             stats[player_id]['points'] += points
             
-            if winner is None:  # Draw
-                stats[player_id]['draws'] += 1
-            elif winner == player_id:  # Win
+            if winner == player_id:  # Win
                 stats[player_id]['wins'] += 1
+            elif winner is None and player_id not in technical_loss:  # Draw
+                stats[player_id]['draws'] += 1
             else:  # Loss
                 stats[player_id]['losses'] += 1
     
@@ -175,6 +203,59 @@ def calculate_standings(results: Dict[str, Dict]) -> List[Dict]:
     return standings
 
 
+def technical_loss_result(
+    player_A_id: str,
+    player_B_id: str,
+    missed: Iterable[str],
+    choices: Optional[Dict[str, Optional[str]]] = None
+) -> Dict:
+    """
+    Result of a match decided by a missed deadline (protocol: timeout = technical loss).
+    
+    The player that answered wins with 3 points and the player that missed
+    the join or move deadline (or is known to be down) gets 0; if both
+    missed, neither wins or scores. No number is drawn.
+    
+    Args:
+        player_A_id: First player ID
+        player_B_id: Second player ID
+        missed: Players that did not answer in time
+        choices: Parity choices received so far (None for missing ones)
+    
+    Returns:
+        Result in the execute_match format, with details['technical_loss']
+        listing the players that lost technically
+    """
+    missed = sorted(set(missed))
+    if len(missed) == 1:
+        winner = player_B_id if missed[0] == player_A_id else player_A_id
+        outcome = "PLAYER_A_WIN" if winner == player_A_id else "PLAYER_B_WIN"
+    else:
+        winner = None
+        outcome = "TECHNICAL_LOSS"
+    
+    result = {
+        "winner": winner,
+        "score": {
+            player_A_id: 3 if winner == player_A_id else 0,
+            player_B_id: 3 if winner == player_B_id else 0
+        },
+        "details": {
+            "drawn_number": None,
+            "parity": None,
+            "outcome": outcome,
+            "reason": f"{' and '.join(missed)} missed the response deadline (technical loss)",
+            "choices": dict(choices or {}),
+            "technical_loss": missed
+        }
+    }
+    
+    logging.info(f"Match decided by technical loss: {player_A_id} vs {player_B_id} "
+                 f"-> Missed: {missed} -> Winner: {winner or 'NONE'}")
+    
+    return result
+
+
 def determine_parity(number: int) -> str:
     """Determine if number is even or odd."""
     return "even" if number % 2 == 0 else "odd"
@@ -0,0 +1,108 @@
+"""
+Idempotency keys: a request delivered twice is handled once.
+
+MCPClient puts ``params._meta.idempotency_key`` (its client id and the
+request id) on every call over the network; retries and hedged copies of a
+call reuse it. MCPServer keys requests by caller (the message's ``sender``)
+and that key. For tools registered with ``dedupe=True`` a request without a
+key is keyed by caller, tool and ``conversation_id`` instead, so a client
+that retries with the same message is covered too.
+
+The server runs the first request with a given key and hands every
+duplicate the same response: one still in flight shares the running handler,
+and one arriving later gets the stored response while it is fresh (LRU,
+bounded in size and age). Handlers therefore never see a retried
+registration or result report twice.
+
+Only successful responses are kept; a request answered with a JSON-RPC error
+(e.g., deadline exceeded) can be tried again under the same key.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import AbstractSet, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def request_key(payload, conversation_tools: AbstractSet[str] = frozenset()) -> Optional[str]:
+    """
+    Deduplication key of a JSON-RPC request, or None if it is always handled.
+
+    Args:
+        payload: Decoded JSON-RPC request
+        conversation_tools: Tools whose requests without an idempotency key
+            are keyed by their conversation_id
+    """
+    if not isinstance(payload, dict):
+        return None
+    params = payload.get("params")
+    if not isinstance(params, dict):
+        return None
+    arguments = params.get("arguments")
+    if not isinstance(arguments, dict):
+        arguments = {}
+    caller = arguments.get("sender") or ""
+    meta = params.get("_meta")
+    key = meta.get("idempotency_key") if isinstance(meta, dict) else None
+    if isinstance(key, str) and key:
+        return f"{caller}|{key}"
+    tool = params.get("name")
+    conversation_id = arguments.get("conversation_id")
+    if tool in conversation_tools and conversation_id:
+        return f"{caller}|{tool}|{conversation_id}"
+    return None
+
+
+def inject(params: Dict, key: str) -> None:
+    """Carry ``key`` in a JSON-RPC request's params."""
+    params.setdefault("_meta", {})["idempotency_key"] = key
+
+
+class ResponseCache:
+    """Recent responses by idempotency key; bounded in size and age."""
+
+    def __init__(self, max_entries: int = 4096, ttl_sec: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(1, max_entries)
+        self.ttl_sec = ttl_sec
+        self.clock = clock
+        # key -> (task producing the response, expiry once done)
+        self._entries: "OrderedDict[str, Tuple[asyncio.Future, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def run(self, key: str, execute: Callable[[], Awaitable[Dict]]) -> Tuple[Dict, bool]:
+        """
+        Response for ``key``, running ``execute`` only for its first request.
+
+        Returns:
+            (response, True if it was produced for an earlier request)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            task, expires = entry
+            if not task.done() or self.clock() < expires:
+                self._entries.move_to_end(key)
+                # shield: a duplicate that gives up must not cancel the original
+                return await asyncio.shield(task), True
+            del self._entries[key]
+        task = asyncio.ensure_future(execute())
+        self._entries[key] = (task, float("inf"))
+        self._evict()
+        task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task), False
+
+    def _finished(self, key: str, task: asyncio.Future) -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not task:
+            return
+        failed = task.cancelled() or task.exception() is not None or "error" in task.result()
+        if failed:
+            del self._entries[key]
+        else:
+            self._entries[key] = (task, self.clock() + self.ttl_sec)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,189 @@
+"""
+Event-loop lag and blocking-call detector.
+
+A LoopMonitor runs two probes in an agent process:
+
+  - a sampler task on the event loop sleeps ``interval_sec`` at a time and
+    records how late it wakes up (scheduling lag);
+  - a watchdog thread notices when the sampler is overdue by more than
+    ``block_threshold_sec`` and captures the loop thread's stack while the
+    blocking code is still running.
+
+When the loop comes back, the block is counted and logged (with the captured
+stack) to the standard logger and to ``<log root>/agents/loop_monitor_<service>.log.jsonl``.
+Metrics go to the process registry served on /metrics:
+
+  event_loop_lag_seconds{service}        histogram of sampler wake-up lag
+  event_loop_blocked_total{service}      blocks longer than the threshold
+  event_loop_blocked_seconds{service}    histogram of block durations
+
+MCPServer starts the monitor when its app starts (one per process). Set
+``LEAGUE_LOOP_MONITOR=0`` to disable it and ``LEAGUE_LOOP_BLOCK_MS`` to change
+the threshold (default 100 ms).
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from .metrics import MetricsRegistry, registry as default_registry
+
+MONITOR_ENV = "LEAGUE_LOOP_MONITOR"
+BLOCK_MS_ENV = "LEAGUE_LOOP_BLOCK_MS"
+
+
+class LoopMonitor:
+    """Sample event-loop lag and report calls that block the loop."""
+
+    def __init__(
+        self,
+        service: str,
+        interval_sec: float = 0.05,
+        block_threshold_sec: float = 0.1,
+        stack_depth: int = 12,
+        log_interval_sec: float = 1.0,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            service: Label of this process in metrics and logs
+            interval_sec: Sampler period
+            block_threshold_sec: Lag that counts as a blocked loop
+            stack_depth: Innermost frames kept from a blocked loop's stack
+            log_interval_sec: At most one block is logged per interval (all are counted)
+            metrics_registry: Registry to record into (defaults to the process registry)
+        """
+        self.service = service
+        self.interval_sec = interval_sec
+        self.block_threshold_sec = block_threshold_sec
+        self.stack_depth = stack_depth
+        self.log_interval_sec = log_interval_sec
+        metrics = default_registry if metrics_registry is None else metrics_registry
+        self.lag = metrics.histogram(
+            "event_loop_lag_seconds", "Event-loop scheduling lag", ("service",)).labels(service)
+        self.blocked = metrics.counter(
+            "event_loop_blocked_total", "Event-loop blocks longer than the threshold",
+            ("service",)).labels(service)
+        self.blocked_duration = metrics.histogram(
+            "event_loop_blocked_seconds", "Duration of event-loop blocks", ("service",)).labels(service)
+        self.logger = logging.getLogger(__name__)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._json_logger = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._next_wake = 0.0
+        self._block_stack: Optional[List[str]] = None
+        self._last_log = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling the running event loop (call from a coroutine)."""
+        if self.running:
+            return
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._next_wake = time.perf_counter() + self.interval_sec
+        self._stopped.clear()
+        self._task = self.loop.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name=f"loop-monitor-{self.service}",
+                                          daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    def summary(self) -> Dict:
+        """Lag percentiles and block counts so far."""
+        return {
+            "lag_p50_ms": round(self.lag.percentile(0.50) * 1000, 3),
+            "lag_p99_ms": round(self.lag.percentile(0.99) * 1000, 3),
+            "lag_max_ms": round(self.lag.max * 1000, 3),
+            "blocked": int(self.blocked.value),
+            "blocked_max_ms": round(self.blocked_duration.max * 1000, 3),
+        }
+
+    async def _sample(self) -> None:
+        while True:
+            self._next_wake = time.perf_counter() + self.interval_sec
+            await asyncio.sleep(self.interval_sec)
+            lag = max(0.0, time.perf_counter() - self._next_wake)
+            self.lag.observe(lag)
+            if lag >= self.block_threshold_sec:
+                self._report_block(lag)
+
+    def _watch(self) -> None:
+        """Watchdog thread: grab the loop thread's stack while it is blocked."""
+        poll = max(0.005, self.block_threshold_sec / 2)
+        while not self._stopped.wait(poll):
+            if self._block_stack is not None:
+                continue
+            if time.perf_counter() - self._next_wake < self.block_threshold_sec:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._block_stack = self._callback_stack(frame)
+
+    def _callback_stack(self, frame) -> List[str]:
+        """Stack of the running callback, without the event loop's own frames."""
+        summary = traceback.extract_stack(frame)
+        start = 0
+        for index, entry in enumerate(summary):
+            if entry.filename.endswith(os.path.join("asyncio", "events.py")):
+                start = index + 1
+        return traceback.format_list(summary[start:][-self.stack_depth:])
+
+    def _report_block(self, duration: float) -> None:
+        stack, self._block_stack = self._block_stack, None
+        self.blocked.inc()
+        self.blocked_duration.observe(duration)
+        now = time.monotonic()
+        if now - self._last_log < self.log_interval_sec:
+            return
+        self._last_log = now
+        frames = [line.rstrip() for line in stack] if stack else []
+        self.logger.warning(
+            f"Event loop blocked for {duration * 1000:.1f} ms"
+            + ("\n" + "\n".join(frames) if frames else " (stack not captured)")
+        )
+        if self._json_logger is None:
+            from .logger import JsonLogger
+            self._json_logger = JsonLogger(f"loop_monitor:{self.service}")
+        self._json_logger.warning("EVENT_LOOP_BLOCKED", service=self.service,
+                                  blocked_ms=round(duration * 1000, 3), stack=frames)
+
+
+_monitor: Optional[LoopMonitor] = None
+
+
+def start_loop_monitor(service: str, **options) -> Optional[LoopMonitor]:
+    """
+    Start the process's LoopMonitor on the running loop (once per loop).
+
+    Returns:
+        The monitor, or None if disabled with LEAGUE_LOOP_MONITOR=0
+    """
+    global _monitor
+    if os.environ.get(MONITOR_ENV, "1") == "0":
+        return None
+    loop = asyncio.get_running_loop()
+    if _monitor is not None and _monitor.running and _monitor.loop is loop:
+        return _monitor
+    if _monitor is not None:
+        _monitor.stop()
+    if BLOCK_MS_ENV in os.environ and "block_threshold_sec" not in options:
+        options["block_threshold_sec"] = float(os.environ[BLOCK_MS_ENV]) / 1000
+    _monitor = LoopMonitor(service, **options)
+    _monitor.start()
+    return _monitor
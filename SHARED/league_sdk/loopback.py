@@ -0,0 +1,58 @@
+"""
+In-process loopback transport for agents sharing one interpreter.
+
+An MCPServer registers under its endpoint URL with ``register_loopback``;
+MCPClient then delivers calls to that endpoint straight to the server's
+JSON-RPC dispatch instead of encoding JSON and going through the socket stack:
+
+    server.register_loopback("http://localhost:8101/mcp")
+    await client.call_tool("http://localhost:8101/mcp", "choose_parity", args)
+
+Requests are copied before dispatch, so a handler never shares (or mutates)
+the caller's objects. Responses need no copy: tool results are already
+serialized into the ``content`` text by the dispatch. Errors surface exactly
+as over HTTP: JSON-RPC errors raise from ``call_tool`` and a call that
+outlives the client timeout raises ``httpx.ReadTimeout``.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+Dispatch = Callable[[Dict], Awaitable[Dict]]
+
+
+def copy_message(value: Any) -> Any:
+    """Copy a JSON-compatible value (containers are copied, scalars shared)."""
+    if isinstance(value, dict):
+        return {key: copy_message(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [copy_message(item) for item in value]
+    return value
+
+
+class LoopbackRegistry:
+    """Endpoints served in this process, mapped to their JSON-RPC dispatch."""
+
+    def __init__(self):
+        self.endpoints: Dict[str, Dispatch] = {}
+        self.calls = 0
+
+    def register(self, endpoint: str, dispatch: Dispatch) -> None:
+        """Serve ``endpoint`` in-process (replaces an earlier registration)."""
+        self.endpoints[endpoint.rstrip("/")] = dispatch
+
+    def unregister(self, endpoint: str) -> None:
+        """Send calls to ``endpoint`` over the network again."""
+        self.endpoints.pop(endpoint.rstrip("/"), None)
+
+    def lookup(self, endpoint: str) -> Optional[Dispatch]:
+        """Dispatch of an in-process endpoint, or None if it is remote."""
+        return self.endpoints.get(endpoint.rstrip("/"))
+
+    async def send(self, dispatch: Dispatch, payload: Dict) -> Dict:
+        """Deliver a copy of one JSON-RPC request and return the response."""
+        self.calls += 1
+        return await dispatch(copy_message(payload))
+
+
+# Process-wide registry used by MCPServer and MCPClient unless given another
+registry = LoopbackRegistry()
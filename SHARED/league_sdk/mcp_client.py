@@ -1,16 +1,76 @@
 """MCP Client for making tool calls to other agents."""
+import asyncio
 import httpx
+import itertools
 import logging
 import json
-from typing import Dict, Any, Optional
+import os
+import time
+from typing import AsyncIterator, Callable, Dict, Any, Optional, Tuple
+from .event_stream import parse_sse
+from .ws_transport import ConnectionLost, WebSocketPool
+from .unix_socket import is_unix_endpoint, split_unix_endpoint
+from . import loopback
+from .metrics import MCPMetrics, mcp_metrics
+from .tracing import tracer
+from .config_models import TimeoutsConfig
+from . import deadlines
+from .circuit_breaker import CircuitOpenError, HealthTracker, backoff_delay
+from .hedging import HedgePolicy
+from . import idempotency
 
 
 class MCPClient:
     """Client for calling MCP tools on remote servers."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_connections: Optional[int] = None,
+                 transport: str = "http",
+                 loopback_registry: Optional[loopback.LoopbackRegistry] = None,
+                 metrics: Optional[MCPMetrics] = None,
+                 timeouts: Optional[TimeoutsConfig] = None,
+                 health: Optional[HealthTracker] = None,
+                 max_retry_delay: float = 30.0,
+                 hedging: Optional[HedgePolicy] = None):
+        """
+        Args:
+            timeout: Request timeout in seconds (tools without a profile in
+                ``timeouts``, and event streams)
+            max_connections: Optional connection pool size (shared by every caller)
+            transport: "http", or "websocket" for one persistent connection per
+                peer (falls back to HTTP where WebSocket is unavailable)
+            loopback_registry: In-process endpoints called without the network
+                (defaults to the process-wide registry)
+            metrics: Metrics to record per-endpoint latency, errors and retries in
+                (defaults to the process-wide metrics)
+            timeouts: Per-tool timeout profile from system.json; each call's
+                deadline is sent with the request (see ``deadlines``)
+            health: Per-endpoint circuit breakers (defaults to a tracker with
+                3-failure threshold exporting to ``metrics``)
+            max_retry_delay: Longest backoff between retries, in seconds
+            hedging: Send a duplicate of slow calls to these tools (off by
+                default, see ``hedging``)
+        """
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.timeouts = timeouts
+        self.transport = transport
+        self.loopback = loopback_registry if loopback_registry is not None else loopback.registry
+        self.metrics = mcp_metrics if metrics is None else metrics
+        self.health = health if health is not None else HealthTracker(metrics=self.metrics)
+        self.max_retry_delay = max_retry_delay
+        self.hedging = hedging
+        # Request ids are unique per client; with client_id they key idempotent calls
+        self.client_id = os.urandom(6).hex()
+        self._request_ids = itertools.count(1)
+        self.ws_pool = WebSocketPool(timeout) if transport == "websocket" else None
+        client_kwargs = {"timeout": timeout}
+        if max_connections:
+            client_kwargs["limits"] = httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            )
+        self.client = httpx.AsyncClient(**client_kwargs)
+        # One client per Unix socket for unix:// endpoints (same timeout and limits)
+        self._client_kwargs = client_kwargs
+        self._unix_clients: Dict[str, httpx.AsyncClient] = {}
         self.logger = logging.getLogger(__name__)
     
     async def call_tool(
@@ -23,6 +83,13 @@ class MCPClient:
         """
         Call a tool on a remote MCP server.
         
+        The call's deadline is the tool's timeout, capped by the deadline of
+        the request being handled and by a ``deadline`` in the arguments. It
+        travels as ``params._meta.deadline``; a call whose deadline has
+        already passed raises httpx.ReadTimeout without being sent. A call to
+        an endpoint whose circuit breaker is open raises CircuitOpenError
+        without being sent.
+        
         Args:
             endpoint: Full URL to MCP endpoint (e.g., http://localhost:8101/mcp)
             tool_name: Name of the tool to call
@@ -33,8 +100,7 @@ class MCPClient:
             Tool result
         """
         if request_id is None:
-            import random
-            request_id = random.randint(1, 1000000)
+            request_id = next(self._request_ids)
         
         payload = {
             "jsonrpc": "2.0",
@@ -46,32 +112,189 @@ class MCPClient:
             "id": request_id
         }
         
+        # Join the caller's trace: the server continues it under this span
+        parent = tracer.current()
+        span = None
+        if parent is not None:
+            span = tracer.start_span(tool_name, "client", parent, endpoint=endpoint,
+                                     match_id=arguments.get("match_id"))
+            tracer.inject(payload["params"], span)
+        
+        deadline = deadlines.call_deadline(self.timeout_for(tool_name), arguments)
+        if deadline is not None:
+            deadlines.inject(payload["params"], deadline)
+        
+        remote = self.loopback.lookup(endpoint) is None
+        hedged = remote and self.hedging is not None and self.hedging.applies(tool_name)
+        if remote:
+            # Retries and hedged copies carry the same key; the server runs the call once
+            idempotency.inject(payload["params"], f"{self.client_id}-{request_id}")
+        
+        verbose = self.logger.isEnabledFor(logging.INFO)
+        in_flight = self.metrics.call_in_flight.labels(endpoint)
+        in_flight.inc()
+        start = time.perf_counter()
+        error_code = None
         try:
             self.logger.debug(f"Calling {tool_name} on {endpoint}")
             
             # Log outgoing JSON message
-            self.logger.info(f"[SEND → {endpoint}] {json.dumps(payload, indent=2)}")
-            
-            response = await self.client.post(endpoint, json=payload)
-            response.raise_for_status()
+            if verbose:
+                self.logger.info(f"[SEND → {endpoint}] {json.dumps(payload, indent=2)}")
             
-            result = response.json()
+            remaining = None
+            if deadline is not None:
+                remaining = deadlines.remaining(deadline)
+                if remaining <= 0:
+                    raise httpx.ReadTimeout(f"Deadline passed before calling {tool_name} on {endpoint}")
+            if hedged:
+                result = await self._send_hedged(endpoint, tool_name, payload, remaining)
+            else:
+                result = await self._send_guarded(endpoint, payload, remaining)
             
             # Log incoming JSON response
-            self.logger.info(f"[RECV ← {endpoint}] {json.dumps(result, indent=2)}")
+            if verbose:
+                self.logger.info(f"[RECV ← {endpoint}] {json.dumps(result, indent=2)}")
             
             if "error" in result:
                 self.logger.error(f"Tool call error: {result['error']}")
+                error_code = str(result["error"].get("code"))
                 raise Exception(f"Tool call failed: {result['error']}")
             
             return result.get("result", {})
         
         except httpx.TimeoutException:
             self.logger.error(f"Timeout calling {tool_name} on {endpoint}")
+            error_code = "timeout"
             raise
         except Exception as e:
             self.logger.error(f"Error calling {tool_name}: {e}")
+            error_code = error_code or self._error_code(e)
             raise
+        finally:
+            in_flight.dec()
+            self.metrics.call_latency.labels(endpoint).observe(time.perf_counter() - start)
+            if error_code is not None:
+                self.metrics.call_errors.labels(endpoint, error_code).inc()
+            if span is not None:
+                span.end(error_code)
+    
+    def timeout_for(self, tool_name: str) -> Optional[float]:
+        """Seconds a call to ``tool_name`` may take (None = no limit)."""
+        if self.timeouts is not None:
+            return self.timeouts.for_tool(tool_name)
+        return self.timeout
+    
+    @staticmethod
+    def _error_code(error: Exception) -> str:
+        """Metrics label of a failed call."""
+        if isinstance(error, CircuitOpenError):
+            return "circuit_open"
+        if isinstance(error, httpx.ConnectError):
+            return "connect"
+        if isinstance(error, httpx.HTTPStatusError):
+            return f"http_{error.response.status_code}"
+        return type(error).__name__
+    
+    async def _send_hedged(self, endpoint: str, tool_name: str, payload: Dict[str, Any],
+                           timeout: Optional[float] = None) -> Dict[str, Any]:
+        """_send_guarded, plus a duplicate on a second connection if the first is slow."""
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._send_guarded(endpoint, payload, timeout))
+        copies = [primary]
+        try:
+            delay = self.hedging.delay(tool_name)
+            if delay is not None and (timeout is None or delay < timeout):
+                done, _ = await asyncio.wait(copies, timeout=delay)
+                if not done:
+                    self.metrics.call_hedges.labels(tool_name).inc()
+                    remaining = None if timeout is None else timeout - delay
+                    copies.append(asyncio.ensure_future(
+                        self._send_guarded(endpoint, payload, remaining, second_connection=True)))
+            pending = set(copies)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        # First answer wins; a failed copy is not an answer
+                        if task is not primary:
+                            self.metrics.hedge_wins.labels(tool_name).inc()
+                        self.hedging.observe(tool_name, time.perf_counter() - start)
+                        return task.result()
+            # Every copy failed: report the primary's error
+            raise primary.exception()
+        finally:
+            for task in copies:
+                task.cancel()
+    
+    async def _send_guarded(self, endpoint: str, payload: Dict[str, Any],
+                            timeout: Optional[float] = None,
+                            second_connection: bool = False) -> Dict[str, Any]:
+        """_send through the endpoint's circuit breaker, recording the outcome."""
+        self.health.acquire(endpoint)
+        try:
+            result = await self._send(endpoint, payload, timeout, second_connection)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                self.health.record_failure(endpoint, self._error_code(e))
+            else:
+                self.health.record_success(endpoint)
+            raise
+        except httpx.TransportError as e:
+            self.health.record_failure(endpoint, self._error_code(e))
+            raise
+        finally:
+            # Cancelled or undecodable: neither outcome, but free the probe
+            self.health.release(endpoint)
+        self.health.record_success(endpoint)
+        return result
+    
+    async def _send(self, endpoint: str, payload: Dict[str, Any],
+                    timeout: Optional[float] = None,
+                    second_connection: bool = False) -> Dict[str, Any]:
+        """Deliver one JSON-RPC request and return the decoded response.
+        
+        ``timeout`` overrides the client's timeout for this request.
+        ``second_connection`` sends over HTTP even when a WebSocket to the
+        peer is open (hedged duplicates must not queue behind the original).
+        """
+        limit = self.timeout if timeout is None else timeout
+        dispatch = self.loopback.lookup(endpoint)
+        if dispatch is not None:
+            # Same process: no JSON encoding, no sockets, same timeout error
+            try:
+                return await asyncio.wait_for(self.loopback.send(dispatch, payload), limit)
+            except asyncio.TimeoutError:
+                raise httpx.ReadTimeout(f"Loopback request to {endpoint} timed out")
+        connection = await self.ws_pool.get(endpoint) if self.ws_pool and not second_connection else None
+        if connection is not None:
+            # Keep the HTTP error types so callers and retries behave the same
+            try:
+                return await connection.request(payload, limit)
+            except asyncio.TimeoutError:
+                raise httpx.ReadTimeout(f"WebSocket request to {endpoint} timed out")
+            except ConnectionLost as e:
+                raise httpx.ConnectError(str(e))
+        client, url = self._http_target(endpoint)
+        if timeout is None:
+            response = await client.post(url, json=payload)
+        else:
+            response = await client.post(url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    def _http_target(self, endpoint: str) -> Tuple[httpx.AsyncClient, str]:
+        """HTTP client and URL for an endpoint; unix:// endpoints use their socket."""
+        if not is_unix_endpoint(endpoint):
+            return self.client, endpoint
+        socket_path, url = split_unix_endpoint(endpoint)
+        client = self._unix_clients.get(socket_path)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=socket_path), **self._client_kwargs
+            )
+            self._unix_clients[socket_path] = client
+        return client, url
     
     async def call_tool_with_retry(
         self,
@@ -79,50 +302,66 @@ class MCPClient:
         tool_name: str,
         arguments: Dict[str, Any],
         max_retries: int = 3,
-        retry_delay: float = 2.0
+        retry_delay: float = 2.0,
+        call: Optional[Callable[..., Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Call tool with retry on retryable errors.
         
         Per League Protocol V2 spec (section 2.9.4):
         - Maximum retries: 3
-        - Delay between retries: 2 seconds
+        - Delay between retries: 2 seconds, doubled per attempt with jitter
+          (up to max_retry_delay)
         - Retryable errors: E001 (timeout), E009 (connection)
         
+        No retry is started once the current request's deadline has passed,
+        and none is made while the endpoint's circuit breaker is open. Every
+        attempt has the same request id, so the server handles the call once
+        even if an attempt that timed out did reach it.
+        
         Args:
             endpoint: MCP endpoint URL
             tool_name: Name of tool to call
             arguments: Tool arguments
             max_retries: Maximum number of retries (default: 3)
-            retry_delay: Delay in seconds between retries (default: 2.0)
+            retry_delay: Base delay in seconds before the first retry (default: 2.0)
+            call: Makes one attempt, with call_tool's signature (default:
+                call_tool); wrappers pass their own to act per attempt
         
         Returns:
             Tool result or None if all retries exhausted
         """
-        import asyncio
-        
+        call = call or self.call_tool
+        request_id = next(self._request_ids)
         for attempt in range(max_retries + 1):
+            delay = backoff_delay(attempt, retry_delay, self.max_retry_delay)
             try:
-                return await self.call_tool(endpoint, tool_name, arguments)
+                return await call(endpoint, tool_name, arguments, request_id)
+            except CircuitOpenError as e:
+                # Known down: fail fast instead of waiting out more timeouts
+                self.logger.warning(f"Not calling {tool_name}: {e}")
+                return None
             except httpx.TimeoutException as e:
                 # E001: TIMEOUT_ERROR - retryable
-                if attempt < max_retries:
+                if attempt < max_retries and self._can_retry(delay):
                     self.logger.warning(
                         f"Timeout on {tool_name} (attempt {attempt + 1}/{max_retries + 1}). "
-                        f"Retrying in {retry_delay}s..."
+                        f"Retrying in {delay:.1f}s..."
                     )
-                    await asyncio.sleep(retry_delay)
+                    self.metrics.call_retries.labels(tool_name).inc()
+                    await asyncio.sleep(delay)
                     continue
                 self.logger.error(f"Timeout: All {max_retries} retries exhausted for {tool_name}")
                 return None
             except httpx.ConnectError as e:
                 # E009: CONNECTION_ERROR - retryable
-                if attempt < max_retries:
+                if attempt < max_retries and self._can_retry(delay):
                     self.logger.warning(
                         f"Connection error on {tool_name} (attempt {attempt + 1}/{max_retries + 1}). "
-                        f"Retrying in {retry_delay}s..."
+                        f"Retrying in {delay:.1f}s..."
                     )
-                    await asyncio.sleep(retry_delay)
+                    self.metrics.call_retries.labels(tool_name).inc()
+                    await asyncio.sleep(delay)
                     continue
                 self.logger.error(f"Connection error: All {max_retries} retries exhausted for {tool_name}")
                 return None
@@ -131,6 +370,83 @@ class MCPClient:
                 self.logger.error(f"Non-retryable error on {tool_name}: {e}")
                 return None
     
+    @staticmethod
+    def _can_retry(retry_delay: float) -> bool:
+        """True unless the current deadline passes before the next attempt."""
+        deadline = deadlines.current()
+        return deadline is None or deadlines.remaining(deadline) > retry_delay
+    
+    @staticmethod
+    def events_endpoint(mcp_endpoint: str) -> str:
+        """Subscription URL of an MCP endpoint (http://host:8000/mcp -> .../mcp/events)."""
+        return f"{mcp_endpoint.rstrip('/')}/events"
+    
+    async def subscribe(
+        self,
+        events_url: str,
+        sender: str,
+        auth_token: str,
+        league_id: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (event, data) pairs pushed by a server until the stream ends.
+        
+        Args:
+            events_url: Subscription URL (see events_endpoint)
+            sender: Subscriber identity (e.g., "player:P01")
+            auth_token: Token issued at registration
+            league_id: League the subscription belongs to
+        """
+        params = {"sender": sender}
+        if league_id:
+            params["league_id"] = league_id
+        headers = {"Authorization": f"Bearer {auth_token}", "Accept": "text/event-stream"}
+        # Idle streams carry a heartbeat every 15 seconds
+        timeout = httpx.Timeout(self.timeout, read=60)
+        client, url = self._http_target(events_url)
+        async with client.stream("GET", url, params=params,
+                                 headers=headers, timeout=timeout) as response:
+            response.raise_for_status()
+            async for event, data in parse_sse(response.aiter_lines()):
+                yield event, data
+    
+    async def consume_events(
+        self,
+        events_url: str,
+        sender: str,
+        auth_token: str,
+        tools: Dict[str, Callable],
+        league_id: Optional[str] = None,
+        reconnect_delay: float = 2.0
+    ) -> None:
+        """
+        Dispatch pushed events to tool handlers until cancelled.
+        
+        The event name selects the handler in ``tools`` (the same handlers that
+        serve POSTed tool calls). The stream is reopened after any failure.
+        """
+        while True:
+            try:
+                async for event, data in self.subscribe(events_url, sender, auth_token, league_id):
+                    handler = tools.get(event)
+                    if handler is None:
+                        self.logger.debug(f"Ignoring pushed event {event}")
+                        continue
+                    try:
+                        await handler(data)
+                    except Exception as e:
+                        self.logger.error(f"Error handling pushed {event}: {e}")
+                self.logger.warning(f"Event stream {events_url} closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Event stream {events_url} failed: {e}")
+            await asyncio.sleep(reconnect_delay)
+    
     async def close(self):
         """Close the HTTP client."""
+        if self.ws_pool:
+            await self.ws_pool.close()
+        for client in self._unix_clients.values():
+            await client.aclose()
         await self.client.aclose()
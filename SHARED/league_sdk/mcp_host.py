@@ -0,0 +1,62 @@
+"""MCP host serving many agents from one FastAPI app."""
+from fastapi import Request, WebSocket
+from fastapi.responses import JSONResponse
+from typing import Dict, Callable, Optional
+from .mcp_server import MCPServer
+
+class MCPHost(MCPServer):
+    """
+    MCP server multiplexing several agents behind one HTTP server.
+
+    Each agent registers its own tool table under a key and is reachable at
+    ``/mcp/{agent_key}`` (WebSocket: ``/mcp/{agent_key}/ws``). Requests are
+    dispatched through the same JSON-RPC code path as a dedicated MCPServer,
+    so agents cannot tell the difference.
+    The plain ``/mcp`` route still serves the host's own tools.
+    """
+
+    def __init__(self, name: str, version: str = "1.0.0"):
+        super().__init__(name, version)
+        self.agents: Dict[str, Dict[str, Callable]] = {}
+        self.app.post("/mcp/{agent_key}")(self.handle_agent_request)
+        self.app.websocket("/mcp/{agent_key}/ws")(self.handle_agent_websocket)
+
+    def register_agent(self, agent_key: str, tools: Dict[str, Callable]) -> None:
+        """Register (or replace) the tool table of one hosted agent."""
+        self.agents[agent_key] = tools
+
+    def unregister_agent(self, agent_key: str) -> None:
+        """Remove a hosted agent."""
+        self.agents.pop(agent_key, None)
+
+    async def handle_agent_request(self, agent_key: str, request: Request) -> JSONResponse:
+        """Handle an MCP JSON-RPC request addressed to one hosted agent."""
+        try:
+            payload = await request.json()
+        except Exception as e:
+            self.logger.error(f"Error parsing request for {agent_key}: {e}")
+            return JSONResponse(self.parse_error())
+        return JSONResponse(await self.dispatch_to(agent_key, payload))
+
+    async def handle_agent_websocket(self, agent_key: str, websocket: WebSocket) -> None:
+        """Serve a persistent JSON-RPC connection to one hosted agent."""
+        tools = self.agents.get(agent_key)
+        if tools is None:
+            await websocket.close(code=4404)
+            return
+        await self.serve_websocket(websocket, tools)
+
+    async def dispatch_to(self, agent_key: str, payload: Dict) -> Dict:
+        """Dispatch a decoded request to one hosted agent's tool table."""
+        tools = self.agents.get(agent_key)
+        if tools is None:
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32601, "message": f"Unknown agent: {agent_key}"},
+                "id": payload.get("id") if isinstance(payload, dict) else None
+            }
+        return await self.dispatch(payload, tools)
+
+    def agent_endpoint(self, base_url: str, agent_key: str) -> str:
+        """Contact endpoint of a hosted agent (e.g., http://localhost:8100/mcp/H001)."""
+        return f"{base_url.rstrip('/')}/mcp/{agent_key}"
@@ -1,55 +1,352 @@
 """Base MCP Server implementation using FastAPI."""
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+import asyncio
+import hmac
 import logging
 import json
-from typing import Dict, Any, Callable, List, Optional
+import time
+from typing import Dict, Any, Callable, List, Optional, Set
 from datetime import datetime, timezone
+from .event_stream import EventHub
+from . import loopback
+from .metrics import MCPMetrics, mcp_metrics
+from .tracing import tracer
+from .loop_monitor import start_loop_monitor
+from . import profiler
+from . import deadlines
+from . import idempotency
 
 class MCPServer:
     """Base class for MCP server implementation."""
     
-    def __init__(self, name: str, version: str = "1.0.0"):
+    def __init__(self, name: str, version: str = "1.0.0", metrics: Optional[MCPMetrics] = None):
         self.name = name
         self.version = version
         self.app = FastAPI(title=f"MCP Server - {name}")
         self.tools: Dict[str, Callable] = {}
         self.logger = logging.getLogger(name)
         self.app.post("/mcp")(self.handle_mcp_request)
+        # Per-tool latency, in-flight and error metrics (Prometheus text on /metrics)
+        self.metrics = mcp_metrics if metrics is None else metrics
+        self.app.get("/metrics")(self.handle_metrics)
+        tracer.set_default_service(name)
+        # Event-loop lag and blocking-call detection for the serving process
+        self.app.add_event_handler("startup", self._start_loop_monitor)
+        # Admin routes (sampling profiler), enabled by LEAGUE_ADMIN_TOKEN
+        self.admin_token: Optional[str] = profiler.admin_token()
+        self.app.get("/admin/profile")(self.handle_profile)
+        self.app.post("/admin/profile/start")(self.handle_profile_start)
+        self.app.post("/admin/profile/stop")(self.handle_profile_stop)
+        # Server-Sent Events push channel (enabled by set_subscription_auth)
+        self.events = EventHub()
+        self.subscription_auth: Optional[Callable[[Dict], Optional[str]]] = None
+        self.app.get("/mcp/events")(self.handle_subscribe)
+        # Persistent JSON-RPC connections (MCPClient transport="websocket")
+        self.app.websocket("/mcp/ws")(self.handle_websocket)
+        # Duplicate requests (retries, hedged copies) are answered from here
+        self.responses = idempotency.ResponseCache()
+        # Tools also deduplicated by caller and conversation_id (register_tool dedupe=True)
+        self.dedupe_tools: Set[str] = set()
     
-    def register_tool(self, name: str, handler: Callable, description: str = ""):
-        """Register a tool handler."""
+    def register_tool(self, name: str, handler: Callable, description: str = "", dedupe: bool = False):
+        """
+        Register a tool handler.
+        
+        With ``dedupe`` a request repeating an earlier one's sender and
+        conversation_id gets the earlier response even without an
+        idempotency key (for non-idempotent tools such as registration).
+        """
         self.tools[name] = handler
+        if dedupe:
+            self.dedupe_tools.add(name)
         self.logger.info(f"Registered tool: {name}")
     
+    def register_loopback(self, endpoint: str, tools: Optional[Dict[str, Callable]] = None,
+                          registry: Optional[loopback.LoopbackRegistry] = None) -> None:
+        """
+        Serve ``endpoint`` to MCPClients in this process without the network.
+        
+        Args:
+            endpoint: Contact endpoint the clients call (e.g., http://localhost:8101/mcp)
+            tools: Optional tool table to dispatch to (defaults to self.tools)
+            registry: Registry to join (defaults to the process-wide one)
+        """
+        registry = loopback.registry if registry is None else registry
+        
+        async def dispatch(payload: Dict) -> Dict:
+            return await self.dispatch(payload, tools)
+        
+        registry.register(endpoint, dispatch)
+    
     async def handle_mcp_request(self, request: Request) -> JSONResponse:
         """Handle incoming MCP JSON-RPC 2.0 requests."""
         try:
             payload = await request.json()
+        except Exception as e:
+            self.logger.error(f"Error parsing request: {e}")
+            return JSONResponse(self.parse_error())
+        return JSONResponse(await self.dispatch(payload))
+    
+    def parse_error(self) -> Dict:
+        """JSON-RPC response to a request that is not valid JSON (counted as an error)."""
+        self.metrics.tool_errors.labels(self.name, "unknown", "-32700").inc()
+        return {
+            "jsonrpc": "2.0",
+            "error": {"code": -32700, "message": "Parse error"},
+            "id": None
+        }
+    
+    async def _start_loop_monitor(self) -> None:
+        start_loop_monitor(self.name)
+    
+    async def handle_metrics(self) -> Response:
+        """Serve the process's metrics in Prometheus text format."""
+        return Response(self.metrics.registry.render(), media_type="text/plain; version=0.0.4")
+    
+    def admin_error(self, request: Request) -> Optional[JSONResponse]:
+        """Rejection for an admin request without the admin token, or None if allowed."""
+        if self.admin_token is None:
+            return JSONResponse(self.create_league_error("E000", "ADMIN_DISABLED"), status_code=404)
+        authorization = request.headers.get("authorization", "")
+        provided = authorization[7:] if authorization.startswith("Bearer ") else ""
+        if not provided:
+            return JSONResponse(self.create_league_error("E011", "AUTH_TOKEN_MISSING"), status_code=401)
+        if not hmac.compare_digest(provided.encode(), self.admin_token.encode()):
+            return JSONResponse(self.create_league_error("E012", "AUTH_TOKEN_INVALID"), status_code=401)
+        return None
+    
+    @staticmethod
+    def _profile_options(request: Request) -> Dict:
+        query = request.query_params
+        return {
+            "interval_sec": max(0.001, float(query.get("interval_ms", 5)) / 1000),
+            "all_threads": query.get("threads") == "all",
+        }
+    
+    @staticmethod
+    def _profile_response(sampler: "profiler.SamplingProfiler", request: Request) -> Response:
+        if request.query_params.get("format") == "json":
+            return JSONResponse({**sampler.summary(), "collapsed": sampler.collapsed()})
+        return Response(sampler.collapsed(), media_type="text/plain")
+    
+    async def handle_profile(self, request: Request) -> Response:
+        """
+        Profile this process for ``seconds`` and return collapsed stacks.
+        
+        Query: seconds (default 10), interval_ms (default 5), threads=all,
+        format=json (summary plus stacks instead of plain collapsed stacks).
+        """
+        rejected = self.admin_error(request)
+        if rejected is not None:
+            return rejected
+        try:
+            sampler = await profiler.profile_for(
+                float(request.query_params.get("seconds", 10)), **self._profile_options(request))
+        except profiler.ProfilerBusy:
+            return JSONResponse(self.create_league_error("E000", "PROFILE_RUNNING"), status_code=409)
+        self.logger.info(f"Profile taken: {sampler.samples} samples over {sampler.duration_sec:.1f}s")
+        return self._profile_response(sampler, request)
+    
+    async def handle_profile_start(self, request: Request) -> Response:
+        """Start a profile that runs until /admin/profile/stop (at most max_seconds)."""
+        rejected = self.admin_error(request)
+        if rejected is not None:
+            return rejected
+        options = self._profile_options(request)
+        options["max_duration_sec"] = min(
+            float(request.query_params.get("max_seconds", profiler.MAX_PROFILE_SEC)), profiler.MAX_PROFILE_SEC)
+        try:
+            profiler.start_profile(**options)
+        except profiler.ProfilerBusy:
+            return JSONResponse(self.create_league_error("E000", "PROFILE_RUNNING"), status_code=409)
+        return JSONResponse({"status": "started", **options})
+    
+    async def handle_profile_stop(self, request: Request) -> Response:
+        """Stop the profile started by /admin/profile/start and return its stacks."""
+        rejected = self.admin_error(request)
+        if rejected is not None:
+            return rejected
+        sampler = profiler.stop_profile()
+        if sampler is None:
+            return JSONResponse(self.create_league_error("E000", "PROFILE_NOT_RUNNING"), status_code=404)
+        return self._profile_response(sampler, request)
+    
+    def set_subscription_auth(self, authenticate: Callable[[Dict], Optional[str]]) -> None:
+        """
+        Enable ``GET /mcp/events`` subscriptions.
+        
+        Args:
+            authenticate: Receives {"sender", "league_id", "auth_token"} and returns
+                the subscriber key to publish to, or None to reject the subscriber
+        """
+        self.subscription_auth = authenticate
+    
+    async def handle_subscribe(self, request: Request):
+        """Open a Server-Sent Events stream for an authenticated subscriber."""
+        if self.subscription_auth is None:
+            return JSONResponse(self.create_league_error("E000", "SUBSCRIPTIONS_DISABLED"), status_code=404)
+        authorization = request.headers.get("authorization", "")
+        params = {
+            "sender": request.query_params.get("sender", ""),
+            "league_id": request.query_params.get("league_id"),
+            "auth_token": authorization[7:] if authorization.startswith("Bearer ") else "",
+        }
+        key = self.subscription_auth(params)
+        if key is None:
+            return JSONResponse(self.create_league_error(
+                "E012", "AUTH_TOKEN_INVALID", context={"sender": params["sender"]}
+            ), status_code=401)
+        self.logger.info(f"Subscriber connected: {key}")
+        subscription = self.events.subscribe(key)
+        return StreamingResponse(
+            self.events.stream(subscription),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    async def handle_websocket(self, websocket: WebSocket) -> None:
+        """Serve a persistent JSON-RPC connection to this server's tools."""
+        await self.serve_websocket(websocket)
+    
+    async def serve_websocket(self, websocket: WebSocket,
+                              tools: Optional[Dict[str, Callable]] = None) -> None:
+        """
+        Serve JSON-RPC requests over one WebSocket until the peer disconnects.
+        
+        Requests are dispatched concurrently, so a slow tool call does not hold
+        up the others; each response carries its request's id.
+        """
+        await websocket.accept()
+        send_lock = asyncio.Lock()
+        in_flight = set()
+        
+        async def reply(payload):
+            response = await self.dispatch(payload, tools)
+            async with send_lock:
+                await websocket.send_text(json.dumps(response))
+        
+        try:
+            while True:
+                message = await websocket.receive_text()
+                try:
+                    payload = json.loads(message)
+                except ValueError as e:
+                    self.logger.error(f"Error parsing request: {e}")
+                    async with send_lock:
+                        await websocket.send_text(json.dumps(self.parse_error()))
+                    continue
+                task = asyncio.create_task(reply(payload))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in in_flight:
+                task.cancel()
+    
+    async def dispatch(self, payload: Dict, tools: Optional[Dict[str, Callable]] = None) -> Dict:
+        """
+        Process one JSON-RPC 2.0 request and return the response object.
+        
+        Transport independent: the HTTP route and in-process callers share it.
+        Latency, in-flight count and JSON-RPC errors are recorded per tool, and
+        a request carrying a trace context is handled inside a server span.
+        A request whose deadline has passed is answered with error -32001
+        without running the tool; otherwise its deadline caps the calls the
+        tool makes. Duplicates of a request (same caller and idempotency key,
+        see ``idempotency``) share its response.
+        
+        Args:
+            payload: Decoded JSON-RPC request
+            tools: Optional tool table to dispatch to (defaults to self.tools)
+        """
+        label = self._metric_label(payload, self.tools if tools is None else tools)
+        in_flight = self.metrics.tool_in_flight.labels(self.name, label)
+        in_flight.inc()
+        parent = tracer.extract(payload)
+        span = token = None
+        if parent is not None:
+            span = tracer.start_span(label, "server", parent, service=self.name)
+            token = tracer.activate(span)
+        deadline = deadlines.request_deadline(payload)
+        deadline_token = deadlines.activate(deadline)
+        start = time.perf_counter()
+        try:
+            key = idempotency.request_key(payload, self.dedupe_tools)
+            if deadline is not None and deadlines.remaining(deadline) <= 0:
+                response = self.deadline_error(payload, label)
+            elif key is None:
+                response = await self._dispatch(payload, tools)
+            else:
+                response, replayed = await self.responses.run(key, lambda: self._dispatch(payload, tools))
+                if replayed:
+                    self.metrics.duplicate_requests.labels(self.name, label).inc()
+                    response = {**response, "id": payload.get("id")}
+        finally:
+            in_flight.dec()
+            deadlines.deactivate(deadline_token)
+            if token is not None:
+                tracer.deactivate(token)
+        self.metrics.tool_latency.labels(self.name, label).observe(time.perf_counter() - start)
+        error = response.get("error")
+        code = None if error is None else str(error.get("code"))
+        if code is not None:
+            self.metrics.tool_errors.labels(self.name, label, code).inc()
+        if span is not None:
+            span.end(code)
+        return response
+    
+    def deadline_error(self, payload: Dict, label: str) -> Dict:
+        """Response to a request that arrived after its deadline."""
+        self.logger.warning(f"Dropped {label}: deadline passed before it was handled")
+        return {
+            "jsonrpc": "2.0",
+            "error": {"code": deadlines.DEADLINE_EXCEEDED, "message": "Deadline exceeded"},
+            "id": payload.get("id")
+        }
+    
+    @staticmethod
+    def _metric_label(payload, tools: Dict[str, Callable]) -> str:
+        """Tool name for metrics; unknown names share one label to bound cardinality."""
+        if not isinstance(payload, dict):
+            return "unknown"
+        method = payload.get("method")
+        if method != "tools/call":
+            return method if method in ("initialize", "tools/list") else "unknown"
+        name = (payload.get("params") or {}).get("name")
+        return name if name in tools else "unknown"
+    
+    async def _dispatch(self, payload: Dict, tools: Optional[Dict[str, Callable]]) -> Dict:
+        verbose = self.logger.isEnabledFor(logging.INFO)
+        try:
             method = payload.get("method")
             params = payload.get("params", {})
             request_id = payload.get("id")
-            self.logger.info(f"[RECV Request] {json.dumps(payload, indent=2)}")
+            if verbose:
+                self.logger.info(f"[RECV Request] {json.dumps(payload, indent=2)}")
             self.logger.debug(f"Received: {method}")
             if method == "initialize":
                 result = self._handle_initialize()
             elif method == "tools/list":
-                result = self._handle_tools_list()
+                result = self._handle_tools_list(tools)
             elif method == "tools/call":
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
-                result = await self._handle_tool_call(tool_name, arguments)
+                result = await self._handle_tool_call(tool_name, arguments, tools)
             else:
                 error_response = {
                     "jsonrpc": "2.0",
                     "error": {"code": -32601, "message": "Method not found"},
                     "id": request_id
                 }
-                self.logger.info(f"[SEND Response] {json.dumps(error_response, indent=2)}")
-                return JSONResponse(error_response)
+                if verbose:
+                    self.logger.info(f"[SEND Response] {json.dumps(error_response, indent=2)}")
+                return error_response
             success_response = {"jsonrpc": "2.0", "result": result, "id": request_id}
-            self.logger.info(f"[SEND Response] {json.dumps(success_response, indent=2)}")
-            return JSONResponse(success_response)
+            if verbose:
+                self.logger.info(f"[SEND Response] {json.dumps(success_response, indent=2)}")
+            return success_response
         except Exception as e:
             self.logger.error(f"Error handling request: {e}")
             error_response = {
@@ -57,8 +354,9 @@ class MCPServer:
                 "error": {"code": -32603, "message": str(e)},
                 "id": payload.get("id")
             }
-            self.logger.info(f"[SEND Response] {json.dumps(error_response, indent=2)}")
-            return JSONResponse(error_response)
+            if verbose:
+                self.logger.info(f"[SEND Response] {json.dumps(error_response, indent=2)}")
+            return error_response
     
     def _handle_initialize(self) -> Dict:
         """Handle MCP initialize."""
@@ -68,15 +366,20 @@ class MCPServer:
             "capabilities": {}
         }
     
-    def _handle_tools_list(self) -> Dict:
+    def _handle_tools_list(self, tools: Optional[Dict[str, Callable]] = None) -> Dict:
         """List available tools."""
-        return {"tools": [{"name": name} for name in self.tools.keys()]}
+        tools = self.tools if tools is None else tools
+        return {"tools": [{"name": name} for name in tools.keys()]}
     
-    async def _handle_tool_call(self, tool_name: str, arguments: Dict) -> Any:
+    async def _handle_tool_call(
+        self, tool_name: str, arguments: Dict,
+        tools: Optional[Dict[str, Callable]] = None
+    ) -> Any:
         """Execute a tool call."""
-        if tool_name not in self.tools:
+        tools = self.tools if tools is None else tools
+        if tool_name not in tools:
             raise ValueError(f"Unknown tool: {tool_name}")
-        handler = self.tools[tool_name]
+        handler = tools[tool_name]
         result = await handler(arguments) if callable(handler) else handler
         if isinstance(result, dict):
             return {"content": [{"type": "text", "text": json.dumps(result)}]}
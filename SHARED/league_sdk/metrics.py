@@ -0,0 +1,251 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Every agent records into the process-wide ``registry``:
+
+  - ``mcp_server_tool_latency_seconds{server,tool}``: time from request to
+    response inside MCPServer.dispatch
+  - ``mcp_server_in_flight_requests{server,tool}`` and
+    ``mcp_server_errors_total{server,tool,code}`` (JSON-RPC error code)
+  - ``mcp_client_call_latency_seconds{endpoint}``, ``mcp_client_in_flight_calls{endpoint}``
+    and ``mcp_client_errors_total{endpoint,code}`` (JSON-RPC code, ``timeout``,
+    ``connect``, ``http_<status>`` or the exception name)
+  - ``mcp_client_retries_total{tool}``: retries made by call_tool_with_retry
+
+MCPServer serves ``registry.render()`` on ``GET /metrics``.
+
+Latencies go into HDR-style histograms: log-linear buckets with 16 linear
+sub-buckets per power of two microseconds, so any recorded value is known to
+within 6.25% at a fixed cost per observation. Prometheus gets the cumulative
+counts at power-of-two bounds (exact bucket edges); ``Histogram.percentile``
+reads quantiles from the fine buckets.
+"""
+
+import math
+from typing import Callable, Dict, List, Tuple
+
+SUB_BUCKET_BITS = 5  # values below 2**5 us get one bucket each
+SUB_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)  # linear sub-buckets per power of two above that
+# Prometheus bucket bounds: 16 us .. ~33.5 s in powers of two
+EXPORT_BOUNDS_US = [1 << k for k in range(4, 26)]
+
+
+def _bucket_index(value_us: int) -> int:
+    bits = value_us.bit_length()
+    if bits <= SUB_BUCKET_BITS:
+        return value_us
+    shift = bits - SUB_BUCKET_BITS
+    return shift * SUB_BUCKETS + (value_us >> shift)
+
+
+def _bucket_upper_us(index: int) -> int:
+    """Exclusive upper bound of a bucket in microseconds."""
+    if index < 2 * SUB_BUCKETS:
+        return index + 1
+    shift = index // SUB_BUCKETS - 1
+    return (index - shift * SUB_BUCKETS + 1) << shift
+
+
+class Histogram:
+    """HDR-style latency histogram (observations in seconds, microsecond resolution)."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts: List[int] = []
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = _bucket_index(max(0, int(seconds * 1_000_000)))
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding quantile ``q`` (0..1)."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(_bucket_upper_us(index) / 1_000_000, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's observations to this one."""
+        counts = self.counts
+        if len(other.counts) > len(counts):
+            counts.extend([0] * (len(other.counts) - len(counts)))
+        for index, bucket in enumerate(other.counts):
+            counts[index] += bucket
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def cumulative(self, bounds_us: List[int]) -> List[int]:
+        """Observations below each bound (bounds must be powers of two)."""
+        totals, running, position = [], 0, 0
+        for bound in bounds_us:
+            end = min(_bucket_index(bound), len(self.counts))
+            running += sum(self.counts[position:end])
+            position = max(position, end)
+            totals.append(running)
+        return totals
+
+    def summary(self) -> Dict[str, float]:
+        """Count and latency percentiles in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000, 4),
+            "p90_ms": round(self.percentile(0.90) * 1000, 4),
+            "p99_ms": round(self.percentile(0.99) * 1000, 4),
+            "max_ms": round(self.max * 1000, 4),
+        }
+
+
+class Value:
+    """Counter or gauge value of one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: List[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class MetricFamily:
+    """One named metric and its series, keyed by label values."""
+
+    def __init__(self, name: str, help_text: str, kind: str,
+                 label_names: Tuple[str, ...], factory: Callable):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.label_names = label_names
+        self.factory = factory
+        self.series: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """Series of one label set (created on first use)."""
+        series = self.series.get(values)
+        if series is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} takes labels {self.label_names}, got {values}")
+            series = self.series[values] = self.factory()
+        return series
+
+    def render(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, series in self.series.items():
+            pairs = list(zip(self.label_names, values))
+            if self.kind != "histogram":
+                lines.append(f"{self.name}{_format_labels(pairs)} {series.value}")
+                continue
+            for bound, total in zip(EXPORT_BOUNDS_US, series.cumulative(EXPORT_BOUNDS_US)):
+                le = _format_labels(pairs + [("le", f"{bound / 1_000_000:.6g}")])
+                lines.append(f"{self.name}_bucket{le} {total}")
+            lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {series.sum}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {series.count}")
+
+
+class MetricsRegistry:
+    """Metric families of one process."""
+
+    def __init__(self):
+        self.families: Dict[str, MetricFamily] = {}
+
+    def _family(self, name: str, help_text: str, kind: str,
+                label_names: Tuple[str, ...], factory: Callable) -> MetricFamily:
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = MetricFamily(name, help_text, kind, label_names, factory)
+        elif family.kind != kind or family.label_names != label_names:
+            raise ValueError(f"Metric {name} already registered as {family.kind}{family.label_names}")
+        return family
+
+    def counter(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "counter", label_names, Value)
+
+    def gauge(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "gauge", label_names, Value)
+
+    def histogram(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "histogram", label_names, Histogram)
+
+    def render(self) -> str:
+        """All families in Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for family in self.families.values():
+            family.render(lines)
+        return "\n".join(lines) + "\n"
+
+
+class MCPMetrics:
+    """Metric families recorded by MCPServer and MCPClient."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.tool_latency = registry.histogram(
+            "mcp_server_tool_latency_seconds", "Server-side latency of MCP requests",
+            ("server", "tool"))
+        self.tool_in_flight = registry.gauge(
+            "mcp_server_in_flight_requests", "MCP requests being handled", ("server", "tool"))
+        self.tool_errors = registry.counter(
+            "mcp_server_errors_total", "MCP requests answered with a JSON-RPC error",
+            ("server", "tool", "code"))
+        self.call_latency = registry.histogram(
+            "mcp_client_call_latency_seconds", "Round-trip latency of outgoing tool calls",
+            ("endpoint",))
+        self.call_in_flight = registry.gauge(
+            "mcp_client_in_flight_calls", "Outgoing tool calls awaiting a response", ("endpoint",))
+        self.call_errors = registry.counter(
+            "mcp_client_errors_total", "Outgoing tool calls that failed", ("endpoint", "code"))
+        self.call_retries = registry.counter(
+            "mcp_client_retries_total", "Retries made by call_tool_with_retry", ("tool",))
+        self.circuit_state = registry.gauge(
+            "mcp_client_circuit_state", "Endpoint circuit breaker (0 closed, 1 half-open, 2 open)",
+            ("endpoint",))
+        self.circuit_opened = registry.counter(
+            "mcp_client_circuit_opened_total", "Times an endpoint's circuit breaker opened", ("endpoint",))
+        self.call_hedges = registry.counter(
+            "mcp_client_hedged_calls_total", "Calls duplicated because the first copy was slow", ("tool",))
+        self.hedge_wins = registry.counter(
+            "mcp_client_hedge_wins_total", "Hedged calls answered first by the duplicate", ("tool",))
+        self.duplicate_requests = registry.counter(
+            "mcp_server_duplicate_requests_total", "Requests answered from an earlier one with the same key",
+            ("server", "tool"))
+
+
+# Process-wide registry served on /metrics
+registry = MetricsRegistry()
+mcp_metrics = MCPMetrics(registry)
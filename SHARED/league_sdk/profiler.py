@@ -0,0 +1,192 @@
+"""
+On-demand statistical profiler for a live agent process.
+
+A SamplingProfiler runs a background thread that wakes every ``interval_sec``,
+reads the stacks of the sampled threads with ``sys._current_frames()`` and
+counts each distinct stack. The profiled code is not instrumented, so the cost
+is one stack walk per sample, paid on the sampler thread; the event loop keeps
+serving requests while a profile is taken.
+
+Results are collapsed stacks, one line per distinct stack with its sample
+count, root first:
+
+    Runner.run (asyncio/runners.py:86);...;choose_parity (player_P01/handlers.py:40) 17
+
+That is the input format of flamegraph.pl, speedscope and inferno. With
+``all_threads`` every thread is sampled and each stack starts with the thread's
+name.
+
+MCPServer exposes the profiler on admin routes guarded by ``LEAGUE_ADMIN_TOKEN``
+(``/admin/profile``, see MCPServer). Only one profile runs per process at a time.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+ADMIN_TOKEN_ENV = "LEAGUE_ADMIN_TOKEN"
+MAX_PROFILE_SEC = 300.0
+
+
+class ProfilerBusy(RuntimeError):
+    """A profile is already running in this process."""
+
+
+class SamplingProfiler:
+    """Sample thread stacks at a fixed interval and count collapsed stacks."""
+
+    def __init__(self, interval_sec: float = 0.005, max_depth: int = 128,
+                 all_threads: bool = False, thread_id: Optional[int] = None,
+                 max_duration_sec: float = MAX_PROFILE_SEC):
+        """
+        Args:
+            interval_sec: Time between samples
+            max_depth: Innermost frames kept per sample
+            all_threads: Sample every thread (prefixed with its name), not just one
+            thread_id: Thread to sample (defaults to the thread calling start())
+            max_duration_sec: Sampling stops by itself after this long
+        """
+        self.interval_sec = interval_sec
+        self.max_depth = max_depth
+        self.all_threads = all_threads
+        self.thread_id = thread_id
+        self.max_duration_sec = max_duration_sec
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.duration_sec = 0.0
+        self._labels: Dict[object, str] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            raise ProfilerBusy("profiler already running")
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.duration_sec = min(time.perf_counter() - self._t0, self.max_duration_sec)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        deadline = self._t0 + self.max_duration_sec
+        while not self._stopped.wait(self.interval_sec) and time.perf_counter() < deadline:
+            frames = sys._current_frames()
+            if self.all_threads:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in frames.items():
+                    if ident != own_id:
+                        self._record(frame, names.get(ident, f"thread-{ident}"))
+            else:
+                frame = frames.get(self.thread_id)
+                if frame is not None:
+                    self._record(frame, None)
+            self.samples += 1
+
+    def _record(self, frame, thread_name: Optional[str]) -> None:
+        labels = self._labels
+        stack: List[str] = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = _frame_label(code)
+            stack.append(label)
+            frame = frame.f_back
+        if thread_name is not None:
+            stack.append(thread_name.replace(";", "_"))
+        stack.reverse()
+        self.stacks[";".join(stack)] += 1
+
+    def collapsed(self) -> str:
+        """Collapsed stacks (``frame;frame;... count`` per line), most sampled first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self, top: int = 20) -> Dict:
+        """Sample counts and the functions most often on top of the stack (self time)."""
+        leaf = Counter()
+        for stack, count in self.stacks.items():
+            leaf[stack.rsplit(";", 1)[-1]] += count
+        total = sum(self.stacks.values())
+        return {
+            "samples": self.samples,
+            "stacks": len(self.stacks),
+            "interval_ms": self.interval_sec * 1000,
+            "duration_sec": round(self.duration_sec, 3),
+            "top_self": [
+                {"frame": frame, "samples": count, "percent": round(100 * count / total, 2)}
+                for frame, count in leaf.most_common(top)
+            ],
+        }
+
+
+def _frame_label(code) -> str:
+    """``function (dir/file.py:first_line)``, short enough to read in a flame graph."""
+    path = code.co_filename.replace("\\", "/").split("/")
+    filename = "/".join(path[-2:])
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({filename}:{code.co_firstlineno})".replace(";", "_")
+
+
+_lock = threading.Lock()
+_active: Optional[SamplingProfiler] = None
+
+
+def start_profile(**options) -> SamplingProfiler:
+    """Start the process's profiler on the calling thread (raises ProfilerBusy if one is running)."""
+    global _active
+    with _lock:
+        if _active is not None and _active.running:
+            raise ProfilerBusy("a profile is already running")
+        _active = SamplingProfiler(**options)
+        _active.start()
+        return _active
+
+
+def stop_profile() -> Optional[SamplingProfiler]:
+    """Stop the running profile and return it (None if none was started)."""
+    global _active
+    with _lock:
+        profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+async def profile_for(duration_sec: float, **options) -> SamplingProfiler:
+    """Profile the event loop's thread for ``duration_sec`` without blocking the loop."""
+    global _active
+    duration_sec = min(max(duration_sec, 0.0), MAX_PROFILE_SEC)
+    profiler = start_profile(**options)
+    try:
+        await asyncio.sleep(duration_sec)
+    finally:
+        with _lock:
+            if _active is profiler:
+                _active = None
+        profiler.stop()
+    return profiler
+
+
+def admin_token() -> Optional[str]:
+    """Token required by the admin routes (None disables them)."""
+    return os.environ.get(ADMIN_TOKEN_ENV) or None
@@ -221,9 +221,9 @@ class GameResult(BaseModel):
     """Game result details."""
     status: str  # WIN, DRAW, or TECHNICAL_LOSS
     winner_player_id: Optional[str] = None
-    drawn_number: int
-    number_parity: str
-    choices: Dict[str, str]
+    drawn_number: Optional[int] = None  # None when decided by technical loss
+    number_parity: Optional[str] = None
+    choices: Dict[str, Optional[str]]
     reason: str
 
 
@@ -282,7 +282,11 @@ class LeagueStandingsUpdate(BaseModel):
     conversation_id: str
     league_id: str
     round_id: int
-    standings: List[StandingsEntry]
+    standings: List[StandingsEntry]  # all rows, or only changed rows for DELTA
+    update_mode: str = "FULL"  # "FULL" or "DELTA" (see standings_delta.py)
+    standings_version: Optional[int] = None
+    base_version: Optional[int] = None
+    total_players: Optional[int] = None
 
 
 # ============================================================================
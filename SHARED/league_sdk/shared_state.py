@@ -0,0 +1,125 @@
+"""Memory-mapped buffers for sharing state snapshots between local processes."""
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+
+# Header: magic, layout version, sequence counter, payload length
+HEADER = struct.Struct("<4sIQI")
+HEADER_SIZE = 32
+MAGIC = b"LGSS"
+LAYOUT_VERSION = 1
+SEQ_OFFSET = 8
+LENGTH_OFFSET = 16
+SEQ = struct.Struct("<Q")
+LENGTH = struct.Struct("<I")
+
+
+class SeqlockBuffer:
+    """
+    Single-writer, many-reader snapshot buffer in a memory-mapped file.
+
+    The writer makes the sequence counter odd, copies the payload, then makes
+    it even again. Readers copy the payload between two reads of the counter
+    and retry when the counter was odd or changed, so they never see a half
+    written snapshot and never block the writer. The snapshot version is
+    ``sequence // 2``.
+    """
+
+    def __init__(self, path: Union[str, Path], capacity: Optional[int] = None):
+        """
+        Open a buffer.
+
+        Args:
+            path: Backing file (use a tmpfs path such as /dev/shm where available)
+            capacity: Payload capacity in bytes. Given: create or reset the file
+                and open it for writing. Omitted: open an existing file read-only.
+        """
+        self.path = Path(path)
+        self.writable = capacity is not None
+        if self.writable:
+            size = HEADER_SIZE + int(capacity)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                os.ftruncate(fd, size)
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            HEADER.pack_into(self._mmap, 0, MAGIC, LAYOUT_VERSION, 0, 0)
+            self._seq = 0
+        else:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, layout, _, _ = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or layout != LAYOUT_VERSION:
+                self._mmap.close()
+                raise ValueError(f"{self.path} is not a league state buffer")
+        self.capacity = len(self._mmap) - HEADER_SIZE
+
+    @property
+    def sequence(self) -> int:
+        """Current sequence counter (cheap change check for readers)."""
+        return SEQ.unpack_from(self._mmap, SEQ_OFFSET)[0]
+
+    def publish(self, payload: bytes) -> int:
+        """
+        Publish a new snapshot.
+
+        Returns:
+            The snapshot version
+        """
+        if not self.writable:
+            raise PermissionError("Buffer was opened read-only")
+        if len(payload) > self.capacity:
+            raise ValueError(f"Snapshot of {len(payload)} bytes exceeds capacity {self.capacity}")
+        buf = self._mmap
+        self._seq += 1
+        SEQ.pack_into(buf, SEQ_OFFSET, self._seq)
+        LENGTH.pack_into(buf, LENGTH_OFFSET, len(payload))
+        buf[HEADER_SIZE:HEADER_SIZE + len(payload)] = payload
+        self._seq += 1
+        SEQ.pack_into(buf, SEQ_OFFSET, self._seq)
+        return self._seq // 2
+
+    def read(self, max_attempts: int = 1000) -> Optional[Tuple[int, bytes]]:
+        """
+        Read the latest consistent snapshot.
+
+        Returns:
+            (version, payload), or None if nothing was published yet
+
+        Raises:
+            TimeoutError: If no consistent copy was obtained (writer stalled mid-write)
+        """
+        buf = self._mmap
+        for attempt in range(max_attempts):
+            before = SEQ.unpack_from(buf, SEQ_OFFSET)[0]
+            if before == 0:
+                return None
+            if not before & 1:
+                length = LENGTH.unpack_from(buf, LENGTH_OFFSET)[0]
+                payload = buf[HEADER_SIZE:HEADER_SIZE + min(length, self.capacity)]
+                if SEQ.unpack_from(buf, SEQ_OFFSET)[0] == before:
+                    return before // 2, payload
+            if attempt:
+                time.sleep(0)
+        raise TimeoutError(f"No consistent snapshot in {self.path} after {max_attempts} attempts")
+
+    def publish_json(self, data: Any) -> int:
+        """Publish a JSON-serializable snapshot."""
+        return self.publish(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def read_json(self) -> Optional[Tuple[int, Any]]:
+        """Read the latest snapshot published with publish_json()."""
+        snapshot = self.read()
+        if snapshot is None:
+            return None
+        version, payload = snapshot
+        return version, json.loads(payload)
+
+    def close(self) -> None:
+        self._mmap.close()
@@ -0,0 +1,126 @@
+"""
+Versioned standings with delta updates.
+
+The league manager records every standings table it publishes as a numbered
+version in a StandingsHistory. A player that acknowledged version ``v`` is
+then sent only the rows whose rank or points differ from version ``v``; a
+player without a retained base version gets the full table (resync).
+
+Players keep a StandingsReplica that applies FULL and DELTA updates and
+reports the version it holds in its acknowledgement.
+
+Delta LEAGUE_STANDINGS_UPDATE fields:
+    update_mode        "FULL" or "DELTA"
+    standings_version  version after applying the update
+    base_version       version the delta applies to (DELTA only)
+    total_players      number of rows in the full table
+    standings          all rows (FULL) or the changed rows (DELTA)
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+# A row is resent when one of these fields changed since the base version.
+# Counters such as played/losses are refreshed together with the row.
+DELTA_FIELDS = ("rank", "points")
+
+UPDATE_FULL = "FULL"
+UPDATE_DELTA = "DELTA"
+
+
+def _key(row: Dict) -> tuple:
+    return tuple(row.get(field) for field in DELTA_FIELDS)
+
+
+class StandingsHistory:
+    """Recent standings versions of one league (manager side)."""
+
+    def __init__(self, max_versions: int = 8):
+        """
+        Args:
+            max_versions: Versions kept as delta bases; older acks get a full resync
+        """
+        self.max_versions = max(1, max_versions)
+        self.version = 0
+        self._rows: Dict[str, Dict] = {}
+        self._versions: "OrderedDict[int, Dict[str, tuple]]" = OrderedDict()
+
+    def publish(self, standings: Iterable[Dict]) -> int:
+        """Record a new standings table and return its version."""
+        self.version += 1
+        self._rows = {row['player_id']: row for row in standings}
+        self._versions[self.version] = {pid: _key(row) for pid, row in self._rows.items()}
+        while len(self._versions) > self.max_versions:
+            self._versions.popitem(last=False)
+        return self.version
+
+    def full(self) -> List[Dict]:
+        """All rows of the current version, by rank."""
+        return sorted(self._rows.values(), key=lambda row: row['rank'])
+
+    def update_for(self, acked_version: Optional[int]) -> Dict:
+        """
+        Update fields bringing a replica at ``acked_version`` to the current version.
+
+        Returns a DELTA when the acknowledged version is still retained,
+        otherwise a FULL table.
+        """
+        base = self._versions.get(acked_version) if acked_version else None
+        if base is None:
+            return {
+                "update_mode": UPDATE_FULL,
+                "standings_version": self.version,
+                "total_players": len(self._rows),
+                "standings": self.full(),
+            }
+        changed = [
+            row for pid, row in self._rows.items()
+            if base.get(pid) != _key(row)
+        ]
+        changed.sort(key=lambda row: row['rank'])
+        return {
+            "update_mode": UPDATE_DELTA,
+            "standings_version": self.version,
+            "base_version": acked_version,
+            "total_players": len(self._rows),
+            "standings": changed,
+        }
+
+
+class StandingsReplica:
+    """Local standings table kept up to date from FULL and DELTA updates (player side)."""
+
+    def __init__(self):
+        self.version = 0
+        self.rows: Dict[str, Dict] = {}
+        self.resyncs_needed = 0
+
+    def apply(self, message: Dict) -> bool:
+        """
+        Apply one LEAGUE_STANDINGS_UPDATE.
+
+        Messages without ``update_mode`` are treated as full tables.
+
+        Returns:
+            False if a DELTA did not match the held version (left unapplied)
+        """
+        mode = message.get('update_mode', UPDATE_FULL)
+        rows = message.get('standings', [])
+        if mode == UPDATE_DELTA:
+            if message.get('base_version') != self.version:
+                self.resyncs_needed += 1
+                return False
+            for row in rows:
+                self.rows[row['player_id']] = row
+        else:
+            self.rows = {row['player_id']: row for row in rows}
+        self.version = message.get('standings_version', self.version)
+        return True
+
+    def standings(self) -> List[Dict]:
+        """The replicated table, by rank."""
+        return sorted(self.rows.values(), key=lambda row: row['rank'])
+
+    def find(self, player_id: str) -> Optional[Dict]:
+        """Row of one player, or None if not ranked yet."""
+        return self.rows.get(player_id)
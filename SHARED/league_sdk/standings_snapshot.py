@@ -0,0 +1,146 @@
+"""
+Fixed-layout standings snapshot in shared memory.
+
+The league manager writes the standings table into a memory-mapped
+SeqlockBuffer every time it computes them. Co-located players and dashboards
+poll the file without HTTP or JSON: the payload is a fixed header followed by
+one fixed-size record per player, decoded with ``struct``.
+
+Payload layout (little endian):
+    header:  entry_count u32, round_id u32, flags u32, updated_at f64
+    entry:   player_id 16s, rank, played, wins, draws, losses, points (u32 each)
+"""
+
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .shared_state import SeqlockBuffer
+
+
+SNAPSHOT_HEADER = struct.Struct("<IIId")
+ENTRY = struct.Struct("<16s6I")
+PLAYER_ID_SIZE = 16
+
+FLAG_LEAGUE_COMPLETED = 1
+
+
+class StandingEntry(NamedTuple):
+    """One row of the standings table."""
+    player_id: str
+    rank: int
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    points: int
+
+
+class StandingsSnapshot(NamedTuple):
+    """A consistent copy of the published standings."""
+    version: int
+    round_id: int
+    league_completed: bool
+    updated_at: float
+    entries: List[StandingEntry]
+
+    def find(self, player_id: str) -> Optional[StandingEntry]:
+        """Entry of one player, or None if not ranked yet."""
+        return next((entry for entry in self.entries if entry.player_id == player_id), None)
+
+
+def snapshot_capacity(max_players: int) -> int:
+    """Payload bytes needed for a league of max_players."""
+    return SNAPSHOT_HEADER.size + max_players * ENTRY.size
+
+
+class StandingsSnapshotWriter:
+    """Publish standings tables (as returned by calculate_standings)."""
+
+    def __init__(self, path: Union[str, Path], max_players: int):
+        self.max_players = max_players
+        self.buffer = SeqlockBuffer(path, snapshot_capacity(max_players))
+        self._payload = bytearray(snapshot_capacity(max_players))
+
+    def publish(self, standings: Iterable[Dict], round_id: int = 0,
+                league_completed: bool = False) -> int:
+        """
+        Publish a standings table.
+
+        Returns:
+            Snapshot version
+        """
+        payload = self._payload
+        count = 0
+        for entry in standings:
+            if count == self.max_players:
+                raise ValueError(f"More than {self.max_players} players in standings")
+            player_id = entry['player_id'].encode("utf-8")
+            if len(player_id) > PLAYER_ID_SIZE:
+                raise ValueError(f"player_id {entry['player_id']!r} longer than {PLAYER_ID_SIZE} bytes")
+            ENTRY.pack_into(
+                payload, SNAPSHOT_HEADER.size + count * ENTRY.size, player_id,
+                entry['rank'], entry['played'], entry['wins'],
+                entry['draws'], entry['losses'], entry['points']
+            )
+            count += 1
+        flags = FLAG_LEAGUE_COMPLETED if league_completed else 0
+        SNAPSHOT_HEADER.pack_into(payload, 0, count, round_id, flags, time.time())
+        size = SNAPSHOT_HEADER.size + count * ENTRY.size
+        return self.buffer.publish(bytes(memoryview(payload)[:size]))
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+class StandingsReader:
+    """
+    Poll the standings published by a co-located league manager.
+
+    Example:
+        reader = StandingsReader("/dev/shm/league_2025_even_odd.standings")
+        snapshot = reader.read()
+        me = snapshot.find("P03") if snapshot else None
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.buffer = SeqlockBuffer(path)
+        self._last: Optional[StandingsSnapshot] = None
+
+    @property
+    def version(self) -> int:
+        """Version of the latest published snapshot (0 = none yet)."""
+        return self.buffer.sequence // 2
+
+    def read(self) -> Optional[StandingsSnapshot]:
+        """Latest snapshot; decoded again only when the version changed."""
+        if self._last is not None and self._last.version == self.version:
+            return self._last
+        raw = self.buffer.read()
+        if raw is None:
+            return None
+        version, payload = raw
+        count, round_id, flags, updated_at = SNAPSHOT_HEADER.unpack_from(payload, 0)
+        entries = [
+            StandingEntry(player_id.rstrip(b"\0").decode("utf-8"), *stats)
+            for player_id, *stats in ENTRY.iter_unpack(
+                payload[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + count * ENTRY.size]
+            )
+        ]
+        self._last = StandingsSnapshot(version, round_id, bool(flags & FLAG_LEAGUE_COMPLETED),
+                                       updated_at, entries)
+        return self._last
+
+    def wait_for_update(self, after_version: int, timeout: float,
+                        poll_interval: float = 0.05) -> Optional[StandingsSnapshot]:
+        """Block until a snapshot newer than after_version is published (or timeout)."""
+        deadline = time.monotonic() + timeout
+        while self.version <= after_version:
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+        return self.read()
+
+    def close(self) -> None:
+        self.buffer.close()
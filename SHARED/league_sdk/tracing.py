@@ -0,0 +1,220 @@
+"""
+Trace-context propagation and a JSONL span sink.
+
+MCPClient puts the caller's context into each JSON-RPC request as
+``params._meta.traceparent`` (W3C format ``00-<trace_id>-<span_id>-01``), and
+MCPServer restores it around the tool handler, so calls made by the handler
+join the caller's trace:
+
+    league manager  start_match           (client span, trace = the match)
+      referee       start_match           (server span)
+        referee     receive_game_invitation, choose_parity, receive_game_over
+          player    ...                   (server spans)
+    league manager  record_match_result   (event, same trace)
+
+The league manager runs each league in its own trace and each match in a
+trace derived from the match's conversation_id, which every message of the
+match carries (``trace_id_for``).
+
+Spans are written when a sink is configured: set ``LEAGUE_TRACE_DIR`` (each
+process appends to ``<dir>/trace-<pid>.jsonl``) or call ``tracer.configure``.
+Without a sink the context is still propagated, so a traced process can call
+an untraced one. ``tools/critical_path/`` rebuilds per-match timelines.
+"""
+
+import atexit
+import contextvars
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+TRACE_DIR_ENV = "LEAGUE_TRACE_DIR"
+
+
+class SpanContext(NamedTuple):
+    """Position in a trace: calls made under it become its children."""
+    trace_id: str
+    span_id: Optional[str]
+    service: Optional[str]
+
+
+_current: contextvars.ContextVar = contextvars.ContextVar("league_trace", default=None)
+
+
+def new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def trace_id_for(key: str) -> str:
+    """Trace id shared by everything that knows ``key`` (e.g., a match's conversation_id)."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def format_traceparent(trace_id: str, span_id: str) -> str:
+    return f"00-{trace_id}-{span_id}-01"
+
+
+def parse_traceparent(value) -> Optional[tuple]:
+    """(trace_id, span_id) of a traceparent header value, or None if malformed."""
+    if not isinstance(value, str):
+        return None
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2]
+
+
+class SpanSink:
+    """Append spans to a JSONL file, written in batches to keep I/O off the hot path."""
+
+    def __init__(self, path: Path, flush_every: int = 64, flush_after_sec: float = 1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.flush_after_sec = flush_after_sec
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, span: Dict) -> None:
+        self._lines.append(json.dumps(span, separators=(",", ":")))
+        if (len(self._lines) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_after_sec):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+class Span:
+    """One timed operation; ``end()`` writes it to the tracer's sink."""
+
+    __slots__ = ("tracer", "context", "parent_id", "name", "kind", "attributes", "start", "_t0")
+
+    def __init__(self, tracer: "Tracer", context: SpanContext, parent_id: Optional[str],
+                 name: str, kind: str, attributes: Dict):
+        self.tracer = tracer
+        self.context = context
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+
+    @property
+    def traceparent(self) -> str:
+        return format_traceparent(self.context.trace_id, self.context.span_id)
+
+    def end(self, error: Optional[str] = None) -> None:
+        duration = time.perf_counter() - self._t0
+        if self.tracer.sink is None:
+            return
+        span = {
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": self.context.service,
+            "start": round(self.start, 6),
+            "duration_ms": round(duration * 1000, 3),
+        }
+        if error is not None:
+            span["error"] = error
+        span.update((key, value) for key, value in self.attributes.items() if value is not None)
+        self.tracer.sink.write(span)
+
+
+class Tracer:
+    """Process-wide tracer: current context, span creation and the optional sink."""
+
+    def __init__(self):
+        self.sink: Optional[SpanSink] = None
+        self.service: Optional[str] = None
+        trace_dir = os.environ.get(TRACE_DIR_ENV)
+        if trace_dir:
+            self.configure(Path(trace_dir) / f"trace-{os.getpid()}.jsonl")
+
+    def configure(self, path: Optional[Path], service: Optional[str] = None) -> None:
+        """Write spans to ``path`` (None stops recording)."""
+        if self.sink is not None:
+            self.sink.flush()
+        self.sink = SpanSink(path) if path is not None else None
+        if self.sink is not None:
+            atexit.register(self.sink.flush)
+        if service:
+            self.service = service
+
+    def set_default_service(self, service: str) -> None:
+        """Name spans created outside any request after this process's first server."""
+        if self.service is None:
+            self.service = service
+
+    def flush(self) -> None:
+        if self.sink is not None:
+            self.sink.flush()
+
+    @staticmethod
+    def current() -> Optional[SpanContext]:
+        return _current.get()
+
+    @contextmanager
+    def trace(self, trace_id: Optional[str] = None):
+        """Run the block as a new root of ``trace_id`` (a fresh trace by default)."""
+        token = _current.set(SpanContext(trace_id or new_trace_id(), None, self.service))
+        try:
+            yield
+        finally:
+            _current.reset(token)
+
+    def start_span(self, name: str, kind: str, parent: SpanContext,
+                   service: Optional[str] = None, **attributes) -> Span:
+        """Child span of ``parent`` (not made current; see ``activate``)."""
+        context = SpanContext(parent.trace_id, new_span_id(), service or parent.service or self.service)
+        return Span(self, context, parent.span_id, name, kind, attributes)
+
+    @staticmethod
+    def activate(span: Span):
+        """Make ``span`` the parent of calls in this context; returns a reset token."""
+        return _current.set(span.context)
+
+    @staticmethod
+    def deactivate(token) -> None:
+        _current.reset(token)
+
+    def event(self, name: str, trace_id: str, **attributes) -> None:
+        """Record an instant in ``trace_id`` (e.g., a result recorded from a batch)."""
+        if self.sink is not None:
+            Span(self, SpanContext(trace_id, new_span_id(), self.service), None,
+                 name, "event", attributes).end()
+
+    @staticmethod
+    def inject(params: Dict, span: Span) -> None:
+        """Carry ``span`` as the parent in a JSON-RPC request's params."""
+        params.setdefault("_meta", {})["traceparent"] = span.traceparent
+
+    @staticmethod
+    def extract(payload) -> Optional[SpanContext]:
+        """Caller's context from a JSON-RPC request, or None if it carries none."""
+        if not isinstance(payload, dict):
+            return None
+        params = payload.get("params")
+        meta = params.get("_meta") if isinstance(params, dict) else None
+        parsed = parse_traceparent(meta.get("traceparent")) if isinstance(meta, dict) else None
+        return SpanContext(parsed[0], parsed[1], None) if parsed else None
+
+
+tracer = Tracer()
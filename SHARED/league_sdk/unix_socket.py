@@ -0,0 +1,81 @@
+"""
+Unix domain socket endpoints for co-located agents.
+
+An agent started with ``--uds PATH`` serves its MCP app on the Unix socket in
+addition to its TCP port and advertises a ``unix://`` contact endpoint:
+
+    unix:///tmp/league/REF01.sock/mcp          ->  socket /tmp/league/REF01.sock, path /mcp
+    unix:///tmp/league/hosts.sock/mcp/H001     ->  socket /tmp/league/hosts.sock, path /mcp/H001
+
+The socket path is everything up to and including ``.sock``, so socket files
+must use that suffix. MCPClient sends requests to such endpoints over the
+socket (plain HTTP/1.1, no TCP), and the handlers are unchanged.
+"""
+
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+UNIX_SCHEME = "unix://"
+SOCKET_SUFFIX = ".sock"
+
+
+def is_unix_endpoint(endpoint: str) -> bool:
+    return endpoint.startswith(UNIX_SCHEME)
+
+
+def unix_endpoint(socket_path: str, http_path: str = "/mcp") -> str:
+    """Contact endpoint of an MCP app served on a Unix socket."""
+    return f"{UNIX_SCHEME}{os.path.abspath(socket_path)}{http_path}"
+
+
+def split_unix_endpoint(endpoint: str) -> Tuple[str, str]:
+    """
+    Split a ``unix://`` endpoint into (socket path, HTTP URL to request).
+
+    Raises:
+        ValueError: If the endpoint has no ``.sock`` socket path
+    """
+    rest = endpoint[len(UNIX_SCHEME):]
+    end = rest.find(SOCKET_SUFFIX)
+    if end < 0:
+        raise ValueError(f"Unix endpoint needs a socket path ending in {SOCKET_SUFFIX}: {endpoint}")
+    end += len(SOCKET_SUFFIX)
+    return rest[:end], f"http://localhost{rest[end:] or '/mcp'}"
+
+
+def tcp_socket(host: str, port: int, reuse_port: bool = False) -> socket.socket:
+    """Bound TCP listening socket (uvicorn listens on it)."""
+    # Resolve like uvicorn does; the explicit IPPROTO_TCP lets asyncio set TCP_NODELAY
+    family, kind, proto, _, address = socket.getaddrinfo(
+        host, port, socket.AF_UNSPEC, socket.SOCK_STREAM, socket.IPPROTO_TCP
+    )[0]
+    sock = socket.socket(family, kind, proto)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(address)
+    return sock
+
+
+def unix_socket(path: str) -> socket.socket:
+    """Bound Unix stream socket; a stale socket file from an earlier run is replaced."""
+    socket_path = Path(path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists() and stat.S_ISSOCK(socket_path.stat().st_mode):
+        socket_path.unlink()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path))
+    # Only the user running the agents may connect
+    os.chmod(socket_path, 0o600)
+    return sock
+
+
+def server_sockets(host: str, port: int, uds_path: Optional[str] = None) -> List[socket.socket]:
+    """Sockets for ``uvicorn.Server.serve(sockets=...)``: TCP, plus the Unix socket if given."""
+    sockets = [tcp_socket(host, port)]
+    if uds_path:
+        sockets.append(unix_socket(uds_path))
+    return sockets
@@ -0,0 +1,142 @@
+"""
+WebSocket transport for MCP JSON-RPC calls.
+
+MCPClient(transport="websocket") keeps one persistent WebSocket per peer
+endpoint and multiplexes concurrent requests over it; responses are matched
+to callers by JSON-RPC id. MCPServer accepts these connections at
+``<endpoint>/ws`` (e.g. ``ws://localhost:8101/mcp/ws``).
+
+The ``websockets`` package is optional. Without it, or when a peer does not
+accept the upgrade, the pool reports the endpoint as unavailable for a while
+and the client uses plain HTTP instead.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import websockets
+except ImportError:  # optional dependency
+    websockets = None
+
+
+def websocket_url(endpoint: str) -> Optional[str]:
+    """WebSocket URL of an HTTP MCP endpoint (http://h:1/mcp -> ws://h:1/mcp/ws)."""
+    if endpoint.startswith("https://"):
+        return "wss://" + endpoint[len("https://"):].rstrip("/") + "/ws"
+    if endpoint.startswith("http://"):
+        return "ws://" + endpoint[len("http://"):].rstrip("/") + "/ws"
+    return None
+
+
+class ConnectionLost(Exception):
+    """The WebSocket closed while a request was waiting for its response."""
+
+
+class WebSocketConnection:
+    """One persistent WebSocket carrying many concurrent JSON-RPC requests."""
+
+    def __init__(self, ws, url: str):
+        self.ws = ws
+        self.url = url
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.closed = False
+        self._ids = itertools.count(1)
+        self.logger = logging.getLogger(__name__)
+        self._reader = asyncio.create_task(self._read())
+
+    async def request(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and wait for the response with the same id."""
+        if self.closed:
+            raise ConnectionLost(f"WebSocket to {self.url} is closed")
+        # Ids are unique per connection, whatever the caller chose
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            await self.ws.send(json.dumps({**payload, "id": request_id}))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(request_id, None)
+
+    async def _read(self) -> None:
+        try:
+            async for message in self.ws:
+                try:
+                    response = json.loads(message)
+                except ValueError:
+                    self.logger.warning(f"Invalid JSON on {self.url}")
+                    continue
+                future = self.pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            self.logger.debug(f"WebSocket {self.url} closed: {e}")
+        finally:
+            self.closed = True
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionLost(f"WebSocket to {self.url} closed"))
+
+    async def close(self) -> None:
+        self.closed = True
+        await self.ws.close()
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class WebSocketPool:
+    """One WebSocketConnection per endpoint, opened on first use."""
+
+    def __init__(self, open_timeout: float, retry_after_sec: float = 60.0):
+        """
+        Args:
+            open_timeout: Seconds allowed for the WebSocket handshake
+            retry_after_sec: How long an endpoint that refused WebSocket uses HTTP
+        """
+        self.open_timeout = open_timeout
+        self.retry_after_sec = retry_after_sec
+        self.connections: Dict[str, WebSocketConnection] = {}
+        self._opening: Dict[str, asyncio.Task] = {}
+        self._unavailable_until: Dict[str, float] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def available(self) -> bool:
+        return websockets is not None
+
+    async def get(self, endpoint: str) -> Optional[WebSocketConnection]:
+        """Open connection to ``endpoint``, or None if HTTP should be used."""
+        connection = self.connections.get(endpoint)
+        if connection is not None and not connection.closed:
+            return connection
+        url = websocket_url(endpoint)
+        if websockets is None or url is None:
+            return None
+        if self._unavailable_until.get(endpoint, 0.0) > time.monotonic():
+            return None
+        # Concurrent first calls share one handshake
+        opening = self._opening.get(endpoint)
+        if opening is None:
+            opening = asyncio.create_task(self._open(endpoint, url))
+            self._opening[endpoint] = opening
+            opening.add_done_callback(lambda _: self._opening.pop(endpoint, None))
+        return await asyncio.shield(opening)
+
+    async def _open(self, endpoint: str, url: str) -> Optional[WebSocketConnection]:
+        try:
+            ws = await asyncio.wait_for(websockets.connect(url, max_size=None), self.open_timeout)
+        except Exception as e:
+            self._unavailable_until[endpoint] = time.monotonic() + self.retry_after_sec
+            self.logger.info(f"WebSocket unavailable for {endpoint} ({e}); using HTTP")
+            return None
+        connection = WebSocketConnection(ws, url)
+        self.connections[endpoint] = connection
+        return connection
+
+    async def close(self) -> None:
+        connections, self.connections = list(self.connections.values()), {}
+        await asyncio.gather(*(c.close() for c in connections), return_exceptions=True)
@@ -0,0 +1,5 @@
+"""Make league_sdk importable however pytest is started (repo root or SHARED/)."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,77 @@
+"""Tests for league_sdk.batcher."""
+import asyncio
+
+from league_sdk.batcher import MessageBatcher
+
+
+class Recorder:
+    """Flush callback that records batches and fails a given number of times."""
+
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.failures = failures
+
+    async def __call__(self, batch):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("league manager unreachable")
+        self.batches.append(list(batch))
+
+
+def test_flushes_when_batch_is_full():
+    async def scenario():
+        recorder = Recorder()
+        batcher = MessageBatcher(recorder, max_batch_size=3, max_wait_sec=60)
+        for item in range(7):
+            batcher.add(item)
+        await asyncio.sleep(0)
+        assert recorder.batches == [[0, 1, 2], [3, 4, 5]]
+        assert batcher.pending_count == 1
+        await batcher.flush()
+        assert recorder.batches[-1] == [6]
+
+    asyncio.run(scenario())
+
+
+def test_flushes_after_time_window():
+    async def scenario():
+        recorder = Recorder()
+        batcher = MessageBatcher(recorder, max_batch_size=100, max_wait_sec=0.01)
+        batcher.add("a")
+        batcher.add("b")
+        assert recorder.batches == []
+        await asyncio.sleep(0.05)
+        assert recorder.batches == [["a", "b"]]
+        assert batcher.pending_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_batch_is_retried_with_later_items():
+    async def scenario():
+        recorder = Recorder(failures=2)
+        batcher = MessageBatcher(recorder, max_batch_size=2, max_wait_sec=0.01,
+                                 retry_delay=0.01, max_retry_delay=0.02)
+        batcher.add(1)
+        batcher.add(2)
+        await asyncio.sleep(0)
+        batcher.add(3)
+        await asyncio.sleep(0.2)
+        assert recorder.batches == [[1, 2, 3]]
+        assert batcher.pending_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_flush_keeps_items_of_a_failed_batch():
+    async def scenario():
+        recorder = Recorder(failures=1)
+        batcher = MessageBatcher(recorder, max_batch_size=10, max_wait_sec=60, retry_delay=60)
+        batcher.add("x")
+        await batcher.flush()
+        assert recorder.batches == []
+        assert batcher.pending_count == 1
+        await batcher.flush()
+        assert recorder.batches == [["x"]]
+
+    asyncio.run(scenario())
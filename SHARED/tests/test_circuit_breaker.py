@@ -0,0 +1,89 @@
+"""Tests for league_sdk.circuit_breaker."""
+import pytest
+
+from league_sdk.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitOpenError, HealthTracker, backoff_delay,
+)
+
+ENDPOINT = "http://localhost:8101/mcp"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def tripped_tracker(clock):
+    health = HealthTracker(failure_threshold=3, open_sec=2.0, max_open_sec=60.0, clock=clock)
+    for _ in range(3):
+        health.acquire(ENDPOINT)
+        health.record_failure(ENDPOINT, "timeout")
+    return health
+
+
+def test_backoff_delay_stays_within_jittered_bounds():
+    for attempt in range(8):
+        cap = min(10.0, 0.5 * 2 ** attempt)
+        assert cap / 2 <= backoff_delay(attempt, 0.5, 10.0) <= cap
+    assert backoff_delay(3, 1.0, 30.0, rng=lambda low, high: high) == 8.0
+
+
+def test_opens_after_consecutive_failures():
+    clock = FakeClock()
+    health = HealthTracker(failure_threshold=3, clock=clock)
+    health.record_failure(ENDPOINT, "timeout")
+    health.record_failure(ENDPOINT, "timeout")
+    health.record_success(ENDPOINT)
+    health.record_failure(ENDPOINT, "timeout")
+    assert health.state(ENDPOINT) == CLOSED
+
+    health = tripped_tracker(clock)
+    assert health.state(ENDPOINT) == OPEN
+    assert health.is_down(ENDPOINT)
+    with pytest.raises(CircuitOpenError):
+        health.acquire(ENDPOINT)
+
+
+def test_half_open_admits_a_single_probe():
+    clock = FakeClock()
+    health = tripped_tracker(clock)
+    clock.now += 2.0
+    assert health.state(ENDPOINT) == HALF_OPEN
+    health.acquire(ENDPOINT)
+    with pytest.raises(CircuitOpenError) as error:
+        health.acquire(ENDPOINT)
+    assert error.value.retry_in == 0.0
+
+
+def test_successful_probe_closes():
+    clock = FakeClock()
+    health = tripped_tracker(clock)
+    clock.now += 2.0
+    health.acquire(ENDPOINT)
+    health.record_success(ENDPOINT)
+    assert health.state(ENDPOINT) == CLOSED
+    health.acquire(ENDPOINT)
+
+
+def test_failed_probe_reopens_for_longer():
+    clock = FakeClock()
+    health = tripped_tracker(clock)
+    clock.now += 2.0
+    health.acquire(ENDPOINT)
+    health.record_failure(ENDPOINT, "refused")
+    assert health.state(ENDPOINT) == OPEN
+    # Second trip: between 2 and 4 seconds
+    retry_in = health.snapshot()[ENDPOINT]["retry_in_sec"]
+    assert 2.0 <= retry_in <= 4.0
+
+
+def test_release_frees_the_probe_slot():
+    clock = FakeClock()
+    health = tripped_tracker(clock)
+    clock.now += 2.0
+    health.acquire(ENDPOINT)
+    health.release(ENDPOINT)
+    health.acquire(ENDPOINT)
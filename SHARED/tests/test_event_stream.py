@@ -0,0 +1,46 @@
+"""Tests for league_sdk.event_stream."""
+import asyncio
+
+from league_sdk.event_stream import EventHub, format_sse
+
+
+async def read_all(hub, subscription):
+    return [frame async for frame in hub.stream(subscription, heartbeat_sec=0.05)]
+
+
+def test_full_subscriber_is_disconnected_after_its_queued_frames():
+    async def scenario():
+        hub = EventHub(max_queue=3)
+        subscription = hub.subscribe("P01")
+        for index in range(3):
+            assert hub.publish("P01", "notify_round", {"round_id": index})
+        assert not hub.publish("P01", "notify_round", {"round_id": 3})
+        assert subscription.closed
+        frames = await read_all(hub, subscription)
+        assert frames[1:] == [format_sse("notify_round", {"round_id": index}, index + 1)
+                              for index in range(3)]
+        assert not hub.is_subscribed("P01")
+
+    asyncio.run(scenario())
+
+
+def test_close_wakes_an_idle_stream():
+    async def scenario():
+        hub = EventHub()
+        subscription = hub.subscribe("P01")
+
+        async def publish_then_close():
+            await asyncio.sleep(0.01)
+            hub.publish("P01", "notify_round", {"round_id": 1})
+            await asyncio.sleep(0.01)
+            subscription.close()
+
+        closer = asyncio.ensure_future(publish_then_close())
+        frames = await asyncio.wait_for(read_all(hub, subscription), 1)
+        await closer
+        assert frames == [
+            format_sse("subscribed", {"subscriber": "P01"}),
+            format_sse("notify_round", {"round_id": 1}, 1),
+        ]
+
+    asyncio.run(scenario())
@@ -0,0 +1,48 @@
+"""Tests for tool results, standings and technical losses in league_sdk.helpers."""
+from league_sdk.helpers import calculate_standings, technical_loss_result, tool_result
+
+
+def by_player(standings):
+    return {row["player_id"]: row for row in standings}
+
+
+def test_tool_result_unwraps_mcp_content():
+    assert tool_result({"content": [{"type": "text", "text": '{"status": "OK"}'}]}) == {"status": "OK"}
+    assert tool_result({"status": "OK"}) == {"status": "OK"}
+    assert tool_result({"content": [{"type": "text", "text": "not json"}]}) == {}
+    assert tool_result(None) == {}
+
+
+def test_single_technical_loss_is_a_win_for_the_opponent():
+    result = technical_loss_result("P01", "P02", {"P02"}, {"P01": "even", "P02": None})
+    assert result["winner"] == "P01"
+    assert result["score"] == {"P01": 3, "P02": 0}
+    assert result["details"]["technical_loss"] == ["P02"]
+
+    rows = by_player(calculate_standings({"R1M1": result}))
+    assert (rows["P01"]["wins"], rows["P01"]["points"]) == (1, 3)
+    assert (rows["P02"]["losses"], rows["P02"]["points"]) == (1, 0)
+
+
+def test_double_technical_loss_is_a_loss_for_both():
+    result = technical_loss_result("P01", "P02", ["P01", "P02"])
+    assert result["winner"] is None
+    rows = by_player(calculate_standings({"R1M1": result}))
+    for player_id in ("P01", "P02"):
+        assert rows[player_id]["losses"] == 1
+        assert rows[player_id]["draws"] == 0
+        assert rows[player_id]["points"] == 0
+
+
+def test_draw_and_win_are_ranked_with_technical_losses():
+    results = {
+        "R1M1": {"winner": None, "score": {"P01": 1, "P02": 1}, "details": {}},
+        "R1M2": technical_loss_result("P03", "P04", ["P03", "P04"]),
+        "R2M1": {"winner": "P03", "score": {"P03": 3, "P01": 0}},
+    }
+    standings = calculate_standings(results)
+    assert [row["player_id"] for row in standings] == ["P03", "P01", "P02", "P04"]
+    assert [row["rank"] for row in standings] == [1, 2, 3, 4]
+    rows = by_player(standings)
+    assert (rows["P01"]["draws"], rows["P01"]["losses"]) == (1, 1)
+    assert (rows["P03"]["wins"], rows["P03"]["losses"]) == (1, 1)
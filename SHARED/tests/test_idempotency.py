@@ -0,0 +1,106 @@
+"""Tests for league_sdk.idempotency."""
+import asyncio
+
+from league_sdk.idempotency import ResponseCache, inject, request_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def call(tool, arguments, key=None):
+    params = {"name": tool, "arguments": arguments}
+    if key is not None:
+        inject(params, key)
+    return {"jsonrpc": "2.0", "method": "tools/call", "params": params, "id": 1}
+
+
+def test_request_key_uses_sender_and_idempotency_key():
+    payload = call("report_match_results", {"sender": "referee:REF01"}, key="c1-7")
+    assert request_key(payload) == "referee:REF01|c1-7"
+
+
+def test_request_key_falls_back_to_conversation_for_dedupe_tools():
+    payload = call("register_player", {"sender": "player:P01", "conversation_id": "register-P01-ab"})
+    assert request_key(payload) is None
+    assert request_key(payload, {"register_player"}) == "player:P01|register_player|register-P01-ab"
+
+
+def test_request_key_ignores_malformed_requests():
+    assert request_key(None) is None
+    assert request_key({"params": "x"}) is None
+    assert request_key(call("get_standings", {})) is None
+
+
+def test_duplicates_in_flight_share_one_execution():
+    async def scenario():
+        cache = ResponseCache()
+        calls = []
+        release = asyncio.Event()
+
+        async def execute():
+            calls.append(1)
+            await release.wait()
+            return {"result": len(calls)}
+
+        first = asyncio.ensure_future(cache.run("k", execute))
+        second = asyncio.ensure_future(cache.run("k", execute))
+        await asyncio.sleep(0)
+        release.set()
+        assert await first == ({"result": 1}, False)
+        assert await second == ({"result": 1}, True)
+        assert calls == [1]
+
+    asyncio.run(scenario())
+
+
+def test_stored_response_expires_after_ttl():
+    async def scenario():
+        clock = FakeClock()
+        cache = ResponseCache(ttl_sec=10, clock=clock)
+        counter = iter(range(1, 100))
+
+        async def execute():
+            return {"result": next(counter)}
+
+        assert await cache.run("k", execute) == ({"result": 1}, False)
+        clock.now = 9.0
+        assert await cache.run("k", execute) == ({"result": 1}, True)
+        clock.now = 10.5
+        assert await cache.run("k", execute) == ({"result": 2}, False)
+
+    asyncio.run(scenario())
+
+
+def test_error_responses_are_not_stored():
+    async def scenario():
+        cache = ResponseCache()
+        responses = iter([{"error": {"code": -32001}}, {"result": "ok"}])
+
+        async def execute():
+            return next(responses)
+
+        assert await cache.run("k", execute) == ({"error": {"code": -32001}}, False)
+        assert await cache.run("k", execute) == ({"result": "ok"}, False)
+        assert len(cache) == 1
+
+    asyncio.run(scenario())
+
+
+def test_oldest_entries_are_evicted():
+    async def scenario():
+        cache = ResponseCache(max_entries=2)
+
+        async def execute():
+            return {"result": None}
+
+        for key in ("a", "b", "c"):
+            await cache.run(key, execute)
+        assert len(cache) == 2
+        assert (await cache.run("a", execute))[1] is False
+
+    asyncio.run(scenario())
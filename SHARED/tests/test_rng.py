@@ -0,0 +1,43 @@
+"""Tests for league_sdk.game_rules.rng."""
+from league_sdk.game_rules.even_odd import EvenOddRules
+from league_sdk.game_rules.rng import (
+    SeededRandomProvider, SystemRandomProvider, create_rng_provider, derive_seed,
+    match_stream_key, replay_draw, replay_draws,
+)
+
+LEAGUE = "league_2025_even_odd"
+MATCHES = [f"R{r}M{m}" for r in range(1, 4) for m in range(1, 4)]
+
+
+def test_derive_seed_is_stable():
+    assert derive_seed(42, "a:R1M1") == derive_seed("42", "a:R1M1")
+    assert derive_seed(42, "a:R1M1") != derive_seed(42, "b:R1M1")
+    assert derive_seed(42, "a:R1M1") != derive_seed(43, "a:R1M1")
+    assert 0 <= derive_seed(42, "x") < 2 ** 64
+
+
+def test_draw_comes_from_the_key_seed():
+    provider = SeededRandomProvider(42)
+    key = match_stream_key(LEAGUE, "R1M1")
+    assert provider.seed_for(key) == derive_seed(42, key)
+    assert provider.draw(key, 1, 10) == 1 + derive_seed(42, key) % 10
+    assert provider.draw(key, 1, 10) == provider.draw(key, 1, 10)
+
+
+def test_create_rng_provider():
+    assert isinstance(create_rng_provider(), SystemRandomProvider)
+    assert isinstance(create_rng_provider(7), SeededRandomProvider)
+
+
+def test_replay_matches_referee_draws_in_any_order():
+    game = EvenOddRules(create_rng_provider(42))
+    drawn = {match_id: game.draw_number(match_id, LEAGUE) for match_id in reversed(MATCHES)}
+    assert replay_draws(42, LEAGUE, MATCHES) == drawn
+    assert all(replay_draw(42, LEAGUE, match_id) == number for match_id, number in drawn.items())
+
+
+def test_leagues_draw_independent_streams():
+    provider = SeededRandomProvider(42)
+    first = [provider.stream(match_stream_key("league_a", m)).random() for m in MATCHES]
+    second = [provider.stream(match_stream_key("league_b", m)).random() for m in MATCHES]
+    assert first != second
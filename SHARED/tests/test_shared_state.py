@@ -0,0 +1,48 @@
+"""Tests for league_sdk.shared_state."""
+import pytest
+
+from league_sdk.shared_state import SEQ, SEQ_OFFSET, SeqlockBuffer
+
+
+def test_read_before_publish_returns_none(tmp_path):
+    writer = SeqlockBuffer(tmp_path / "state", capacity=1024)
+    assert writer.read() is None
+    assert SeqlockBuffer(tmp_path / "state").read_json() is None
+
+
+def test_reader_sees_each_published_version(tmp_path):
+    writer = SeqlockBuffer(tmp_path / "state", capacity=1024)
+    reader = SeqlockBuffer(tmp_path / "state")
+    assert writer.publish_json({"round": 1}) == 1
+    assert reader.read_json() == (1, {"round": 1})
+    assert writer.publish(b"short") == 2
+    assert reader.read() == (2, b"short")
+    assert reader.sequence == 4
+
+
+def test_reader_is_read_only(tmp_path):
+    SeqlockBuffer(tmp_path / "state", capacity=16)
+    with pytest.raises(PermissionError):
+        SeqlockBuffer(tmp_path / "state").publish(b"x")
+
+
+def test_payload_larger_than_capacity_is_refused(tmp_path):
+    writer = SeqlockBuffer(tmp_path / "state", capacity=4)
+    with pytest.raises(ValueError):
+        writer.publish(b"too long")
+
+
+def test_write_in_progress_is_never_read(tmp_path):
+    writer = SeqlockBuffer(tmp_path / "state", capacity=64)
+    writer.publish(b"complete")
+    # A writer stalled mid-write leaves the sequence odd
+    SEQ.pack_into(writer._mmap, SEQ_OFFSET, 3)
+    with pytest.raises(TimeoutError):
+        SeqlockBuffer(tmp_path / "state").read(max_attempts=5)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SeqlockBuffer(path)
@@ -0,0 +1,61 @@
+"""Tests for league_sdk.standings_delta."""
+from league_sdk.standings_delta import (
+    UPDATE_DELTA, UPDATE_FULL, StandingsHistory, StandingsReplica,
+)
+
+
+def table(points):
+    """Standings rows ranked by the given points per player."""
+    ranked = sorted(points.items(), key=lambda item: (-item[1], item[0]))
+    return [
+        {"player_id": player_id, "rank": rank, "points": value, "played": 1}
+        for rank, (player_id, value) in enumerate(ranked, start=1)
+    ]
+
+
+def test_first_update_is_full():
+    history = StandingsHistory()
+    history.publish(table({"P01": 3, "P02": 0}))
+    update = history.update_for(None)
+    assert update["update_mode"] == UPDATE_FULL
+    replica = StandingsReplica()
+    assert replica.apply(update)
+    assert replica.standings() == history.full()
+    assert replica.version == 1
+
+
+def test_delta_carries_only_changed_rows_and_round_trips():
+    history = StandingsHistory()
+    replica = StandingsReplica()
+    history.publish(table({"P01": 3, "P02": 0, "P03": 1}))
+    replica.apply(history.update_for(None))
+
+    history.publish(table({"P01": 6, "P02": 0, "P03": 1}))
+    update = history.update_for(replica.version)
+    assert update["update_mode"] == UPDATE_DELTA
+    assert update["base_version"] == 1
+    assert [row["player_id"] for row in update["standings"]] == ["P01"]
+    assert replica.apply(update)
+    assert replica.standings() == history.full()
+    assert replica.version == 2
+
+
+def test_delta_for_another_version_is_not_applied():
+    history = StandingsHistory()
+    replica = StandingsReplica()
+    history.publish(table({"P01": 3, "P02": 0}))
+    replica.apply(history.update_for(None))
+    history.publish(table({"P01": 3, "P02": 3}))
+    history.publish(table({"P01": 3, "P02": 6}))
+    stale = history.update_for(2)
+    assert not replica.apply(stale)
+    assert replica.resyncs_needed == 1
+    assert replica.version == 1
+
+
+def test_expired_base_version_gets_full_table():
+    history = StandingsHistory(max_versions=2)
+    for points in range(4):
+        history.publish(table({"P01": points, "P02": 0}))
+    assert history.update_for(1)["update_mode"] == UPDATE_FULL
+    assert history.update_for(3)["update_mode"] == UPDATE_DELTA
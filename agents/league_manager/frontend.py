@@ -0,0 +1,260 @@
+"""League Manager - Multi-process HTTP front end.
+
+In front-end mode the LeagueManager process owns all league state and serves
+on an internal owner port. It publishes a snapshot of that state to a
+memory-mapped SeqlockBuffer. Front-end worker processes share the public port
+(SO_REUSEPORT) and:
+  - answer read-only queries (handle_league_query, get_standings) from the
+    snapshot with the regular LeagueHandlers code;
+  - forward every other request (registration, result reports, unknown
+    tokens) unchanged to the owner;
+  - relay event stream subscriptions (``GET /mcp/events``) to the owner,
+    which authenticates the subscriber and publishes its events.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+from fastapi import Request, WebSocket
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from league_sdk.mcp_server import MCPServer
+from league_sdk.shared_state import SeqlockBuffer
+from league_sdk.unix_socket import tcp_socket
+
+# Tools answered by front-end workers; everything else goes to the owner
+READ_ONLY_TOOLS = ("handle_league_query", "get_standings")
+
+
+def default_snapshot_path(league_id: str) -> Path:
+    """Snapshot file on tmpfs when available."""
+    shm = Path("/dev/shm")
+    root = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return root / f"league_{league_id}.state"
+
+
+def token_digest(token: str) -> str:
+    """Digest published instead of the auth token itself."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _standings_fields(result: Dict) -> Dict:
+    """The parts of a match result calculate_standings reads."""
+    fields = {"winner": result.get("winner"), "score": result.get("score", {})}
+    technical_loss = result.get("details", {}).get("technical_loss")
+    if technical_loss:
+        fields["details"] = {"technical_loss": technical_loss}
+    return fields
+
+
+def state_snapshot(manager) -> Dict:
+    """Read-side league state published to front-end workers."""
+    tokens = {f"player:{pid}": token_digest(t) for pid, t in manager.player_tokens.items()}
+    tokens.update({f"referee:{rid}": token_digest(t) for rid, t in manager.referee_tokens.items()})
+    return {
+        "league_id": manager.league_id,
+        "players": manager.players,
+        # Standings need winner, score and who lost by technical loss
+        "results": {
+            match_id: _standings_fields(result)
+            for match_id, result in manager.results.items()
+        },
+        "schedule": manager.schedule,
+        "completed_matches": sorted(manager.completed_matches),
+        "referee_endpoints": manager.referee_endpoints,
+        "token_digests": tokens,
+    }
+
+
+class StatePublisher:
+    """Publish the owner's league state whenever it changed."""
+
+    def __init__(self, manager, buffer: SeqlockBuffer, interval_sec: float = 0.25):
+        self.manager = manager
+        self.buffer = buffer
+        self.interval_sec = interval_sec
+        self._signature = None
+
+    def _current_signature(self):
+        m = self.manager
+        return (len(m.players), len(m.referees), len(m.results),
+                len(m.schedule), len(m.completed_matches))
+
+    def publish_if_changed(self) -> bool:
+        """Publish a new snapshot if the league state grew since the last one."""
+        signature = self._current_signature()
+        if signature == self._signature:
+            return False
+        version = self.buffer.publish_json(state_snapshot(self.manager))
+        self._signature = signature
+        logging.debug(f"Published league state snapshot v{version}")
+        return True
+
+    async def run(self):
+        """Publish periodically until cancelled."""
+        while True:
+            self.publish_if_changed()
+            await asyncio.sleep(self.interval_sec)
+
+
+class ManagerStateView:
+    """
+    Read-only stand-in for LeagueManager built from the latest snapshot.
+
+    Provides the attributes LeagueHandlers reads for queries, so front-end
+    workers answer them with exactly the same code as the owner.
+    """
+
+    def __init__(self, buffer: SeqlockBuffer, mcp_server: MCPServer):
+        self.buffer = buffer
+        self.mcp_server = mcp_server
+        self.version = 0
+        self.league_id = None
+        self.players: Dict = {}
+        self.results: Dict = {}
+        self.schedule: List = []
+        self.completed_matches = set()
+        self.referee_endpoints: List[str] = []
+        self.token_digests: Dict[str, str] = {}
+        self._sequence = None
+
+    def refresh(self) -> None:
+        """Load the latest snapshot if the owner published a new one."""
+        sequence = self.buffer.sequence
+        if sequence == self._sequence:
+            return
+        snapshot = self.buffer.read_json()
+        if snapshot is None:
+            return
+        self.version, state = snapshot
+        self.league_id = state["league_id"]
+        self.players = state["players"]
+        self.results = state["results"]
+        self.schedule = [tuple(match) for match in state["schedule"]]
+        self.completed_matches = set(state["completed_matches"])
+        self.referee_endpoints = state["referee_endpoints"]
+        self.token_digests = state["token_digests"]
+        self._sequence = sequence
+
+    def _validate_auth_token(self, sender: str, provided_token: str) -> bool:
+        """Validate a token against the published digests."""
+        expected = self.token_digests.get(sender)
+        if not provided_token or expected is None:
+            return False
+        return hmac.compare_digest(expected, token_digest(provided_token))
+
+
+class FrontendServer(MCPServer):
+    """Front-end worker: local read-only queries, everything else forwarded."""
+
+    def __init__(self, name: str, buffer: SeqlockBuffer, owner_url: str):
+        super().__init__(name)
+        from handlers import LeagueHandlers
+        self.view = ManagerStateView(buffer, self)
+        self.owner_url = owner_url
+        self.owner = httpx.AsyncClient(timeout=30)
+        handlers = LeagueHandlers(self.view)
+        for tool_name in READ_ONLY_TOOLS:
+            self.register_tool(tool_name, getattr(handlers, tool_name))
+
+    async def handle_mcp_request(self, request: Request) -> Response:
+        """Serve read-only tool calls locally and forward the rest to the owner."""
+        body = await request.body()
+        try:
+            payload = json.loads(body)
+        except Exception:
+            return JSONResponse(self.parse_error())
+        if self._is_local(payload):
+            return JSONResponse(await self.dispatch(payload))
+        response = await self.owner.post(self.owner_url, content=body,
+                                         headers={"content-type": "application/json"})
+        return Response(response.content, status_code=response.status_code,
+                        media_type="application/json")
+
+    async def handle_subscribe(self, request: Request) -> Response:
+        """Relay an event stream subscription to the owner, which publishes the events."""
+        headers = {"accept": "text/event-stream"}
+        if "authorization" in request.headers:
+            headers["authorization"] = request.headers["authorization"]
+        upstream = self.owner.build_request(
+            "GET", f"{self.owner_url.rstrip('/')}/events", params=request.query_params,
+            headers=headers, timeout=httpx.Timeout(30, read=None)
+        )
+        try:
+            response = await self.owner.send(upstream, stream=True)
+        except httpx.HTTPError as e:
+            logging.warning(f"Owner unreachable for subscription: {e}")
+            return JSONResponse(self.create_league_error("E000", "OWNER_UNAVAILABLE"), status_code=503)
+        if response.status_code != 200:
+            body = await response.aread()
+            await response.aclose()
+            return Response(body, status_code=response.status_code, media_type="application/json")
+
+        async def relay():
+            try:
+                async for chunk in response.aiter_raw():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return StreamingResponse(
+            relay(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    async def handle_websocket(self, websocket: WebSocket) -> None:
+        """Refuse WebSocket upgrades so clients fall back to HTTP (and get forwarded)."""
+        await websocket.close(code=1008)
+
+    def _is_local(self, payload) -> bool:
+        if not isinstance(payload, dict) or payload.get("method") != "tools/call":
+            return False
+        params = payload.get("params") or {}
+        if params.get("name") not in READ_ONLY_TOOLS:
+            return False
+        self.view.refresh()
+        if self.view.version == 0:
+            return False
+        if params["name"] == "handle_league_query":
+            # Tokens issued after the last snapshot are only known to the owner
+            args = params.get("arguments") or {}
+            return self.view._validate_auth_token(args.get("sender", ""), args.get("auth_token", ""))
+        return True
+
+
+def run_frontend_worker(index: int, host: str, port: int, owner_url: str, snapshot_path: str):
+    """Process entry point of one front-end worker."""
+    import uvicorn
+    logging.basicConfig(level=logging.WARNING)
+    server = FrontendServer(f"LeagueFrontend-{index}", SeqlockBuffer(snapshot_path), owner_url)
+    config = uvicorn.Config(server.app, log_level="warning")
+    asyncio.run(uvicorn.Server(config).serve(sockets=[tcp_socket(host, port, reuse_port=True)]))
+
+
+def start_frontend_workers(
+    count: int, host: str, port: int, owner_url: str, snapshot_path: Path
+) -> List[multiprocessing.Process]:
+    """Start front-end worker processes sharing the public port."""
+    context = multiprocessing.get_context("spawn")
+    workers = []
+    for index in range(count):
+        process = context.Process(
+            target=run_frontend_worker,
+            args=(index, host, port, owner_url, str(snapshot_path)),
+            name=f"league-frontend-{index}",
+            daemon=True,
+        )
+        process.start()
+        workers.append(process)
+    logging.info(f"Started {count} front-end workers on {host}:{port} (pid {os.getpid()} owns state)")
+    return workers
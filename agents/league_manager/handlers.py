@@ -1,6 +1,6 @@
 """League Manager - Message handler functions."""
 import logging
-from typing import Dict
+from typing import Dict, Optional
 from league_sdk import StandingsRepository
 from league_sdk.helpers import (
     generate_auth_token,
@@ -8,6 +8,7 @@ from league_sdk.helpers import (
     get_iso_timestamp,
     calculate_standings,
 )
+from league_sdk.tracing import trace_id_for, tracer
 
 
 class LeagueHandlers:
@@ -98,7 +99,8 @@ class LeagueHandlers:
             "player_id": player_id,
             "display_name": player_meta.get('display_name', f"Player {player_id}"),
             "endpoint": player_meta['contact_endpoint'],
-            "registered_at": get_iso_timestamp()
+            "registered_at": get_iso_timestamp(),
+            "standings_delta": bool(player_meta.get('standings_delta', False))
         }
         self.manager.player_tokens[player_id] = auth_token
         
@@ -126,9 +128,58 @@ class LeagueHandlers:
                 context={"sender": sender}
             )
         
+        match_id = self._record_result(args)
+        if match_id is None:
+            return {"status": "OK", "duplicate": True}
+        self.manager._save_state()
+        
+        # Check if round is complete
+        await self.manager.scheduler.check_round_completion(match_id)
+        
+        return {"status": "OK"}
+    
+    async def report_match_results(self, args: dict) -> dict:
+        """
+        Receive a batch of match results from a referee.
+        
+        The batch is authenticated once, every MATCH_RESULT_REPORT in
+        `reports` is recorded, then state is persisted and round completion
+        is checked a single time for the whole batch.
+        """
+        sender = args.get('sender', '')
+        auth_token = args.get('auth_token', '')
+        
+        if not self.manager._validate_auth_token(sender, auth_token):
+            logging.warning(f"Invalid auth token from {sender}")
+            return self.manager.mcp_server.create_league_error(
+                "E012", "AUTH_TOKEN_INVALID",
+                original_message_type="MATCH_RESULT_BATCH_REPORT",
+                context={"sender": sender}
+            )
+        
+        match_ids = [self._record_result(report) for report in args.get('reports', [])]
+        match_ids = [match_id for match_id in match_ids if match_id is not None]
+        if not match_ids:
+            return {"status": "OK", "recorded": 0}
+        
+        self.manager._save_state()
+        await self.manager.scheduler.check_rounds_completion(match_ids)
+        
+        return {"status": "OK", "recorded": len(match_ids)}
+    
+    def _record_result(self, report: dict) -> Optional[str]:
+        """
+        Store one MATCH_RESULT_REPORT in league state and return its match_id.
+        
+        A match already recorded keeps its first result and returns None, so
+        a repeated report is not counted towards its round twice.
+        """
         # Extract result data from V2 structure
-        match_id = args.get('match_id')
-        result = args.get('result', {})
+        match_id = report.get('match_id')
+        result = report.get('result', {})
+        if match_id in self.manager.completed_matches:
+            logging.warning(f"Ignoring repeated result for match {match_id}")
+            return None
         
         self.manager.results[match_id] = {
             "winner": result.get('winner'),
@@ -136,13 +187,14 @@ class LeagueHandlers:
             "details": result.get('details', {})
         }
         self.manager.completed_matches.add(match_id)
+        if report.get('conversation_id'):
+            # Closes the match's trace, which the batched report did not carry
+            tracer.event("record_match_result", trace_id_for(report['conversation_id']),
+                         match_id=match_id)
         logging.info(f"Match result recorded: {match_id} ({len(self.manager.completed_matches)}/{self.manager.expected_matches})")
-        self.manager._save_state()
-        
-        # Check if round is complete
-        await self.manager.scheduler.check_round_completion(match_id)
-        
-        return {"status": "OK"}
+        if len(self.manager.completed_matches) >= self.manager.expected_matches:
+            self.manager.all_matches_completed.set()
+        return match_id
     
     async def get_standings(self, args: dict) -> dict:
         """Calculate and return standings."""
@@ -6,9 +6,11 @@ The monolithic src/league_manager.py has been split into:
   - main.py: Entry point, initialization, server startup
   - handlers.py: Message handling logic
   - scheduler.py: Round management and scheduling
+  - multi_league.py: Several leagues in one process
 
 Usage:
   python main.py --league-id league_2025_even_odd
+  python main.py --leagues league_2025_even_odd --league-instances 20
 """
 
 import asyncio
@@ -17,6 +19,8 @@ import json
 import logging
 from pathlib import Path
 import sys
+import time
+from typing import Optional
 import uvicorn
 
 # Add parent directories to path for imports during transition
@@ -24,8 +28,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import from league_sdk (new structure)
 from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.circuit_breaker import CircuitOpenError, backoff_delay
+from league_sdk.helpers import generate_conversation_id, technical_loss_result
 from league_sdk.mcp_server import MCPServer
 from league_sdk.mcp_client import MCPClient
+from league_sdk.standings_delta import StandingsHistory
+from league_sdk.unix_socket import server_sockets
+from league_sdk.tracing import new_trace_id, trace_id_for, tracer
 
 # Import modular components
 from handlers import LeagueHandlers
@@ -39,19 +48,40 @@ class LeagueManager:
     Now using modular architecture with SDK integration.
     """
     
-    def __init__(self, league_id: str):
-        """Initialize League Manager using SDK configuration."""
+    def __init__(
+        self,
+        league_id: str,
+        log_root: Optional[Path] = None,
+        config_id: Optional[str] = None,
+        config_loader: Optional[ConfigLoader] = None,
+        mcp_server: Optional[MCPServer] = None,
+        mcp_client: Optional[MCPClient] = None,
+    ):
+        """
+        Initialize League Manager using SDK configuration.
+        
+        Args:
+            league_id: League identifier
+            log_root: Optional custom log root directory
+            config_id: League configuration to load (defaults to league_id)
+            config_loader: Optional shared ConfigLoader
+            mcp_server: Optional shared server; its tools are then routed by the owner
+            mcp_client: Optional shared client
+        """
         # Load configuration using SDK
-        config_loader = ConfigLoader()
+        config_loader = config_loader or ConfigLoader()
         self.system_config = config_loader.load_system()
-        self.league_config = config_loader.load_league(league_id)
+        self.league_config = config_loader.load_league(config_id or league_id)
         self.agents_config = config_loader.load_agents()
         
         self.league_id = league_id
         self.registration_timeout = self.league_config.settings.registration_timeout_sec
+        # Close registration early once this many agents have joined (None = wait the full timeout)
+        self.expected_players: Optional[int] = None
+        self.expected_referees: Optional[int] = None
         
         # Initialize SDK logger
-        self.logger = JsonLogger("league_manager", league_id=league_id)
+        self.logger = JsonLogger("league_manager", league_id=league_id, log_root=log_root)
         self.logger.info("MANAGER_INITIALIZED", league_id=league_id)
         
         # Player and referee registries
@@ -69,15 +99,33 @@ class LeagueManager:
         self.registration_closed = False
         self.completed_matches = set()
         self.expected_matches = 0
+        # Set by LeagueHandlers._record_result when the last expected match completes
+        self.all_matches_completed = asyncio.Event()
         
         # Round tracking
         self.rounds_info = {}
         self.completed_rounds = set()
         self.total_rounds = 0
+        self.max_rounds = None  # None = full round robin
+        
+        # Delta standings notifications (--standings-delta)
+        self.standings_delta = False
+        self.standings_history = StandingsHistory()
+        self.standings_acks = {}
+        
+        # Shared-memory standings for co-located readers (--standings-snapshot)
+        self.standings_snapshot_path: Optional[Path] = None
+        self._standings_writer = None
+        
+        # Trace of this league run; each match gets its own (see _start_round_matches)
+        self.trace_id = new_trace_id()
+        
+        # Persisted league state (one file per league when several share a process)
+        self.state_file = Path("data") / "league_state.json"
         
         # MCP components
-        self.mcp_server = MCPServer("LeagueManager")
-        self.mcp_client = MCPClient()
+        self.mcp_server = mcp_server or MCPServer("LeagueManager")
+        self.mcp_client = mcp_client or MCPClient(timeouts=self.system_config.timeouts)
         
         # Initialize modular components
         self.handlers = LeagueHandlers(self)
@@ -89,14 +137,17 @@ class LeagueManager:
         ]
         self.referee_index = 0
         
-        self._setup_tools()
+        if mcp_server is None:
+            self._setup_tools()
+            self.mcp_server.set_subscription_auth(self.authenticate_subscriber)
         logging.info(f"League Manager initialized: {self.league_id}")
     
     def _setup_tools(self):
         """Register MCP tools using modular handlers."""
-        self.mcp_server.register_tool("register_referee", self.handlers.register_referee)
-        self.mcp_server.register_tool("register_player", self.handlers.register_player)
-        self.mcp_server.register_tool("report_match_result", self.handlers.report_match_result)
+        self.mcp_server.register_tool("register_referee", self.handlers.register_referee, dedupe=True)
+        self.mcp_server.register_tool("register_player", self.handlers.register_player, dedupe=True)
+        self.mcp_server.register_tool("report_match_result", self.handlers.report_match_result, dedupe=True)
+        self.mcp_server.register_tool("report_match_results", self.handlers.report_match_results, dedupe=True)
         self.mcp_server.register_tool("get_standings", self.handlers.get_standings)
         self.mcp_server.register_tool("handle_league_query", self.handlers.handle_league_query)
     
@@ -114,10 +165,35 @@ class LeagueManager:
         
         return False
     
+    def subscriber_key(self, sender: str) -> str:
+        """Event stream key of an agent of this league (e.g., "league_x/player:P01")."""
+        return f"{self.league_id}/{sender}"
+    
+    def authenticate_subscriber(self, params: dict) -> Optional[str]:
+        """Accept an event stream subscription from a registered agent."""
+        sender = params.get('sender', '')
+        if not self._validate_auth_token(sender, params.get('auth_token', '')):
+            return None
+        # Events queued on a previous stream may be lost: resync standings in full
+        self.standings_acks.pop(sender.split(":", 1)[1], None)
+        self.logger.info("SUBSCRIBER_CONNECTED", sender=sender)
+        return self.subscriber_key(sender)
+    
+    async def notify_agent(self, sender: str, endpoint: str, tool_name: str, message: dict) -> dict:
+        """
+        Deliver a notification over the agent's event stream, or POST it.
+        
+        Returns:
+            {"status": "PUSHED"} when pushed, otherwise the tool call result
+        """
+        if self.mcp_server.events.publish(self.subscriber_key(sender), tool_name, message):
+            return {"status": "PUSHED"}
+        return await self.mcp_client.call_tool(endpoint, tool_name, message)
+    
     def _save_state(self):
         """Persist league state (temporary - should use repositories)."""
-        Path("data").mkdir(exist_ok=True)
-        with open("data/league_state.json", "w") as f:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "w") as f:
             json.dump({
                 "league_id": self.league_id,
                 "players": self.players,
@@ -125,37 +201,64 @@ class LeagueManager:
                 "schedule": self.schedule
             }, f, indent=2)
     
+    def _publish_standings(self, standings, round_id: int, league_completed: bool = False):
+        """Write standings to the shared-memory snapshot, if enabled."""
+        if self.standings_snapshot_path is None:
+            return
+        if self._standings_writer is None:
+            # Registration is closed by the first round, so the table size is final
+            from league_sdk.standings_snapshot import StandingsSnapshotWriter
+            self._standings_writer = StandingsSnapshotWriter(
+                self.standings_snapshot_path, max(len(self.players), 1)
+            )
+        version = self._standings_writer.publish(standings, round_id, league_completed)
+        self.logger.info("STANDINGS_SNAPSHOT_PUBLISHED", round_id=round_id, version=version)
+    
     async def run_league(self):
-        """Execute full league workflow."""
-        self.logger.info("REGISTRATION_STARTED", timeout_sec=self.registration_timeout)
+        """Execute full league workflow (traced as one league trace)."""
+        with tracer.trace(self.trace_id):
+            self.logger.info("REGISTRATION_STARTED", timeout_sec=self.registration_timeout,
+                             trace_id=self.trace_id)
         
-        await asyncio.sleep(self.registration_timeout)
-        self.registration_closed = True
+            await self._wait_for_registration()
+            self.registration_closed = True
         
-        player_ids = list(self.players.keys())
-        self.logger.info("REGISTRATION_CLOSED", player_count=len(player_ids))
+            player_ids = list(self.players.keys())
+            self.logger.info("REGISTRATION_CLOSED", player_count=len(player_ids))
         
-        # Generate schedule using scheduler
-        self.scheduler.generate_schedule(player_ids)
+            # Generate schedule using scheduler
+            self.scheduler.generate_schedule(player_ids)
         
-        # Group matches by round
-        rounds_matches = self._group_matches_by_round()
+            # Group matches by round
+            rounds_matches = self._group_matches_by_round()
         
-        # Execute rounds with announcements        
-        for round_id in sorted(rounds_matches.keys()):
-            round_matches = rounds_matches[round_id]
+            # Execute rounds with announcements        
+            for round_id in sorted(rounds_matches.keys()):
+                round_matches = rounds_matches[round_id]
             
-            # Send ROUND_ANNOUNCEMENT
-            await self.scheduler.announce_round(round_id, round_matches)
+                # Send ROUND_ANNOUNCEMENT
+                await self.scheduler.announce_round(round_id, round_matches)
             
-            # Start all matches in round
-            await self._start_round_matches(round_matches)
+                # Start all matches in round
+                await self._start_round_matches(round_matches)
         
-        # Wait for completion
-        await self._wait_for_completion()
+            # Wait for completion
+            await self._wait_for_completion()
         
-        # Send final results
-        await self._finalize_league()
+            # Send final results
+            await self._finalize_league()
+    
+    async def _wait_for_registration(self):
+        """Wait out the registration window, or until the expected agents have registered."""
+        if self.expected_players is None and self.expected_referees is None:
+            await asyncio.sleep(self.registration_timeout)
+            return
+        deadline = time.monotonic() + self.registration_timeout
+        while time.monotonic() < deadline:
+            if (len(self.players) >= (self.expected_players or 0)
+                    and len(self.referees) >= (self.expected_referees or 0)):
+                return
+            await asyncio.sleep(0.05)
     
     def _group_matches_by_round(self):
         """Group schedule matches by round."""
@@ -170,7 +273,8 @@ class LeagueManager:
         if not registered_referee_endpoints:
             registered_referee_endpoints = self.referee_endpoints
         
-        referee_index = 0
+        # Leagues sharing a referee pool start at different referees
+        referee_index = self.referee_index % len(registered_referee_endpoints)
         
         for player_A, player_B, round_id, match_num in self.schedule:
             if round_id not in rounds_matches:
@@ -193,27 +297,108 @@ class LeagueManager:
         return rounds_matches
     
     async def _start_round_matches(self, round_matches):
-        """Start all matches in a round."""
-        for match_info in round_matches:
-            await self.mcp_client.call_tool(
-                match_info['referee_endpoint'],
-                "start_match",
-                {
-                    "match_id": match_info['match_id'],
-                    "round_id": match_info['round_id'],
-                    "player_A_id": match_info['player_A_id'],
-                    "player_B_id": match_info['player_B_id'],
-                    "player_A_endpoint": match_info['player_A_endpoint'],
-                    "player_B_endpoint": match_info['player_B_endpoint'],
-                    "league_id": self.league_id,
-                    "league_manager_endpoint": f"http://{self.system_config.network.base_host}:{self.system_config.network.default_league_manager_port}/mcp"
-                }
+        """Run all matches in a round concurrently, a few per referee at a time."""
+        # A referee answers start_match once the match is over; running the
+        # round's matches together lets their result reports share batches
+        per_referee = self.system_config.defaults.get('max_concurrent_matches_per_referee', 5)
+        slots = asyncio.Semaphore(per_referee * max(len(self.referees), 1))
+        
+        async def run_match(match_info):
+            # The referee reuses this conversation_id for every message of the match
+            conversation_id = generate_conversation_id(f"match-{match_info['match_id']}")
+            async with slots:
+                with tracer.trace(trace_id_for(conversation_id)):
+                    down = self._players_down(match_info)
+                    if down:
+                        await self._forfeit_match(match_info, down, conversation_id)
+                    else:
+                        await self._start_match(match_info, conversation_id)
+        
+        await asyncio.gather(*(run_match(match_info) for match_info in round_matches))
+    
+    def _players_down(self, match_info: dict) -> list:
+        """Players of a match whose endpoint's circuit breaker is open."""
+        health = self.mcp_client.health
+        return [
+            player_id for player_id, endpoint in (
+                (match_info['player_A_id'], match_info['player_A_endpoint']),
+                (match_info['player_B_id'], match_info['player_B_endpoint'])
             )
+            if health.is_down(endpoint)
+        ]
+    
+    async def _forfeit_match(self, match_info: dict, down: list, conversation_id: str,
+                             reason: str = "players_down"):
+        """Record a technical loss for ``down`` without involving a referee."""
+        match_id = match_info['match_id']
+        self.logger.warning("MATCH_FORFEITED", match_id=match_id, players_down=down, reason=reason)
+        result = technical_loss_result(match_info['player_A_id'], match_info['player_B_id'], down)
+        if self.handlers._record_result({
+            "match_id": match_id,
+            "conversation_id": conversation_id,
+            "result": result
+        }) is None:
+            return
+        self._save_state()
+        await self.scheduler.check_round_completion(match_id)
+    
+    def _available_referee(self, endpoint: str) -> str:
+        """``endpoint``, or another registered referee while its circuit breaker is open."""
+        health = self.mcp_client.health
+        if not health.is_down(endpoint):
+            return endpoint
+        for ref_info in self.referees.values():
+            if not health.is_down(ref_info['endpoint']):
+                return ref_info['endpoint']
+        return endpoint
+    
+    async def _start_match(self, match_info: dict, conversation_id: str):
+        """
+        Ask the match's referee (or a healthy substitute) to run it.
+        
+        A match no referee accepts (every breaker open, or the call fails)
+        waits out the breaker's reset window and is offered again. After
+        max_retries such waits it is recorded as a technical loss for both
+        players, so one outage cannot stop the league.
+        """
+        arguments = {
+            "conversation_id": conversation_id,
+            "match_id": match_info['match_id'],
+            "round_id": match_info['round_id'],
+            "player_A_id": match_info['player_A_id'],
+            "player_B_id": match_info['player_B_id'],
+            "player_A_endpoint": match_info['player_A_endpoint'],
+            "player_B_endpoint": match_info['player_B_endpoint'],
+            "league_id": self.league_id,
+            "league_manager_endpoint": f"http://{self.system_config.network.base_host}:{self.system_config.network.default_league_manager_port}/mcp"
+        }
+        health = self.mcp_client.health
+        max_retries = self.system_config.defaults.get('max_retries', 3)
+        for attempt in range(max_retries + 1):
+            endpoint = self._available_referee(match_info['referee_endpoint'])
+            try:
+                await self.mcp_client.call_tool(endpoint, "start_match", arguments)
+                return
+            except Exception as e:
+                if attempt == max_retries:
+                    error = e
+                    break
+                if isinstance(e, CircuitOpenError) and e.retry_in > 0:
+                    delay = e.retry_in
+                else:
+                    delay = backoff_delay(attempt, health.open_sec, health.max_open_sec)
+                self.logger.warning("MATCH_START_DEFERRED", match_id=match_info['match_id'],
+                                    referee_endpoint=endpoint, retry_in=round(delay, 3), error=str(e))
+                await asyncio.sleep(delay)
+        
+        logging.error(f"No referee could run match {match_info['match_id']}: {error}")
+        players = [match_info['player_A_id'], match_info['player_B_id']]
+        await self._forfeit_match(match_info, players, conversation_id, reason="no_referee")
     
     async def _wait_for_completion(self):
         """Wait for all matches to complete."""
-        while len(self.completed_matches) < self.expected_matches:
-            await asyncio.sleep(1)
+        if len(self.completed_matches) < self.expected_matches:
+            await self.all_matches_completed.wait()
         self.logger.info("ALL_MATCHES_COMPLETED", total=self.expected_matches)
     
     async def _finalize_league(self):
@@ -221,6 +406,7 @@ class LeagueManager:
         from league_sdk.helpers import calculate_standings
         
         standings = calculate_standings(self.results)
+        self._publish_standings(standings, self.total_rounds, league_completed=True)
         await self.scheduler.send_league_completed(standings)
         
         # Display results
@@ -256,6 +442,31 @@ async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="League Manager - Protocol V2")
     parser.add_argument("--league-id", default="league_2025_even_odd", help="League identifier")
+    parser.add_argument("--frontend-workers", type=int, default=0,
+                        help="Serve the public port from N front-end processes (0 = single process)")
+    parser.add_argument("--owner-port", type=int, default=8090,
+                        help="Internal port of the state owner in front-end mode")
+    parser.add_argument("--snapshot-path", default=None,
+                        help="State snapshot file shared with front-end workers")
+    parser.add_argument("--snapshot-capacity-mb", type=int, default=64)
+    parser.add_argument("--standings-snapshot", default=None,
+                        help="Publish standings to this memory-mapped file (e.g. /dev/shm/league.standings)")
+    parser.add_argument("--standings-delta", action="store_true",
+                        help="Send players only the standings rows changed since their last ack")
+    parser.add_argument("--leagues", default=None,
+                        help="Comma-separated league configs hosted in this process (multi-league mode)")
+    parser.add_argument("--league-instances", type=int, default=1,
+                        help="Run each league config this many times as separate leagues")
+    parser.add_argument("--max-outbound-calls", type=int, default=64,
+                        help="Outgoing calls in flight across all leagues (multi-league mode)")
+    parser.add_argument("--uds", default=None,
+                        help="Also serve on this Unix socket (*.sock) for co-located agents")
+    parser.add_argument("--registration-timeout", type=float, default=None,
+                        help="Registration window in seconds (overrides the league config)")
+    parser.add_argument("--expect-players", type=int, default=None,
+                        help="Close registration as soon as this many players have registered")
+    parser.add_argument("--expect-referees", type=int, default=None,
+                        help="With --expect-players, also wait for this many referees")
     args = parser.parse_args()
     
     # Setup logging
@@ -264,18 +475,51 @@ async def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    if args.leagues or args.league_instances > 1:
+        if args.frontend_workers > 0 or args.standings_snapshot:
+            parser.error("--frontend-workers and --standings-snapshot serve a single league")
+        await run_multi_league(args)
+        return
+    
     # Initialize manager
     manager = LeagueManager(args.league_id)
+    manager.standings_delta = args.standings_delta
+    if args.registration_timeout is not None:
+        manager.registration_timeout = args.registration_timeout
+    manager.expected_players = args.expect_players
+    manager.expected_referees = args.expect_referees
+    if args.standings_snapshot:
+        manager.standings_snapshot_path = Path(args.standings_snapshot)
     
     # Get network config from SDK
     config_loader = ConfigLoader()
     system_config = config_loader.load_system()
     
+    host = system_config.network.base_host
+    public_port = system_config.network.default_league_manager_port
+    workers = []
+    publish_task = None
+    
+    if args.frontend_workers > 0:
+        # Front-end mode: workers own the public port, this process owns state
+        from frontend import StatePublisher, default_snapshot_path, start_frontend_workers
+        from league_sdk.shared_state import SeqlockBuffer
+        
+        snapshot_path = Path(args.snapshot_path) if args.snapshot_path else default_snapshot_path(args.league_id)
+        publisher = StatePublisher(manager, SeqlockBuffer(snapshot_path, args.snapshot_capacity_mb * 1024 * 1024))
+        publisher.publish_if_changed()
+        workers = start_frontend_workers(args.frontend_workers, host, public_port,
+                                         f"http://{host}:{args.owner_port}/mcp", snapshot_path)
+        publish_task = asyncio.create_task(publisher.run())
+        server_port = args.owner_port
+    else:
+        server_port = public_port
+    
     # Create uvicorn server
     uvicorn_config = uvicorn.Config(
         manager.mcp_server.app,
-        host=system_config.network.base_host,
-        port=system_config.network.default_league_manager_port,
+        host=host,
+        port=server_port,
         log_level="info"
     )
     server = uvicorn.Server(uvicorn_config)
@@ -289,10 +533,55 @@ async def main():
         await manager.run_league()
     
     # Run both server and league manager concurrently
-    await asyncio.gather(
-        server.serve(),
-        delayed_league_start()
+    try:
+        await asyncio.gather(
+            server.serve(sockets=server_sockets(host, server_port, args.uds)),
+            delayed_league_start()
+        )
+    finally:
+        if publish_task is not None:
+            publish_task.cancel()
+            try:
+                await publish_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logging.error(f"State publisher failed: {e}")
+        for worker in workers:
+            worker.terminate()
+
+
+async def run_multi_league(args):
+    """Host several leagues on the public port and run them concurrently."""
+    from multi_league import MultiLeagueManager, expand_leagues
+    
+    config_ids = [c.strip() for c in (args.leagues or args.league_id).split(",") if c.strip()]
+    multi = MultiLeagueManager(LeagueManager, expand_leagues(config_ids, args.league_instances),
+                               max_outbound_calls=args.max_outbound_calls)
+    for manager in multi.leagues.values():
+        manager.standings_delta = args.standings_delta
+    network = multi.system_config.network
+    uvicorn_config = uvicorn.Config(
+        multi.mcp_server.app,
+        host=network.base_host,
+        port=network.default_league_manager_port,
+        log_level="info"
     )
+    server = uvicorn.Server(uvicorn_config)
+    
+    async def delayed_leagues_start():
+        """Wait for server to be ready, then start every league."""
+        await asyncio.sleep(2)
+        logging.info(f"Server ready - starting {len(multi.leagues)} leagues")
+        await multi.run()
+    
+    try:
+        await asyncio.gather(
+            server.serve(sockets=server_sockets(network.base_host, network.default_league_manager_port, args.uds)),
+            delayed_leagues_start()
+        )
+    finally:
+        await multi.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,316 @@
+"""League Manager - Many leagues in one process.
+
+MultiLeagueManager hosts several LeagueManager state machines behind one
+MCPServer and one MCPClient connection pool:
+  - requests are routed to a league by the ``league_id`` of the envelope
+    (``player_meta.league_id`` for registrations);
+  - referees register once and form a pool shared by every league;
+  - each league keeps its own scheduler, logger and state file;
+  - outgoing calls of all leagues go through a FairShareLimiter, so a large
+    league cannot starve the small ones.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.mcp_client import MCPClient
+from league_sdk.mcp_server import MCPServer
+
+
+class FairShareLimiter:
+    """
+    Bound concurrent work and hand free slots to waiting keys in turn.
+
+    While slots are free, ``slot()`` is granted at once. Once all slots are
+    taken, waiters are queued per key and a released slot goes to the next key
+    in round-robin order, so every league gets an equal share of the pool no
+    matter how many calls it has queued.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.in_use = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+        self._turns: Deque[str] = deque()
+        self.granted: Dict[str, int] = {}
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers waiting for a slot."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    @asynccontextmanager
+    async def slot(self, key: str):
+        """Hold one slot for ``key`` while the block runs."""
+        await self._acquire(key)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, key: str) -> None:
+        if self.in_use < self.capacity and not self._turns:
+            self.in_use += 1
+            self.granted[key] = self.granted.get(key, 0) + 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        queue = self._waiters.get(key)
+        if queue is None:
+            queue = self._waiters[key] = deque()
+            self._turns.append(key)
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()  # slot was handed over just before cancellation
+            else:
+                self._discard(key, future)
+            raise
+        self.granted[key] = self.granted.get(key, 0) + 1
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiting key, or free it."""
+        while self._turns:
+            key = self._turns.popleft()
+            queue = self._waiters[key]
+            future = queue.popleft()
+            if queue:
+                self._turns.append(key)
+            else:
+                del self._waiters[key]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_use -= 1
+
+    def _discard(self, key: str, future: asyncio.Future) -> None:
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self._waiters[key]
+            self._turns.remove(key)
+
+
+class FairShareClient:
+    """
+    The shared MCPClient as one league sees it: tool calls wait for a slot.
+
+    A wrapper, not a copy: request ids, endpoint health, transports and event
+    streams all belong to the shared client, so a player down in one league is
+    down in every league.
+    """
+
+    def __init__(self, client: MCPClient, limiter: FairShareLimiter, key: str):
+        self.client = client
+        self.limiter = limiter
+        self.key = key
+
+    @property
+    def health(self):
+        return self.client.health
+
+    @property
+    def timeouts(self):
+        return self.client.timeouts
+
+    @property
+    def metrics(self):
+        return self.client.metrics
+
+    def timeout_for(self, tool_name: str) -> Optional[float]:
+        return self.client.timeout_for(tool_name)
+
+    @staticmethod
+    def events_endpoint(mcp_endpoint: str) -> str:
+        return MCPClient.events_endpoint(mcp_endpoint)
+
+    async def call_tool(
+        self,
+        endpoint: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        request_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Call a tool once this league's turn for a slot has come."""
+        async with self.limiter.slot(self.key):
+            return await self.client.call_tool(endpoint, tool_name, arguments, request_id)
+
+    async def call_tool_with_retry(
+        self,
+        endpoint: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        max_retries: int = 3,
+        retry_delay: float = 2.0
+    ) -> Optional[Dict[str, Any]]:
+        """MCPClient.call_tool_with_retry taking a slot per attempt, none while backing off."""
+        return await self.client.call_tool_with_retry(
+            endpoint, tool_name, arguments, max_retries, retry_delay, call=self.call_tool
+        )
+
+    def subscribe(self, *args, **kwargs):
+        """Event streams are long-lived and do not take a slot."""
+        return self.client.subscribe(*args, **kwargs)
+
+    async def consume_events(self, *args, **kwargs) -> None:
+        await self.client.consume_events(*args, **kwargs)
+
+    async def close(self):
+        """The shared client is closed by MultiLeagueManager."""
+
+
+class MultiLeagueManager:
+    """Host many LeagueManagers on one server, one client pool and one referee pool."""
+
+    def __init__(
+        self,
+        manager_cls,
+        leagues: Dict[str, str],
+        max_outbound_calls: int = 64,
+        log_root: Optional[Path] = None,
+        data_dir: Path = Path("data") / "leagues",
+    ):
+        """
+        Args:
+            manager_cls: LeagueManager class
+            leagues: Mapping of league_id to the league configuration it uses
+            max_outbound_calls: Calls in flight at once across all leagues
+            log_root: Optional custom log root directory
+            data_dir: Directory of the per-league state files
+        """
+        if not leagues:
+            raise ValueError("MultiLeagueManager needs at least one league")
+        config_loader = ConfigLoader()
+        self.system_config = config_loader.load_system()
+        self.mcp_server = MCPServer("LeagueManager")
+        self.mcp_client = MCPClient(max_connections=max_outbound_calls, timeouts=self.system_config.timeouts)
+        self.limiter = FairShareLimiter(max_outbound_calls)
+        self.logger = JsonLogger("league_manager", log_root=log_root)
+
+        # Referees register once and serve every league
+        self.referees: Dict[str, Dict] = {}
+        self.referee_tokens: Dict[str, str] = {}
+
+        self.leagues: "OrderedDict[str, Any]" = OrderedDict()
+        for index, (league_id, config_id) in enumerate(leagues.items()):
+            manager = manager_cls(
+                league_id, log_root=log_root, config_id=config_id,
+                config_loader=config_loader, mcp_server=self.mcp_server,
+                mcp_client=FairShareClient(self.mcp_client, self.limiter, league_id),
+            )
+            manager.referees = self.referees
+            manager.referee_tokens = self.referee_tokens
+            manager.referee_index = index
+            manager.state_file = Path(data_dir) / f"{league_id}.json"
+            self.leagues[league_id] = manager
+        self.default_league_id = next(iter(self.leagues))
+
+        self._setup_tools()
+        self.mcp_server.set_subscription_auth(self.authenticate_subscriber)
+        self.logger.info("MULTI_LEAGUE_INITIALIZED", leagues=list(self.leagues),
+                         max_outbound_calls=self.limiter.capacity)
+
+    def _setup_tools(self):
+        """Register the routing tools (same names as a single LeagueManager)."""
+        self.mcp_server.register_tool("register_referee", self.register_referee, dedupe=True)
+        self.mcp_server.register_tool("register_player", self._routed("register_player"), dedupe=True)
+        self.mcp_server.register_tool("report_match_result", self._routed("report_match_result"), dedupe=True)
+        self.mcp_server.register_tool("report_match_results", self.report_match_results, dedupe=True)
+        self.mcp_server.register_tool("get_standings", self._routed("get_standings"))
+        self.mcp_server.register_tool("handle_league_query", self._routed("handle_league_query"))
+
+    def resolve_league(self, args: dict):
+        """League addressed by a request, or None if the league_id is unknown."""
+        league_id = args.get('league_id') or (args.get('player_meta') or {}).get('league_id')
+        return self.leagues.get(league_id or self.default_league_id)
+
+    def _routed(self, tool_name: str):
+        """Tool handler forwarding to the addressed league's LeagueHandlers."""
+        async def handler(args: dict) -> dict:
+            manager = self.resolve_league(args)
+            if manager is None:
+                return self._league_not_found(args, tool_name)
+            return await getattr(manager.handlers, tool_name)(args)
+        return handler
+
+    def _league_not_found(self, args: dict, tool_name: str) -> dict:
+        league_id = args.get('league_id') or (args.get('player_meta') or {}).get('league_id')
+        logging.warning(f"{tool_name} for unknown league {league_id}")
+        return self.mcp_server.create_league_error(
+            "E019", "LEAGUE_NOT_FOUND",
+            original_message_type=args.get('message_type'),
+            context={"league_id": league_id, "leagues": list(self.leagues)}
+        )
+
+    def authenticate_subscriber(self, params: dict) -> Optional[str]:
+        """Event stream subscriptions are authenticated by the addressed league."""
+        manager = self.resolve_league(params)
+        return manager.authenticate_subscriber(params) if manager else None
+
+    async def register_referee(self, args: dict) -> dict:
+        """Register a referee in the pool shared by every league."""
+        # The first league's handler numbers referees; the registry dicts are shared
+        return await self.leagues[self.default_league_id].handlers.register_referee(args)
+
+    async def report_match_results(self, args: dict) -> dict:
+        """Split a referee's batch by league and record each part in its league."""
+        reports_by_league: Dict[str, List[dict]] = {}
+        for report in args.get('reports', []):
+            league_id = report.get('league_id') or args.get('league_id') or self.default_league_id
+            reports_by_league.setdefault(league_id, []).append(report)
+
+        recorded = 0
+        for league_id, reports in reports_by_league.items():
+            manager = self.leagues.get(league_id)
+            if manager is None:
+                logging.warning(f"Dropping {len(reports)} results for unknown league {league_id}")
+                continue
+            response = await manager.handlers.report_match_results({**args, "reports": reports})
+            if response.get("message_type") == "LEAGUE_ERROR":
+                return response
+            recorded += response.get("recorded", 0)
+        return {"status": "OK", "recorded": recorded}
+
+    async def run(self):
+        """Run every league concurrently until all of them have finished."""
+        results = await asyncio.gather(
+            *(manager.run_league() for manager in self.leagues.values()),
+            return_exceptions=True
+        )
+        for league_id, result in zip(self.leagues, results):
+            if isinstance(result, Exception):
+                logging.error(f"League {league_id} failed: {result}")
+                self.logger.error("LEAGUE_FAILED", league_id=league_id, error=str(result))
+        self.logger.info("ALL_LEAGUES_FINISHED", leagues=len(self.leagues),
+                         calls_granted=self.limiter.granted)
+
+    async def close(self):
+        await self.mcp_client.close()
+
+
+def expand_leagues(config_ids: List[str], instances: int) -> Dict[str, str]:
+    """
+    League ids to host, mapped to their configuration.
+
+    With ``instances`` > 1 every configuration is run that many times as
+    separate leagues named ``<config_id>-001``, ``<config_id>-002``, ...
+    """
+    if instances <= 1:
+        return {config_id: config_id for config_id in config_ids}
+    width = max(3, len(str(instances)))
+    return {
+        f"{config_id}-{index:0{width}d}": config_id
+        for config_id in config_ids
+        for index in range(1, instances + 1)
+    }
@@ -2,11 +2,13 @@
 import asyncio
 import logging
 from typing import List, Dict
+from league_sdk import deadlines
 from league_sdk.helpers import (
     generate_round_robin_schedule,
     generate_conversation_id,
     get_iso_timestamp,
     calculate_standings,
+    tool_result,
 )
 
 
@@ -19,7 +21,9 @@ class LeagueScheduler:
     
     def generate_schedule(self, player_ids: List[str]) -> None:
         """Generate round-robin schedule for all players."""
-        self.manager.schedule = generate_round_robin_schedule(player_ids)
+        self.manager.schedule = generate_round_robin_schedule(
+            player_ids, max_rounds=self.manager.max_rounds
+        )
         self.manager.expected_matches = len(self.manager.schedule)
         
         #Build rounds_info for tracking
@@ -60,7 +64,8 @@ class LeagueScheduler:
         # Send to all players
         for player_id, player_info in self.manager.players.items():
             try:
-                await self.manager.mcp_client.call_tool(
+                await self.manager.notify_agent(
+                    f"player:{player_id}",
                     player_info['endpoint'],
                     "notify_round",
                     message
@@ -71,33 +76,53 @@ class LeagueScheduler:
     
     async def check_round_completion(self, match_id: str) -> None:
         """Check if a round has completed and notify players."""
+        await self.check_rounds_completion([match_id])
+    
+    async def check_rounds_completion(self, match_ids: List[str]) -> None:
+        """Count newly completed matches per round and notify finished rounds."""
         # Extract round_id from match_id (e.g., "R1M1" -> 1)
-        round_id = int(match_id[1:match_id.index('M')])
-        
-        if round_id in self.manager.completed_rounds:
-            return  # Already processed
-        
-        # Count completed matches in this round
-        round_info = self.manager.rounds_info.get(round_id, {})
-        if not round_info:
-            return
-        
-        round_info['completed'] = int(round_info.get('completed', 0)) + 1
+        completed_per_round = {}
+        for match_id in match_ids:
+            round_id = int(match_id[1:match_id.index('M')])
+            completed_per_round[round_id] = completed_per_round.get(round_id, 0) + 1
         
-        # Check if all matches complete
-        if round_info['completed'] >= len(round_info['matches']):
-            self.manager.completed_rounds.add(round_id)
-            logging.info(f"Round {round_id} completed!")
+        for round_id in sorted(completed_per_round):
+            if round_id in self.manager.completed_rounds:
+                continue  # Already processed
+            
+            # Count completed matches in this round
+            round_info = self.manager.rounds_info.get(round_id, {})
+            if not round_info:
+                continue
             
-            # Calculate and notify standings
-            standings = calculate_standings(self.manager.results)
-            await self.notify_round_standings(round_id, standings)
-            await self.send_round_completed(round_id, round_info)
+            round_info['completed'] = int(round_info.get('completed', 0)) + completed_per_round[round_id]
+            
+            # Check if all matches complete
+            if round_info['completed'] >= len(round_info['matches']):
+                self.manager.completed_rounds.add(round_id)
+                logging.info(f"Round {round_id} completed!")
+                
+                # Calculate and notify standings; the notifications are not
+                # bound by the deadline of the report that completed the round
+                standings = calculate_standings(self.manager.results)
+                self.manager._publish_standings(standings, round_id)
+                with deadlines.detached():
+                    await self.notify_round_standings(round_id, standings)
+                    await self.send_round_completed(round_id, round_info)
     
     async def notify_round_standings(self, round_id: int, standings: List[Dict]) -> None:
-        """Notify all players of current standings after round completion."""
+        """
+        Notify all players of current standings after round completion.
+        
+        With standings deltas enabled, players that support them receive only
+        the rows changed since the version they last acknowledged.
+        """
         logging.info(f"Notifying all players of Round {round_id} standings")
         
+        history = self.manager.standings_history if self.manager.standings_delta else None
+        if history is not None:
+            history.publish(standings)
+        
         message = {
             "protocol": "league.v2",
             "message_type": "LEAGUE_STANDINGS_UPDATE",
@@ -110,14 +135,29 @@ class LeagueScheduler:
         }
         
         for player_id, player_info in self.manager.players.items():
+            use_delta = history is not None and player_info.get('standings_delta')
+            player_message = message
+            if use_delta:
+                acked = self.manager.standings_acks.get(player_id)
+                player_message = {**message, **history.update_for(acked)}
             try:
-                await self.manager.mcp_client.call_tool(
+                response = await self.manager.notify_agent(
+                    f"player:{player_id}",
                     player_info['endpoint'],
                     "notify_standings",
-                    message
+                    player_message
                 )
             except Exception as e:
                 logging.error(f"Failed to send standings to {player_id}: {e}")
+                continue
+            if use_delta:
+                if response.get('status') == "PUSHED":
+                    # The event stream is ordered; a reconnect resets the ack
+                    acked = player_message['standings_version']
+                else:
+                    acked = tool_result(response).get('standings_version')
+                if acked is not None:
+                    self.manager.standings_acks[player_id] = acked
     
     async def send_round_completed(self, round_id: int, round_info: Dict) -> None:
         """Send ROUND_COMPLETED message to all players."""
@@ -130,7 +170,9 @@ class LeagueScheduler:
         for match_id in round_info['matches']:
             if match_id in self.manager.results:
                 result = self.manager.results[match_id]
-                if result['winner'] is None:
+                if result.get('details', {}).get('technical_loss'):
+                    technical_losses += 1
+                elif result['winner'] is None:
                     draws += 1
                 else:
                     wins += 1
@@ -155,7 +197,8 @@ class LeagueScheduler:
         
         for player_id, player_info in self.manager.players.items():
             try:
-                await self.manager.mcp_client.call_tool(
+                await self.manager.notify_agent(
+                    f"player:{player_id}",
                     player_info['endpoint'],
                     "notify_round_completed",
                     message
@@ -196,7 +239,8 @@ class LeagueScheduler:
         # Send to all players and referees
         for player_id, player_info in self.manager.players.items():
             try:
-                await self.manager.mcp_client.call_tool(
+                await self.manager.notify_agent(
+                    f"player:{player_id}",
                     player_info['endpoint'],
                     "notify_league_completed",
                     message
@@ -206,7 +250,8 @@ class LeagueScheduler:
         
         for referee_id, referee_info in self.manager.referees.items():
             try:
-                await self.manager.mcp_client.call_tool(
+                await self.manager.notify_agent(
+                    f"referee:{referee_id}",
                     referee_info['endpoint'],
                     "notify_league_completed",
                     message
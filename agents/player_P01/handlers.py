@@ -5,18 +5,20 @@ Handles registration, invitations, game moves, and notifications.
 """
 
 import logging
-from typing import Dict
-from league_sdk.helpers import get_iso_timestamp
+from typing import Dict, Optional
+from league_sdk.helpers import generate_conversation_id, get_iso_timestamp
 from league_sdk.mcp_client import MCPClient
+from league_sdk.standings_delta import StandingsReplica
 
 
 class PlayerHandlers:
     """Message handlers for Player Agent."""
     
-    def __init__(self, player):
-        """Initialize handlers with reference to player agent."""
+    def __init__(self, player, mcp_client: Optional[MCPClient] = None):
+        """Initialize handlers with reference to player agent and optional shared client."""
         self.player = player
-        self.mcp_client = MCPClient()
+        self.mcp_client = mcp_client or MCPClient(timeouts=player.system_config.timeouts)
+        self.standings = StandingsReplica()
     
     async def register_with_league(self, league_endpoint: str) -> Dict:
         """
@@ -33,18 +35,22 @@ class PlayerHandlers:
             "message_type": "LEAGUE_REGISTER_REQUEST",
             "sender": f"player:{self.player.player_id}",
             "timestamp": get_iso_timestamp(),
+            "conversation_id": generate_conversation_id(f"register-{self.player.player_id}"),
+            "league_id": self.player.league_id,
             "player_meta": {
                 "display_name": self.player.player_config.display_name,
                 "protocol_version": "2.1.0",
                 "agent_version": "1.0.0",
                 "game_types": ["even_odd"],
-                "contact_endpoint": self.player.player_config.endpoint
+                "contact_endpoint": self.player.player_config.endpoint,
+                "standings_delta": True
             }
         }
         
-        response = await self.mcp_client.call_tool(
+        # Retries carry the same request: the manager registers the player once
+        response = await self.mcp_client.call_tool_with_retry(
             league_endpoint, "register_player", registration_request
-        )
+        ) or {"status": "REJECTED", "reason": "League manager unreachable"}
         
         if response.get('status') == 'ACCEPTED':
             self.player.player_id = response['player_id']
@@ -194,28 +200,32 @@ class PlayerHandlers:
         """
         Handle standings update from League Manager.
         
+        Full tables and deltas are applied to the local standings replica.
+        
         Args:
             args: Standings notification message
         
         Returns:
-            {'status': 'ACK'}
+            {'status': 'ACK', 'standings_version': int}
         """
-        standings = args.get('standings', [])
+        applied = self.standings.apply(args)
         
         # Find our position
-        our_standing = next(
-            (s for s in standings if s.get('player_id') == self.player.player_id),
-            None
-        )
+        our_standing = self.standings.find(self.player.player_id)
         
         self.player.logger.info(
             "STANDINGS_RECEIVED",
-            total_players=len(standings),
+            update_mode=args.get('update_mode', 'FULL'),
+            rows=len(args.get('standings', [])),
+            applied=applied,
+            standings_version=self.standings.version,
+            total_players=len(self.standings.rows),
             our_rank=our_standing.get('rank') if our_standing else None,
             our_points=our_standing.get('points') if our_standing else None
         )
         
-        return {"status": "ACK"}
+        # The acked version tells the manager which delta (or resync) to send next
+        return {"status": "ACK", "standings_version": self.standings.version}
     
     async def query_league(
         self, query_type: str, query_params: dict = None
@@ -11,8 +11,10 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.helpers import generate_conversation_id, get_iso_timestamp
 from league_sdk.mcp_server import MCPServer
 from league_sdk.mcp_client import MCPClient
+from league_sdk.unix_socket import server_sockets, unix_endpoint
 from handlers import PlayerHandlers
 
 class PlayerAgent:
@@ -27,18 +29,20 @@ class PlayerAgent:
         self.strategy = strategy
         self.league_manager_url = league_manager_url
         self.port = port
+        self.contact_endpoint = f"http://localhost:{port}/mcp"
         self.auth_token = None
+        self.league_player_id = None  # id assigned by the league manager
         self.logger = JsonLogger(f"player:{player_id}", league_id=league_id)
         self.logger.info("PLAYER_INIT", player_id=player_id)
         self.mcp_server = MCPServer(f"Player-{player_id}")
-        self.mcp_client = MCPClient()
+        self.mcp_client = MCPClient(timeouts=self.system_config.timeouts)
         self.handlers = PlayerHandlers(self)
         self._setup_tools()
         logging.info(f"Player {player_id} initialized with strategy: {self.strategy}")
     
     def _setup_tools(self):
         self.mcp_server.register_tool("notify_round", self.notify_round)
-        self.mcp_server.register_tool("notify_standings", self.notify_standings)
+        self.mcp_server.register_tool("notify_standings", self.handlers.notify_standings)
         self.mcp_server.register_tool("notify_round_completed", self.notify_round_completed)
         self.mcp_server.register_tool("notify_league_completed", self.notify_league_completed)
         self.mcp_server.register_tool("receive_game_invitation", self.handlers.receive_game_invitation)
@@ -49,10 +53,6 @@ class PlayerAgent:
         self.logger.info("ROUND_NOTIFIED", round_id=args.get('round_id'))
         return {"status": "ACK"}
     
-    async def notify_standings(self, args: dict) -> dict:
-        self.logger.info("STANDINGS_RECEIVED", count=len(args.get('standings', [])))
-        return {"status": "ACK"}
-    
     async def notify_round_completed(self, args: dict) -> dict:
         self.logger.info("ROUND_COMPLETED", round_id=args.get('round_id'))
         return {"status": "ACK"}
@@ -68,24 +68,50 @@ class PlayerAgent:
                 "protocol_version": "2.1.0",
                 "display_name": f"Player-{self.player_id}",
                 "game_types": ["even_odd"],
-                "contact_endpoint": f"http://localhost:{self.port}/mcp",
-                "strategy": self.strategy
+                "contact_endpoint": self.contact_endpoint,
+                "strategy": self.strategy,
+                "league_id": self.league_id,
+                "standings_delta": True
             }
-            response = await self.mcp_client.call_tool(
-                self.league_manager_url, "register_player", {"player_meta": player_meta}
+            registration_request = {
+                "protocol": "league.v2",
+                "message_type": "LEAGUE_REGISTER_REQUEST",
+                "sender": f"player:{self.player_id}",
+                "timestamp": get_iso_timestamp(),
+                "conversation_id": generate_conversation_id(f"register-{self.player_id}"),
+                "league_id": self.league_id,
+                "player_meta": player_meta
+            }
+            # Retries carry the same request: the manager registers the player once
+            response = await self.mcp_client.call_tool_with_retry(
+                self.league_manager_url, "register_player", registration_request
             )
+            if response is None:
+                logging.error("Player registration failed: league manager unreachable")
+                return
             if 'content' in response and len(response['content']) > 0:
                 result = json.loads(response['content'][0].get('text', '{}'))
             else:
                 result = response
             if result.get("status") == "ACCEPTED":
                 self.auth_token = result.get("auth_token")
+                self.league_player_id = result.get("player_id", self.player_id)
                 logging.info(f"Player {self.player_id} registered successfully")
                 self.logger.info("PLAYER_REGISTERED", auth_token_received=bool(self.auth_token))
             else:
                 logging.error(f"Player registration failed: {result}")
         except Exception as e:
             logging.error(f"Error registering player: {e}")
+    
+    def start_event_subscription(self) -> asyncio.Task:
+        """Receive league notifications over the manager's event stream instead of POSTs."""
+        return asyncio.create_task(self.mcp_client.consume_events(
+            MCPClient.events_endpoint(self.league_manager_url),
+            f"player:{self.league_player_id}",
+            self.auth_token,
+            self.mcp_server.tools,
+            league_id=self.league_id
+        ))
 
 async def main():
     parser = argparse.ArgumentParser()
@@ -94,13 +120,21 @@ async def main():
     parser.add_argument("--port", type=int, default=8101)
     parser.add_argument("--strategy", required=True)
     parser.add_argument("--league-manager", required=True)
+    parser.add_argument("--subscribe", action="store_true",
+                        help="Receive league notifications over the manager's event stream")
+    parser.add_argument("--uds", default=None,
+                        help="Also serve on this Unix socket (*.sock) and register it as contact endpoint")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
     player = PlayerAgent(args.player_id, args.league_id, args.strategy, args.league_manager, args.port)
+    if args.uds:
+        player.contact_endpoint = unix_endpoint(args.uds)
     await player.register_with_league()
+    if args.subscribe and player.auth_token:
+        subscription = player.start_event_subscription()  # keep a reference to the task
     import uvicorn
     uvicorn_config = uvicorn.Config(player.mcp_server.app, host="localhost", port=args.port, log_level="info")
-    await uvicorn.Server(uvicorn_config).serve()
+    await uvicorn.Server(uvicorn_config).serve(sockets=server_sockets("localhost", args.port, args.uds))
 
 if __name__ == "__main__":
     asyncio.run(main())
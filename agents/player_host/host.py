@@ -0,0 +1,159 @@
+"""Player Host - Hosted players and registration.
+
+Runs many players in one process. Every player keeps only its own league state
+(ids, token, current match, logger) and a tool table; the HTTP server, the
+MCP client connection pool, the config and the strategy module are shared.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Optional
+
+from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.agent_loader import load_agent_modules
+from league_sdk.helpers import generate_conversation_id, get_iso_timestamp
+from league_sdk.mcp_client import MCPClient
+from league_sdk.mcp_host import MCPHost
+
+
+class HostedPlayer:
+    """Per-player state for PlayerHandlers (a few hundred bytes plus tool table)."""
+
+    __slots__ = ("key", "player_id", "league_id", "strategy", "auth_token",
+                 "current_match", "endpoint", "logger", "handlers")
+
+    def __init__(self, key: str, league_id: str, strategy: str, endpoint: str):
+        self.key = key
+        self.player_id = key  # replaced by the id assigned at registration
+        self.league_id = league_id
+        self.strategy = strategy
+        self.auth_token = None
+        self.current_match = None
+        self.endpoint = endpoint
+        self.logger = JsonLogger(f"player:{key}", league_id=league_id)
+        self.handlers = None
+
+    async def notify_round_completed(self, args: dict) -> dict:
+        self.logger.info("ROUND_COMPLETED", round_id=args.get('round_id'))
+        return {"status": "ACK"}
+
+    async def notify_league_completed(self, args: dict) -> dict:
+        self.logger.info("LEAGUE_COMPLETED", champion=args.get('champion', {}).get('player_id'))
+        return {"status": "ACK"}
+
+    def tools(self) -> Dict:
+        """Tool table, same tools as a standalone PlayerAgent."""
+        handlers = self.handlers
+        return {
+            "notify_round": handlers.notify_round,
+            "notify_standings": handlers.notify_standings,
+            "notify_round_completed": self.notify_round_completed,
+            "notify_league_completed": self.notify_league_completed,
+            "receive_game_invitation": handlers.receive_game_invitation,
+            "choose_parity": handlers.choose_parity,
+            "receive_game_over": handlers.receive_game_over,
+        }
+
+
+class PlayerHost:
+    """Many PlayerAgents behind one MCPHost and one MCPClient."""
+
+    def __init__(
+        self,
+        league_id: str,
+        league_manager_url: str,
+        base_url: str,
+        max_connections: Optional[int] = None,
+    ):
+        self.league_id = league_id
+        self.league_manager_url = league_manager_url
+        self.base_url = base_url
+        self.mcp_server = MCPHost("PlayerHost")
+        self.mcp_client = MCPClient(max_connections=max_connections,
+                                    timeouts=ConfigLoader().load_system().timeouts)
+        self.players: Dict[str, HostedPlayer] = {}
+        self.logger = JsonLogger("player_host", league_id=league_id)
+        modules = load_agent_modules("player_template", ["strategy", "handlers"])
+        self.handlers_cls = modules["handlers"].PlayerHandlers
+
+    def add_player(self, key: str, strategy: str) -> HostedPlayer:
+        """Create a hosted player and expose it at /mcp/{key}."""
+        endpoint = self.mcp_server.agent_endpoint(self.base_url, key)
+        player = HostedPlayer(key, self.league_id, strategy, endpoint)
+        player.handlers = self.handlers_cls(player, self.mcp_client)
+        self.mcp_server.register_agent(key, player.tools())
+        self.players[key] = player
+        return player
+
+    async def register_all(self, interval_sec: float, concurrency: int) -> int:
+        """
+        Register every hosted player with the league manager.
+
+        Registrations start ``interval_sec`` apart and at most ``concurrency``
+        are in flight, so a large host does not flood the manager at startup.
+
+        Returns:
+            Number of accepted registrations
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def register(player: HostedPlayer, delay: float) -> bool:
+            await asyncio.sleep(delay)
+            async with semaphore:
+                return await self.register_player(player)
+
+        results = await asyncio.gather(*(
+            register(player, index * interval_sec)
+            for index, player in enumerate(self.players.values())
+        ))
+        accepted = sum(results)
+        self.logger.info("PLAYERS_REGISTERED", accepted=accepted, total=len(results))
+        return accepted
+
+    async def register_player(self, player: HostedPlayer) -> bool:
+        """Register one hosted player (same request as PlayerAgent)."""
+        player_meta = {
+            "protocol_version": "2.1.0",
+            "display_name": f"Player-{player.key}",
+            "game_types": ["even_odd"],
+            "contact_endpoint": player.endpoint,
+            "strategy": player.strategy,
+            "league_id": player.league_id,
+            "standings_delta": True
+        }
+        registration_request = {
+            "protocol": "league.v2",
+            "message_type": "LEAGUE_REGISTER_REQUEST",
+            "sender": f"player:{player.key}",
+            "timestamp": get_iso_timestamp(),
+            "conversation_id": generate_conversation_id(f"register-{player.key}"),
+            "league_id": player.league_id,
+            "player_meta": player_meta
+        }
+        try:
+            # Retries carry the same request: the manager registers the player once
+            response = await self.mcp_client.call_tool_with_retry(
+                self.league_manager_url, "register_player", registration_request
+            )
+            if response is None:
+                logging.error(f"Player {player.key} registration failed: league manager unreachable")
+                return False
+            if 'content' in response and len(response['content']) > 0:
+                result = json.loads(response['content'][0].get('text', '{}'))
+            else:
+                result = response
+        except Exception as e:
+            logging.error(f"Error registering player {player.key}: {e}")
+            return False
+        if result.get("status") != "ACCEPTED":
+            logging.error(f"Player {player.key} registration failed: {result}")
+            return False
+        player.player_id = result.get("player_id", player.key)
+        player.auth_token = result.get("auth_token")
+        player.logger.info("PLAYER_REGISTERED", player_id=player.player_id,
+                           auth_token_received=bool(player.auth_token))
+        return True
+
+    async def close(self):
+        await self.mcp_client.close()
@@ -0,0 +1,70 @@
+"""Player Host - Run many players in one process.
+
+Every hosted player is reachable at http://<host>:<port>/mcp/<key> and plays
+with the player_template handlers and strategies, sharing one uvicorn server,
+one event loop and one HTTP connection pool.
+
+Usage:
+  python main.py --players 500 --league-manager http://localhost:8000/mcp
+  python main.py --players 8 --strategies random,always_odd --port 8200 --league-manager http://localhost:8000/mcp
+"""
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from league_sdk.unix_socket import server_sockets, unix_endpoint
+from host import PlayerHost
+
+async def main():
+    parser = argparse.ArgumentParser(description="Host many players in one process")
+    parser.add_argument("--players", type=int, required=True, help="Number of hosted players")
+    parser.add_argument("--key-prefix", default="H", help="Prefix of the per-player route keys")
+    parser.add_argument("--strategies", default="random",
+                        help="Comma-separated strategies assigned to players in turn")
+    parser.add_argument("--league-id", default="league_2025_even_odd")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--league-manager", required=True)
+    parser.add_argument("--register-interval", type=float, default=0.02,
+                        help="Seconds between registration starts")
+    parser.add_argument("--register-concurrency", type=int, default=8,
+                        help="Registrations in flight at once")
+    parser.add_argument("--max-connections", type=int, default=100,
+                        help="Size of the shared outgoing connection pool")
+    parser.add_argument("--uds", default=None,
+                        help="Also serve on this Unix socket (*.sock) and register players on it")
+    parser.add_argument("--verbose", action="store_true", help="Log every message")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    base_url = unix_endpoint(args.uds, "") if args.uds else f"http://{args.host}:{args.port}"
+    host = PlayerHost(args.league_id, args.league_manager, base_url,
+                      max_connections=args.max_connections)
+    width = len(str(args.players))
+    for index in range(args.players):
+        host.add_player(f"{args.key_prefix}{index + 1:0{width}d}", strategies[index % len(strategies)])
+
+    import uvicorn
+    uvicorn_config = uvicorn.Config(host.mcp_server.app, host=args.host, port=args.port,
+                                    log_level="info" if args.verbose else "warning")
+    server = uvicorn.Server(uvicorn_config)
+    serving = asyncio.create_task(server.serve(sockets=server_sockets(args.host, args.port, args.uds)))
+    while not server.started and not serving.done():
+        await asyncio.sleep(0.05)
+    if not serving.done():
+        accepted = await host.register_all(args.register_interval, args.register_concurrency)
+        print(f"Player host on port {args.port}: {accepted}/{args.players} players registered")
+    try:
+        await serving
+    finally:
+        await host.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
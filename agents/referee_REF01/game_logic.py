@@ -6,7 +6,10 @@ from the league_sdk to determine match outcomes.
 
 import logging
 import random
-from typing import Dict
+from typing import Dict, Optional
+
+# Shared with the league manager, which forfeits matches of players known to be down
+from league_sdk.helpers import technical_loss_result
 
 
 def execute_match(
@@ -14,7 +17,9 @@ def execute_match(
     player_B_id: str,
     choice_A: str,
     choice_B: str,
-    game
+    game,
+    match_id: Optional[str] = None,
+    league_id: Optional[str] = None
 ) -> Dict:
     """
     Execute a single match using the game rules.
@@ -25,6 +30,8 @@ def execute_match(
         choice_A: Player A's parity choice ("even" or "odd")
         choice_B: Player B's parity choice ("even" or "odd")
         game: EvenOddRules instance from league_sdk
+        match_id: Match identifier, selects the match's RNG stream when seeded
+        league_id: League of the match, part of the RNG stream key
     
     Returns:
         {
@@ -49,7 +56,7 @@ def execute_match(
         choice_B = "odd"
     
     # Draw random number using game rules
-    drawn_number = game.draw_number()
+    drawn_number = game.draw_number(match_id, league_id)
     
     # Determine winner (EvenOddRules expects choice_A, choice_B, drawn_number)
     winner_result, reason = game.determine_winner(choice_A, choice_B, drawn_number)
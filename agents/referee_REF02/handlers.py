@@ -4,19 +4,35 @@ This module contains all message handling logic for the referee agent.
 Handles invitations, parity collection, and result reporting.
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional
-from league_sdk.helpers import get_iso_timestamp, generate_conversation_id
+import time
+from typing import Dict, Optional, Set
+from league_sdk import deadlines
+from league_sdk.helpers import get_iso_timestamp, generate_conversation_id, tool_result
 from league_sdk.mcp_client import MCPClient
+from league_sdk.batcher import MessageBatcher
+from league_sdk.tracing import tracer
 
 
 class RefereeHandlers:
     """Message handlers for Referee Agent."""
     
-    def __init__(self, referee):
-        """Initialize handlers with reference to referee agent."""
+    def __init__(self, referee, mcp_client: Optional[MCPClient] = None):
+        """Initialize handlers with reference to referee agent and optional shared client."""
         self.referee = referee
-        self.mcp_client = MCPClient()
+        self.mcp_client = mcp_client or MCPClient(timeouts=referee.system_config.timeouts)
+        
+        # Coalesce result reports into report_match_results batches; a batch
+        # that fails or is refused with a retryable error is sent again with
+        # backoff, one refused for good (e.g. bad auth token) is dropped
+        defaults = referee.system_config.defaults
+        self.result_batcher = MessageBatcher(
+            self._send_result_batch,
+            max_batch_size=defaults.get('result_batch_max_size', 16),
+            max_wait_sec=defaults.get('result_batch_window_sec', 0.1),
+            name=f"results-{referee.referee_id}"
+        )
     
     async def start_match(self, args: dict) -> dict:
         """
@@ -29,7 +45,8 @@ class RefereeHandlers:
                 'player_A_id': str,
                 'player_B_id': str,
                 'player_A_endpoint': str,
-                'player_B_endpoint': str
+                'player_B_endpoint': str,
+                'conversation_id': str  # carried by every message of the match
             }
         
         Returns:
@@ -41,48 +58,65 @@ class RefereeHandlers:
         player_B_id = args.get('player_B_id')
         player_A_endpoint = args.get('player_A_endpoint')
         player_B_endpoint = args.get('player_B_endpoint')
+        # A referee can serve several leagues of one manager
+        league_id = args.get('league_id') or self.referee.league_id
+        # One conversation per match, so the match can be followed end-to-end
+        conversation_id = args.get('conversation_id') or generate_conversation_id(f"match-{match_id}")
         
         self.referee.logger.info(
             "MATCH_START",
             match_id=match_id,
             round_id=round_id,
-            players=[player_A_id, player_B_id]
+            players=[player_A_id, player_B_id],
+            conversation_id=conversation_id
         )
         
-        # Send game invitations
-        await self._send_invitations(
+        # Send game invitations; a player that does not acknowledge in time
+        # loses the match technically
+        missed = await self._send_invitations(
             match_id, round_id, player_A_id, player_B_id,
-            player_A_endpoint, player_B_endpoint
+            player_A_endpoint, player_B_endpoint, conversation_id, league_id
         )
         
-        # Collect parity choices
-        choices = await self._collect_parity_choices(
-            match_id, player_A_id, player_B_id,
-            player_A_endpoint, player_B_endpoint
-        )
+        # Collect parity choices from players that joined
+        choices = {}
+        if not missed:
+            choices = await self._collect_parity_choices(
+                match_id, player_A_id, player_B_id,
+                player_A_endpoint, player_B_endpoint, conversation_id, league_id
+            )
+            missed = {player_id for player_id, choice in choices.items() if choice is None}
         
         # Determine winner using game logic
-        from game_logic import execute_match
-        result = execute_match(
-            player_A_id, player_B_id,
-            choices.get(player_A_id), choices.get(player_B_id),
-            self.referee.game
-        )
+        from game_logic import execute_match, technical_loss_result
+        if missed:
+            self.referee.logger.warning("TECHNICAL_LOSS", match_id=match_id, players=sorted(missed))
+            result = technical_loss_result(player_A_id, player_B_id, missed, choices)
+        else:
+            result = execute_match(
+                player_A_id, player_B_id,
+                choices.get(player_A_id), choices.get(player_B_id),
+                self.referee.game,
+                match_id=match_id,
+                league_id=league_id
+            )
         
         # Send game over messages
         await self._send_game_over(
             match_id, player_A_id, player_B_id,
             player_A_endpoint, player_B_endpoint,
-            result
+            result, conversation_id
         )
         
         # Report result to League Manager
-        await self._report_match_result(match_id, round_id, result)
+        await self._report_match_result(match_id, round_id, result, league_id, conversation_id)
         
         self.referee.logger.info(
             "MATCH_COMPLETE",
+            league_id=league_id,
             match_id=match_id,
-            winner=result['winner']
+            winner=result['winner'],
+            drawn_number=result['details'].get('drawn_number')
         )
         
         return {"status": "STARTED", "match_id": match_id}
@@ -90,51 +124,62 @@ class RefereeHandlers:
     async def _send_invitations(
         self, match_id: str, round_id: int,
         player_A_id: str, player_B_id: str,
-        player_A_endpoint: str, player_B_endpoint: str
-    ):
-        """Send GAME_INVITATION to both players."""
+        player_A_endpoint: str, player_B_endpoint: str,
+        conversation_id: str, league_id: Optional[str] = None
+    ) -> Set[str]:
+        """Send GAME_INVITATION to both players; returns those that did not acknowledge."""
         invitation_A = self._create_invitation(
-            match_id, round_id, player_A_id, player_B_id
+            match_id, round_id, player_A_id, player_B_id, conversation_id, league_id
         )
         invitation_B = self._create_invitation(
-            match_id, round_id, player_B_id, player_A_id
+            match_id, round_id, player_B_id, player_A_id, conversation_id, league_id
         )
         
-        # Send invitations concurrently
-        await self.mcp_client.call_tool(
-            player_A_endpoint, "receive_game_invitation", invitation_A
-        )
-        await self.mcp_client.call_tool(
-            player_B_endpoint, "receive_game_invitation", invitation_B
+        # Send invitations concurrently (game_join_ack_timeout_sec each)
+        responses = await asyncio.gather(
+            self.mcp_client.call_tool(player_A_endpoint, "receive_game_invitation", invitation_A),
+            self.mcp_client.call_tool(player_B_endpoint, "receive_game_invitation", invitation_B),
+            return_exceptions=True
         )
+        missed = {
+            player_id for player_id, response in zip((player_A_id, player_B_id), responses)
+            if isinstance(response, Exception)
+        }
         
         self.referee.logger.info(
             "INVITATIONS_SENT",
             match_id=match_id,
-            players=[player_A_id, player_B_id]
+            players=[player_A_id, player_B_id],
+            missed=sorted(missed)
         )
+        return missed
     
     async def _collect_parity_choices(
         self, match_id: str,
         player_A_id: str, player_B_id: str,
-        player_A_endpoint: str, player_B_endpoint: str
-    ) -> Dict[str, str]:
-        """Collect parity choices from both players."""
-        call_msg_A = self._create_parity_call(match_id, player_A_id)
-        call_msg_B = self._create_parity_call(match_id, player_B_id)
+        player_A_endpoint: str, player_B_endpoint: str,
+        conversation_id: str, league_id: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """Collect parity choices from both players; None for a player that missed the deadline."""
+        # One deadline for both calls, carried in the messages and enforced by the client
+        deadline = time.time() + self.referee.system_config.timeouts.move_timeout_sec
+        call_msg_A = self._create_parity_call(match_id, player_A_id, conversation_id, deadline, league_id)
+        call_msg_B = self._create_parity_call(match_id, player_B_id, conversation_id, deadline, league_id)
         
         # Call both players
-        response_A = await self.mcp_client.call_tool(
-            player_A_endpoint, "choose_parity", call_msg_A
-        )
-        response_B = await self.mcp_client.call_tool(
-            player_B_endpoint, "choose_parity", call_msg_B
+        responses = await asyncio.gather(
+            self.mcp_client.call_tool(player_A_endpoint, "choose_parity", call_msg_A),
+            self.mcp_client.call_tool(player_B_endpoint, "choose_parity", call_msg_B),
+            return_exceptions=True
         )
         
-        choices = {
-            player_A_id: response_A.get('parity_choice', 'even'),
-            player_B_id: response_B.get('parity_choice', 'odd')
-        }
+        choices = {}
+        for player_id, response in zip((player_A_id, player_B_id), responses):
+            if isinstance(response, Exception):
+                logging.warning(f"No parity choice from {player_id} in match {match_id}: {response!r}")
+                choices[player_id] = None
+            else:
+                choices[player_id] = tool_result(response).get('parity_choice')
         
         self.referee.logger.info(
             "CHOICES_COLLECTED",
@@ -148,48 +193,101 @@ class RefereeHandlers:
         self, match_id: str,
         player_A_id: str, player_B_id: str,
         player_A_endpoint: str, player_B_endpoint: str,
-        result: dict
+        result: dict, conversation_id: str
     ):
         """Send GAME_OVER message to both players."""
-        game_over_A = self._create_game_over(match_id, player_A_id, result)
-        game_over_B = self._create_game_over(match_id, player_B_id, result)
+        game_over_A = self._create_game_over(match_id, player_A_id, result, conversation_id)
+        game_over_B = self._create_game_over(match_id, player_B_id, result, conversation_id)
         
-        await self.mcp_client.call_tool(
-            player_A_endpoint, "receive_game_over", game_over_A
-        )
-        await self.mcp_client.call_tool(
-            player_B_endpoint, "receive_game_over", game_over_B
+        # The result stands even if a player cannot be told about it
+        responses = await asyncio.gather(
+            self.mcp_client.call_tool(player_A_endpoint, "receive_game_over", game_over_A),
+            self.mcp_client.call_tool(player_B_endpoint, "receive_game_over", game_over_B),
+            return_exceptions=True
         )
+        for player_id, response in zip((player_A_id, player_B_id), responses):
+            if isinstance(response, Exception):
+                logging.warning(f"GAME_OVER not delivered to {player_id} in match {match_id}: {response!r}")
     
     async def _report_match_result(
-        self, match_id: str, round_id: int, result: dict
+        self, match_id: str, round_id: int, result: dict,
+        league_id: Optional[str] = None, conversation_id: Optional[str] = None
     ):
-        """Report match result to League Manager."""
-        league_endpoint = self.referee.league_manager_endpoint
-        
+        """Queue match result for the next batched report to League Manager."""
         report = {
             "protocol": "league.v2",
             "message_type": "MATCH_RESULT_REPORT",
             "sender": f"referee:{self.referee.referee_id}",
             "auth_token": self.referee.auth_token,
             "timestamp": get_iso_timestamp(),
-            "conversation_id": generate_conversation_id(f"report-{match_id}"),
-            "league_id": self.referee.league_id,
+            "conversation_id": conversation_id or generate_conversation_id(f"report-{match_id}"),
+            "league_id": league_id or self.referee.league_id,
             "round_id": round_id,
             "match_id": match_id,
-         "game_type": "even_odd",
+            "game_type": "even_odd",
             "result": result
         }
         
-        await self.mcp_client.call_tool(
-            league_endpoint, "report_match_result", report
+        self.result_batcher.add(report)
+    
+    async def flush_results(self):
+        """Send any queued match results immediately."""
+        await self.result_batcher.flush()
+    
+    async def _send_result_batch(self, reports: list):
+        """
+        Send queued MATCH_RESULT_REPORTs in one report_match_results call.
+        
+        Raises if the call fails or the manager answers with a retryable
+        LEAGUE_ERROR, so the batcher sends the reports again. Any other
+        LEAGUE_ERROR would fail again the same way: it is logged and the
+        reports are dropped.
+        """
+        batch = {
+            "protocol": "league.v2",
+            "message_type": "MATCH_RESULT_BATCH_REPORT",
+            "sender": f"referee:{self.referee.referee_id}",
+            "auth_token": self.referee.auth_token,
+            "timestamp": get_iso_timestamp(),
+            "conversation_id": generate_conversation_id("report-batch"),
+            "league_id": self.referee.league_id,
+            "reports": reports
+        }
+        
+        # A batch mixes matches, so it is traced on its own and is not bound
+        # by the deadline of the match that happened to start the batch
+        with tracer.trace(), deadlines.detached():
+            response = await self.mcp_client.call_tool(
+                self.referee.league_manager_endpoint, "report_match_results", batch
+            )
+        
+        response = tool_result(response)
+        if response.get('message_type') == 'LEAGUE_ERROR':
+            error_code = response.get('error_code')
+            if response.get('retryable'):
+                raise RuntimeError(
+                    f"report_match_results refused with {error_code}: {response.get('error_description')}"
+                )
+            logging.error(f"Dropping {len(reports)} match results refused with {error_code}")
+            self.referee.logger.error(
+                "MATCH_RESULTS_REJECTED",
+                match_ids=[report['match_id'] for report in reports],
+                error_code=error_code,
+                error_description=response.get('error_description')
+            )
+            return
+        
+        self.referee.logger.info(
+            "MATCH_RESULTS_REPORTED",
+            match_ids=[report['match_id'] for report in reports]
         )
     
     def _create_invitation(
         self, match_id: str, round_id: int,
-        player_id: str, opponent_id: str
+        player_id: str, opponent_id: str, conversation_id: str,
+        league_id: Optional[str] = None
     ) -> dict:
-        """Create GAME_INVITATION message."""
+        """Create GAME_INVITATION message for the match's league (default: the referee's)."""
         # Determine role based on player position
         role_in_match = "PLAYER_A"  # Should be passed as parameter
         
@@ -198,9 +296,9 @@ class RefereeHandlers:
             "message_type": "GAME_INVITATION",
             "sender": f"referee:{self.referee.referee_id}",
             "timestamp": get_iso_timestamp(),
-            "conversation_id": generate_conversation_id(f"invite-{match_id}-{player_id}"),
+            "conversation_id": conversation_id,
             "auth_token": self.referee.auth_token,
-            "league_id": self.referee.league_id,
+            "league_id": league_id or self.referee.league_id,
             "round_id": round_id,
             "match_id": match_id,
             "game_type": "even_odd",
@@ -208,22 +306,19 @@ class RefereeHandlers:
             "opponent_id": opponent_id
         }
     
-    def _create_parity_call(self, match_id: str, player_id: str) -> dict:
-        """Create CHOOSE_PARITY_CALL message."""
-        from datetime import datetime, timedelta
-        
-        # Calculate deadline (30 seconds from now)
-        deadline = datetime.utcnow() + timedelta(seconds=30)
-        deadline_str = deadline.strftime("%Y-%m-%dT%H:%M:%SZ")
-        
+    def _create_parity_call(
+        self, match_id: str, player_id: str, conversation_id: str, deadline: float,
+        league_id: Optional[str] = None
+    ) -> dict:
+        """Create CHOOSE_PARITY_CALL message answering by ``deadline`` (epoch seconds)."""
         return {
             "protocol": "league.v2",
             "message_type": "CHOOSE_PARITY_CALL",
             "sender": f"referee:{self.referee.referee_id}",
             "timestamp": get_iso_timestamp(),
-            "conversation_id": generate_conversation_id(f"parity-{match_id}-{player_id}"),
+            "conversation_id": conversation_id,
             "auth_token": self.referee.auth_token,
-            "league_id": self.referee.league_id,
+            "league_id": league_id or self.referee.league_id,
             "match_id": match_id,
             "player_id": player_id,
             "game_type": "even_odd",
@@ -236,18 +331,20 @@ class RefereeHandlers:
                     "draws": 0
                 }
             },
-            "deadline": deadline_str
+            "deadline": deadlines.format_deadline(deadline)
         }
     
     def _create_game_over(
-        self, match_id: str, player_id: str, result: dict
+        self, match_id: str, player_id: str, result: dict, conversation_id: str
     ) -> dict:
         """Create GAME_OVER message matching specification."""
         details = result.get('details', {})
         winner = result.get('winner')
         
         # Determine status
-        if winner is None:
+        if player_id in details.get('technical_loss', ()):
+            status = "TECHNICAL_LOSS"
+        elif winner is None:
             status = "DRAW"
         else:
             status = "WIN"
@@ -257,7 +354,7 @@ class RefereeHandlers:
             "message_type": "GAME_OVER",
             "sender": f"referee:{self.referee.referee_id}",
             "timestamp": get_iso_timestamp(),
-            "conversation_id": generate_conversation_id(f"game-over-{match_id}"),
+            "conversation_id": conversation_id,
             "auth_token": self.referee.auth_token,
             "match_id": match_id,
             "game_type": "even_odd",
@@ -10,20 +10,27 @@ import argparse
 import logging
 from pathlib import Path
 import sys
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.helpers import generate_conversation_id, get_iso_timestamp
 from league_sdk.mcp_server import MCPServer
 from league_sdk.mcp_client import MCPClient
+from league_sdk.hedging import HedgePolicy
+from league_sdk.unix_socket import server_sockets, unix_endpoint
 from league_sdk.game_rules.even_odd import EvenOddRules
+from league_sdk.game_rules.rng import create_rng_provider
 from handlers import RefereeHandlers
 
 
 class RefereeAgent:
     """Referee Agent for managing matches using modular architecture."""
     
-    def __init__(self, referee_id: str, league_id: str, league_manager_url: str, port: int):
+    def __init__(self, referee_id: str, league_id: str, league_manager_url: str, port: int,
+                 rng_seed: Optional[str] = None, transport: str = "http",
+                 hedge_percentile: Optional[float] = None):
         """Initialize referee with SDK configuration."""
         # Load configuration
         config_loader = ConfigLoader()
@@ -34,21 +41,26 @@ class RefereeAgent:
         self.league_id = league_id
         self.league_manager_url = league_manager_url
         self.port = port
+        self.contact_endpoint = f"http://localhost:{port}/mcp"
         self.auth_token = None
         
         # Initialize logging  
         self.logger = JsonLogger(f"referee:{referee_id}", league_id=league_id)
         self.logger.info("REFEREE_INIT", referee_id=referee_id)
         
-        # Game logic
-        self.game = EvenOddRules()
+        # Game logic (seeded RNG makes every draw replayable from the league seed)
+        self.game = EvenOddRules(create_rng_provider(rng_seed))
+        self.logger.info("RNG_CONFIGURED", provider=self.game.rng_provider.name)
         
         # MCP components
         self.mcp_server = MCPServer(f"Referee-{referee_id}")
-        self.mcp_client = MCPClient()
+        # Slow choose_parity calls are duplicated after this latency percentile (opt-in)
+        hedging = HedgePolicy(percentile=hedge_percentile) if hedge_percentile else None
+        self.mcp_client = MCPClient(transport=transport, timeouts=self.system_config.timeouts,
+                                    hedging=hedging)
         
-        # Initialize handlers with match execution logic
-        self.handlers = RefereeHandlers(self)
+        # Initialize handlers with match execution logic (calls players on the same client)
+        self.handlers = RefereeHandlers(self, self.mcp_client)
         self._setup_tools()
         
         # Store league manager endpoint for result reporting
@@ -77,15 +89,27 @@ class RefereeAgent:
                 "display_name": f"Referee-{self.referee_id}",
                 "version": "2.1.0",
                 "game_types": ["even_odd"],
-                "contact_endpoint": f"http://localhost:{self.port}/mcp",
+                "contact_endpoint": self.contact_endpoint,
                 "max_concurrent_matches": 1
             }
             
-            response = await self.mcp_client.call_tool(
-                self.league_manager_url,
-                "register_referee",
-                {"referee_meta": referee_meta}
-)
+            registration_request = {
+                "protocol": "league.v2",
+                "message_type": "REFEREE_REGISTER_REQUEST",
+                "sender": f"referee:{self.referee_id}",
+                "timestamp": get_iso_timestamp(),
+                "conversation_id": generate_conversation_id(f"register-{self.referee_id}"),
+                "league_id": self.league_id,
+                "referee_meta": referee_meta
+            }
+            
+            # Retries carry the same request: the manager registers the referee once
+            response = await self.mcp_client.call_tool_with_retry(
+                self.league_manager_url, "register_referee", registration_request
+            )
+            if response is None:
+                logging.error("Referee registration failed: league manager unreachable")
+                return
             
             # Parse MCP response wrapper
             if 'content' in response and len(response['content']) > 0:
@@ -95,9 +119,14 @@ class RefereeAgent:
                 result = response
             
             if result.get("status") == "ACCEPTED":
+                # The token belongs to the id the manager assigned, which every
+                # later message names as its sender
+                local_id = self.referee_id
+                self.referee_id = result.get("referee_id", local_id)
                 self.auth_token = result.get("auth_token")
-                logging.info(f"Referee {self.referee_id} registered successfully")
-                self.logger.info("REFEREE_REGISTERED", auth_token_received=bool(self.auth_token))
+                logging.info(f"Referee {local_id} registered successfully as {self.referee_id}")
+                self.logger.info("REFEREE_REGISTERED", referee_id=self.referee_id,
+                                 auth_token_received=bool(self.auth_token))
             else:
                 logging.error(f"Referee registration failed: {result}")
         except Exception as e:
@@ -111,11 +140,23 @@ async def main():
     parser.add_argument("--league-id", default="league_2025_even_odd")
     parser.add_argument("--port", type=int, default=8001)
     parser.add_argument("--league-manager", required=True, help="League manager MCP endpoint URL")
+    parser.add_argument("--rng-seed", default=None,
+                        help="League seed for reproducible draws (default: secure SystemRandom)")
+    parser.add_argument("--transport", choices=["http", "websocket"], default="http",
+                        help="Transport for calls to players (websocket falls back to HTTP)")
+    parser.add_argument("--uds", default=None,
+                        help="Also serve on this Unix socket (*.sock) and register it as contact endpoint")
+    parser.add_argument("--hedge-percentile", type=float, default=None,
+                        help="Duplicate choose_parity calls slower than this latency percentile (e.g., 95)")
     args = parser.parse_args()
     
     logging.basicConfig(level=logging.INFO)
     
-    referee = RefereeAgent(args.referee_id, args.league_id, args.league_manager, args.port)
+    referee = RefereeAgent(args.referee_id, args.league_id, args.league_manager, args.port,
+                           rng_seed=args.rng_seed, transport=args.transport,
+                           hedge_percentile=args.hedge_percentile)
+    if args.uds:
+        referee.contact_endpoint = unix_endpoint(args.uds)
     
     # Register with league manager
     await referee.register_with_league()
@@ -129,7 +170,7 @@ async def main():
         log_level="info"
     )
     server = uvicorn.Server(uvicorn_config)
-    await server.serve()
+    await server.serve(sockets=server_sockets("localhost", args.port, args.uds))
 
 
 if __name__ == "__main__":
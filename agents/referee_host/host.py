@@ -0,0 +1,214 @@
+"""Referee Host - Hosted referees and the shared match executor.
+
+Runs many logical referees in one process. Each referee keeps its own identity,
+auth token, logger and result batcher; the HTTP server, the outgoing connection
+pool, the game rules and the match executor are shared, so the process-wide
+number of running matches is bounded by one setting.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from league_sdk import ConfigLoader, JsonLogger, deadlines
+from league_sdk.agent_loader import load_agent_modules
+from league_sdk.helpers import generate_conversation_id, get_iso_timestamp
+from league_sdk.game_rules.even_odd import EvenOddRules
+from league_sdk.game_rules.rng import create_rng_provider
+from league_sdk.mcp_client import MCPClient
+from league_sdk.hedging import HedgePolicy
+from league_sdk.mcp_host import MCPHost
+
+
+class MatchExecutor:
+    """
+    Run matches as background tasks with a process-wide concurrency limit.
+
+    Submitted matches wait for a free slot; ``start_match`` can therefore answer
+    the league manager immediately while the match itself is queued.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max(1, max_concurrent)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._tasks: Set[asyncio.Task] = set()
+        self.running = 0
+        self.peak_running = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def queued(self) -> int:
+        """Matches submitted but not yet running."""
+        return len(self._tasks) - self.running
+
+    def submit(self, match_id: str, run: Callable[[], Awaitable]) -> None:
+        """Queue one match; ``run`` is called once a slot is free."""
+        task = asyncio.create_task(self._run(match_id, run), name=f"match-{match_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, match_id: str, run: Callable[[], Awaitable]) -> None:
+        async with self._slots:
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+            try:
+                # start_match has already been answered; the match is not
+                # bound by the league manager's deadline for that call
+                with deadlines.detached():
+                    await run()
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"Match {match_id} failed: {e}")
+            finally:
+                self.running -= 1
+
+    async def drain(self) -> None:
+        """Wait for every submitted match to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+class HostedReferee:
+    """Per-referee state for RefereeHandlers."""
+
+    __slots__ = ("key", "referee_id", "league_id", "system_config", "auth_token",
+                 "game", "endpoint", "league_manager_endpoint", "logger", "handlers")
+
+    def __init__(self, key: str, league_id: str, system_config, game: EvenOddRules,
+                 endpoint: str, league_manager_endpoint: str):
+        self.key = key
+        self.referee_id = key  # replaced by the id assigned at registration
+        self.league_id = league_id
+        self.system_config = system_config
+        self.auth_token = None
+        self.game = game
+        self.endpoint = endpoint
+        self.league_manager_endpoint = league_manager_endpoint
+        self.logger = JsonLogger(f"referee:{key}", league_id=league_id)
+        self.handlers = None
+
+    async def notify_league_completed(self, args: dict) -> dict:
+        """Handle league completed notification."""
+        champion = args.get('champion', {})
+        self.logger.info("LEAGUE_COMPLETED", champion=champion.get('player_id'))
+        return {"status": "ACK"}
+
+
+class RefereeHost:
+    """Many RefereeAgents behind one MCPHost, one MCPClient and one MatchExecutor."""
+
+    def __init__(
+        self,
+        league_id: str,
+        league_manager_url: str,
+        base_url: str,
+        max_concurrent_matches: int,
+        max_connections: Optional[int] = None,
+        rng_seed: Optional[str] = None,
+        transport: str = "http",
+        hedge_percentile: Optional[float] = None,
+    ):
+        self.league_id = league_id
+        self.league_manager_url = league_manager_url
+        self.base_url = base_url
+        self.system_config = ConfigLoader().load_system()
+        self.game = EvenOddRules(create_rng_provider(rng_seed))
+        self.mcp_server = MCPHost("RefereeHost")
+        hedging = HedgePolicy(percentile=hedge_percentile) if hedge_percentile else None
+        self.mcp_client = MCPClient(max_connections=max_connections, transport=transport,
+                                    timeouts=self.system_config.timeouts, hedging=hedging)
+        self.executor = MatchExecutor(max_concurrent_matches)
+        self.referees: Dict[str, HostedReferee] = {}
+        self.logger = JsonLogger("referee_host", league_id=league_id)
+        self.logger.info("RNG_CONFIGURED", provider=self.game.rng_provider.name)
+        modules = load_agent_modules("referee_template", ["game_logic", "handlers"])
+        self.handlers_cls = modules["handlers"].RefereeHandlers
+
+    def add_referee(self, key: str) -> HostedReferee:
+        """Create a hosted referee and expose it at /mcp/{key}."""
+        endpoint = self.mcp_server.agent_endpoint(self.base_url, key)
+        referee = HostedReferee(key, self.league_id, self.system_config, self.game,
+                                endpoint, self.league_manager_url)
+        referee.handlers = self.handlers_cls(referee, self.mcp_client)
+        self.mcp_server.register_agent(key, {
+            "start_match": lambda args, referee=referee: self.start_match(referee, args),
+            "notify_league_completed": referee.notify_league_completed,
+        })
+        self.referees[key] = referee
+        return referee
+
+    async def start_match(self, referee: HostedReferee, args: dict) -> dict:
+        """Queue the match on the shared executor and acknowledge at once."""
+        match_id = args.get('match_id')
+        self.executor.submit(match_id, lambda: referee.handlers.start_match(args))
+        referee.logger.info("MATCH_QUEUED", match_id=match_id,
+                            running=self.executor.running, queued=self.executor.queued)
+        return {"status": "STARTED", "match_id": match_id}
+
+    async def register_all(self) -> int:
+        """
+        Register every hosted referee with the league manager.
+
+        Returns:
+            Number of accepted registrations
+        """
+        accepted = 0
+        for referee in self.referees.values():
+            accepted += await self.register_referee(referee)
+        self.logger.info("REFEREES_REGISTERED", accepted=accepted, total=len(self.referees))
+        return accepted
+
+    async def register_referee(self, referee: HostedReferee) -> bool:
+        """Register one hosted referee (same request as RefereeAgent)."""
+        referee_meta = {
+            "display_name": f"Referee-{referee.key}",
+            "version": "2.1.0",
+            "game_types": ["even_odd"],
+            "contact_endpoint": referee.endpoint,
+            "max_concurrent_matches": self.executor.max_concurrent
+        }
+        registration_request = {
+            "protocol": "league.v2",
+            "message_type": "REFEREE_REGISTER_REQUEST",
+            "sender": f"referee:{referee.key}",
+            "timestamp": get_iso_timestamp(),
+            "conversation_id": generate_conversation_id(f"register-{referee.key}"),
+            "league_id": referee.league_id,
+            "referee_meta": referee_meta
+        }
+        try:
+            # Retries carry the same request: the manager registers the referee once
+            response = await self.mcp_client.call_tool_with_retry(
+                self.league_manager_url, "register_referee", registration_request
+            )
+            if response is None:
+                logging.error(f"Referee {referee.key} registration failed: league manager unreachable")
+                return False
+            if 'content' in response and len(response['content']) > 0:
+                result = json.loads(response['content'][0].get('text', '{}'))
+            else:
+                result = response
+        except Exception as e:
+            logging.error(f"Error registering referee {referee.key}: {e}")
+            return False
+        if result.get("status") != "ACCEPTED":
+            logging.error(f"Referee {referee.key} registration failed: {result}")
+            return False
+        # Results are authenticated against the id the manager assigned
+        referee.referee_id = result.get("referee_id", referee.key)
+        referee.auth_token = result.get("auth_token")
+        referee.logger.info("REFEREE_REGISTERED", referee_id=referee.referee_id,
+                            auth_token_received=bool(referee.auth_token))
+        return True
+
+    async def close(self):
+        """Finish running matches, send pending results and close the pool."""
+        await self.executor.drain()
+        for referee in self.referees.values():
+            await referee.handlers.flush_results()
+        self.logger.info("REFEREE_HOST_STOPPED", completed=self.executor.completed,
+                         failed=self.executor.failed, peak_running=self.executor.peak_running)
+        await self.mcp_client.close()
@@ -0,0 +1,79 @@
+"""
+Referee Host - Run many referees in one process.
+
+Registers N logical referees with the league manager, each reachable at
+http://<host>:<port>/mcp/<key>. They run the referee_template match logic on
+one shared executor, so referee capacity is set by --referees and
+--max-concurrent-matches instead of copying referee directories.
+
+Usage:
+  python main.py --referees 8 --max-concurrent-matches 32 --league-manager http://localhost:8000/mcp
+"""
+
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from league_sdk.unix_socket import server_sockets, unix_endpoint
+from host import RefereeHost
+
+
+async def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Host many referees in one process")
+    parser.add_argument("--referees", type=int, required=True, help="Number of logical referees")
+    parser.add_argument("--key-prefix", default="R", help="Prefix of the per-referee route keys")
+    parser.add_argument("--max-concurrent-matches", type=int, default=16,
+                        help="Matches running at once across all hosted referees")
+    parser.add_argument("--league-id", default="league_2025_even_odd")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--league-manager", required=True, help="League manager MCP endpoint URL")
+    parser.add_argument("--max-connections", type=int, default=100,
+                        help="Size of the shared outgoing connection pool")
+    parser.add_argument("--rng-seed", default=None,
+                        help="League seed for reproducible draws (default: secure SystemRandom)")
+    parser.add_argument("--transport", choices=["http", "websocket"], default="http",
+                        help="Transport for calls to players (websocket falls back to HTTP)")
+    parser.add_argument("--uds", default=None,
+                        help="Also serve on this Unix socket (*.sock) and register referees on it")
+    parser.add_argument("--hedge-percentile", type=float, default=None,
+                        help="Duplicate choose_parity calls slower than this latency percentile (e.g., 95)")
+    parser.add_argument("--verbose", action="store_true", help="Log every message")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    base_url = unix_endpoint(args.uds, "") if args.uds else f"http://{args.host}:{args.port}"
+    host = RefereeHost(args.league_id, args.league_manager, base_url,
+                       max_concurrent_matches=args.max_concurrent_matches,
+                       max_connections=args.max_connections, rng_seed=args.rng_seed,
+                       transport=args.transport, hedge_percentile=args.hedge_percentile)
+    width = len(str(args.referees))
+    for index in range(args.referees):
+        host.add_referee(f"{args.key_prefix}{index + 1:0{width}d}")
+
+    # Start MCP server, then register so the manager can reach us right away
+    import uvicorn
+    uvicorn_config = uvicorn.Config(host.mcp_server.app, host=args.host, port=args.port,
+                                    log_level="info" if args.verbose else "warning")
+    server = uvicorn.Server(uvicorn_config)
+    serving = asyncio.create_task(server.serve(sockets=server_sockets(args.host, args.port, args.uds)))
+    while not server.started and not serving.done():
+        await asyncio.sleep(0.05)
+    if not serving.done():
+        accepted = await host.register_all()
+        print(f"Referee host on port {args.port}: {accepted}/{args.referees} referees registered, "
+              f"{host.executor.max_concurrent} concurrent matches")
+    try:
+        await serving
+    finally:
+        await host.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
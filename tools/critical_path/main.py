@@ -0,0 +1,223 @@
+"""
+Critical Path - Per-match timelines from trace spans.
+
+Agents started with LEAGUE_TRACE_DIR (or a simulation run with --trace) write
+spans to <dir>/trace-<pid>.jsonl. Every match is one trace, from the league
+manager's start_match call through the referee's invitations, parity calls and
+game-over messages to the result being recorded by the manager. This tool
+rebuilds those traces and shows which phase and which agent adds the latency.
+
+Phases of a match:
+  dispatch    start_match sent by the manager until the referee handles it
+  invitation  receive_game_invitation calls
+  parity      choose_parity calls
+  game_over   receive_game_over calls
+  report      referee done until the manager records the (batched) result
+
+Usage:
+  python main.py --traces /tmp/league-traces
+  python main.py --traces /tmp/league-traces --match R1M1
+  python main.py --traces /tmp/league-traces --json critical_path.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+PHASE_OF_TOOL = {
+    "receive_game_invitation": "invitation",
+    "choose_parity": "parity",
+    "receive_game_over": "game_over",
+}
+PHASES = ["dispatch", "invitation", "parity", "game_over", "report"]
+
+
+def load_spans(paths: Iterable[Path]) -> List[Dict]:
+    """Spans from trace files, or from every trace-*.jsonl in a directory."""
+    spans = []
+    for path in paths:
+        files = sorted(path.glob("trace-*.jsonl")) if path.is_dir() else [path]
+        for trace_file in files:
+            with trace_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        spans.append(json.loads(line))
+    return spans
+
+
+def end_of(span: Dict) -> float:
+    return span["start"] + span["duration_ms"] / 1000
+
+
+def critical_path(span: Dict, children: Dict[str, List[Dict]]) -> List[Dict]:
+    """Spans on the critical path below ``span``: walk back from its end through the last-finishing child."""
+    chain, cursor = [], end_of(span)
+    for child in sorted(children.get(span["span_id"], []), key=end_of, reverse=True):
+        if end_of(child) <= cursor + 1e-6:
+            chain.append(child)
+            cursor = child["start"]
+    path = []
+    for child in reversed(chain):
+        path.append(child)
+        path.extend(critical_path(child, children))
+    return path
+
+
+def match_timeline(spans: List[Dict]) -> Optional[Dict]:
+    """Phases, calls and critical path of one match trace."""
+    roots = [s for s in spans if s["name"] == "start_match" and s["kind"] == "client"]
+    if not roots:
+        return None
+    root = min(roots, key=lambda s: s["start"])
+    t0 = root["start"]
+    children = defaultdict(list)
+    for span in spans:
+        if span.get("parent_id"):
+            children[span["parent_id"]].append(span)
+    referee = next((s for s in children[root["span_id"]] if s["kind"] == "server"), None)
+    recorded = min((s for s in spans if s["name"] == "record_match_result"),
+                   key=lambda s: s["start"], default=None)
+
+    phases: Dict[str, float] = {}
+    if referee is not None:
+        phases["dispatch"] = (referee["start"] - t0) * 1000
+    calls = []
+    for span in sorted(spans, key=lambda s: s["start"]):
+        phase = PHASE_OF_TOOL.get(span["name"])
+        if phase is None or span["kind"] != "client":
+            continue
+        server = next((s for s in children[span["span_id"]] if s["kind"] == "server"), None)
+        calls.append({
+            "phase": phase,
+            "agent": span.get("endpoint"),
+            "offset_ms": round((span["start"] - t0) * 1000, 3),
+            "duration_ms": span["duration_ms"],
+            "handler_ms": server["duration_ms"] if server else None,
+        })
+    for phase in ("invitation", "parity", "game_over"):
+        in_phase = [s for s in spans if PHASE_OF_TOOL.get(s["name"]) == phase and s["kind"] == "client"]
+        if in_phase:
+            phases[phase] = (max(map(end_of, in_phase)) - min(s["start"] for s in in_phase)) * 1000
+    referee_end = end_of(referee) if referee is not None else end_of(root)
+    if recorded is not None:
+        phases["report"] = max(0.0, recorded["start"] - referee_end) * 1000
+    finished = recorded["start"] if recorded is not None else end_of(root)
+
+    path = [{
+        "name": s["name"], "kind": s["kind"],
+        "agent": s.get("endpoint") or s.get("service"),
+        "offset_ms": round((s["start"] - t0) * 1000, 3),
+        "duration_ms": s["duration_ms"],
+    } for s in [root] + critical_path(root, children)]
+    return {
+        "match_id": root.get("match_id"),
+        "trace_id": root["trace_id"],
+        "referee": root.get("endpoint"),
+        "total_ms": round((finished - t0) * 1000, 3),
+        "recorded": recorded is not None,
+        "phases_ms": {name: round(value, 3) for name, value in phases.items()},
+        "calls": calls,
+        "critical_path": path,
+    }
+
+
+def summarize(timelines: List[Dict], top: int = 5) -> Dict:
+    """Phase latency across matches and the agents adding the most time."""
+    def describe(values: List[float]) -> Dict:
+        ordered = sorted(values)
+        return {
+            "matches": len(ordered),
+            "mean_ms": round(statistics.fmean(ordered), 3),
+            "p50_ms": round(ordered[len(ordered) // 2], 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+            "max_ms": round(ordered[-1], 3),
+        }
+
+    phases = {}
+    for phase in PHASES:
+        values = [t["phases_ms"][phase] for t in timelines if phase in t["phases_ms"]]
+        if values:
+            phases[phase] = describe(values)
+    agent_ms: Dict[str, List[float]] = defaultdict(list)
+    for timeline in timelines:
+        for call in timeline["calls"]:
+            agent_ms[call["agent"]].append(call["duration_ms"])
+    slowest = sorted(agent_ms.items(), key=lambda item: sum(item[1]), reverse=True)[:top]
+    return {
+        "matches": len(timelines),
+        "total": describe([t["total_ms"] for t in timelines]) if timelines else None,
+        "phases": phases,
+        "slowest_agents": [
+            {"agent": agent, "calls": len(values), "total_ms": round(sum(values), 3),
+             "mean_ms": round(statistics.fmean(values), 3)}
+            for agent, values in slowest
+        ],
+    }
+
+
+def print_summary(summary: Dict) -> None:
+    print("\n" + "=" * 72)
+    print(f"  MATCH CRITICAL PATH ({summary['matches']} matches)")
+    print("=" * 72)
+    if summary["total"]:
+        total = summary["total"]
+        print(f"Total: mean {total['mean_ms']:.2f} ms  p50 {total['p50_ms']:.2f} ms  "
+              f"p95 {total['p95_ms']:.2f} ms  max {total['max_ms']:.2f} ms")
+    print("-" * 72)
+    print(f"{'Phase':<12} {'Matches':>8} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for phase, stats in summary["phases"].items():
+        print(f"{phase:<12} {stats['matches']:>8} {stats['mean_ms']:>10.2f} {stats['p50_ms']:>10.2f} "
+              f"{stats['p95_ms']:>10.2f} {stats['max_ms']:>10.2f}")
+    print("-" * 72)
+    print("Agents adding the most time (calls made to them during matches):")
+    for agent in summary["slowest_agents"]:
+        print(f"  {agent['agent']:<44} {agent['calls']:>5} calls {agent['total_ms']:>10.2f} ms "
+              f"(mean {agent['mean_ms']:.2f})")
+    print("=" * 72 + "\n")
+
+
+def print_timeline(timeline: Dict) -> None:
+    print(f"\nMatch {timeline['match_id']}  trace {timeline['trace_id']}  "
+          f"total {timeline['total_ms']:.2f} ms" + ("" if timeline["recorded"] else "  (result not recorded)"))
+    print("  Phases: " + ", ".join(f"{name} {ms:.2f} ms" for name, ms in timeline["phases_ms"].items()))
+    print(f"  {'+ms':>10} {'ms':>9}  critical path")
+    for step in timeline["critical_path"]:
+        print(f"  {step['offset_ms']:>10.2f} {step['duration_ms']:>9.2f}  "
+              f"{step['name']} ({step['kind']}) {step['agent'] or ''}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild per-match critical paths from trace spans")
+    parser.add_argument("--traces", required=True, action="append",
+                        help="Trace directory or JSONL file (repeatable)")
+    parser.add_argument("--match", action="append", default=[],
+                        help="Print the full timeline of this match_id (repeatable)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest agents to list")
+    parser.add_argument("--json", default=None, help="Write summary and timelines as JSON")
+    args = parser.parse_args()
+
+    spans = load_spans(Path(p) for p in args.traces)
+    traces: Dict[str, List[Dict]] = defaultdict(list)
+    for span in spans:
+        traces[span["trace_id"]].append(span)
+    timelines = [t for t in (match_timeline(s) for s in traces.values()) if t is not None]
+    if not timelines:
+        print(f"No match traces in {len(spans)} spans", file=sys.stderr)
+        return 1
+
+    summary = summarize(timelines, args.top)
+    print_summary(summary)
+    for timeline in timelines:
+        if timeline["match_id"] in args.match:
+            print_timeline(timeline)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"summary": summary, "matches": timelines}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""League Bench - Baseline comparison.
+
+Runs are matched to the baseline by (mode, players, referees). Each checked
+metric has a threshold in percent: a change worse than the threshold is a
+regression. Changes smaller than the metric's noise floor are ignored, so
+sub-millisecond jitter in small leagues does not fail a run.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+# Worst allowed change per metric, in percent of the baseline
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "matches_per_sec": 10.0,
+    "registration_sec": 25.0,
+    "peak_rss_mb": 15.0,
+    "cpu_sec": 20.0,
+    "tool_p99_ms": 25.0,
+}
+HIGHER_IS_BETTER = {"matches_per_sec"}
+NOISE_FLOOR = {
+    "matches_per_sec": 0.5,
+    "registration_sec": 0.05,
+    "peak_rss_mb": 2.0,
+    "cpu_sec": 0.05,
+    "tool_p99_ms": 0.5,
+}
+
+
+def parse_thresholds(values: List[str]) -> Dict[str, float]:
+    """Defaults overridden by ``metric=percent`` strings."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for value in values:
+        metric, _, percent = value.partition("=")
+        if metric not in DEFAULT_THRESHOLDS or not percent:
+            raise ValueError(f"Threshold must be one of {sorted(DEFAULT_THRESHOLDS)}=<percent>, got {value!r}")
+        thresholds[metric] = float(percent)
+    return thresholds
+
+
+def run_key(result: Dict) -> Tuple[str, int, int]:
+    return result["mode"], result["players"], result["referees"]
+
+
+def checked_values(result: Dict) -> List[Tuple[str, str, Optional[float]]]:
+    """(metric, label shown in the report, value) of every compared number in a run."""
+    values = [
+        ("matches_per_sec", "matches_per_sec", result.get("matches_per_sec")),
+        ("registration_sec", "registration_sec", result.get("registration_sec")),
+        ("peak_rss_mb", "peak_rss_mb", max((a["peak_rss_mb"] for a in result.get("agents", {}).values()),
+                                           default=None)),
+        ("cpu_sec", "cpu_sec", sum(a["cpu_sec"] for a in result.get("agents", {}).values())
+         if result.get("agents") else None),
+    ]
+    for tool, stats in sorted(result.get("tools", {}).items()):
+        values.append(("tool_p99_ms", f"{tool} p99_ms", stats.get("p99_ms")))
+    return values
+
+
+def compare(current: Dict, baseline: Dict, thresholds: Dict[str, float]) -> List[Dict]:
+    """One row per metric present in both runs, with its change and verdict."""
+    baseline_runs = {run_key(r): r for r in baseline.get("results", [])}
+    rows = []
+    for result in current.get("results", []):
+        base = baseline_runs.get(run_key(result))
+        if base is None:
+            continue
+        base_values = {label: value for _, label, value in checked_values(base)}
+        for metric, label, value in checked_values(result):
+            old = base_values.get(label)
+            if value is None or not old:
+                continue
+            change = (value - old) / old * 100
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            regression = worse > thresholds[metric] and abs(value - old) >= NOISE_FLOOR[metric]
+            rows.append({
+                "mode": result["mode"],
+                "players": result["players"],
+                "metric": label,
+                "baseline": old,
+                "current": value,
+                "change_pct": round(change, 1),
+                "threshold_pct": thresholds[metric],
+                "regression": regression,
+            })
+    return rows
+
+
+def print_comparison(rows: List[Dict]) -> None:
+    print("\n" + "=" * 88)
+    print("  BASELINE COMPARISON")
+    print("=" * 88)
+    print(f"{'Mode':<9} {'Players':>7}  {'Metric':<34} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    print("-" * 88)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['mode']:<9} {row['players']:>7}  {row['metric']:<34} {row['baseline']:>10.3f} "
+              f"{row['current']:>10.3f} {row['change_pct']:>+7.1f}%{flag}")
+    regressions = sum(1 for row in rows if row["regression"])
+    print("-" * 88)
+    print(f"{regressions} regression(s) in {len(rows)} compared metrics")
+    print("=" * 88 + "\n")
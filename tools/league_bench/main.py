@@ -0,0 +1,131 @@
+"""
+League Bench - End-to-end league benchmark.
+
+Plays leagues of growing size and records registration time, matches per
+second, per-tool handler latency percentiles, and peak RSS and CPU time per
+agent process. Results are written as JSON and can be compared with a stored
+baseline; the exit status is 1 when a metric regressed past its threshold.
+
+Modes:
+  loopback  the whole league in one process over the loopback transport
+            (tools/simulation), so 1024 players take seconds to set up
+  process   the real league manager, referee and player processes on
+            localhost (ports 8000, 8001.., 8101..); --players-per-process
+            groups players into player_host processes
+
+Usage:
+  python main.py --sizes 4,32,256,1024 --json bench.json
+  python main.py --mode process --sizes 4,16 --referees 2 --json bench.json
+  python main.py --sizes 4,32,256 --baseline baseline.json --threshold matches_per_sec=5
+  python main.py --sizes 4,32,256 --save-baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from compare import DEFAULT_THRESHOLDS, compare, parse_thresholds, print_comparison
+from runner import ProcessLeague, run_loopback
+
+
+def print_results(results) -> None:
+    print("\n" + "=" * 88)
+    print("  LEAGUE BENCHMARK")
+    print("=" * 88)
+    print(f"{'Mode':<9} {'Players':>7} {'Refs':>5} {'Matches':>8} {'Reg s':>8} {'League s':>9} "
+          f"{'Matches/s':>10} {'Peak RSS MB':>12} {'CPU s':>8}")
+    print("-" * 88)
+    for r in results:
+        peak = max(a["peak_rss_mb"] for a in r["agents"].values())
+        cpu = sum(a["cpu_sec"] for a in r["agents"].values())
+        print(f"{r['mode']:<9} {r['players']:>7} {r['referees']:>5} {r['matches']:>8} "
+              f"{r['registration_sec']:>8.3f} {r['league_sec']:>9.3f} {r['matches_per_sec']:>10.1f} "
+              f"{peak:>12.1f} {cpu:>8.2f}")
+    print("-" * 88)
+    print(f"{'Tool latency (ms)':<34} {'Players':>7} {'Count':>9} {'p50':>9} {'p90':>9} {'p99':>9}")
+    for r in results:
+        for tool, stats in r["tools"].items():
+            cells = [f"{stats[q]:>9.3f}" if stats[q] is not None else f"{'>33s':>9}"
+                     for q in ("p50_ms", "p90_ms", "p99_ms")]
+            print(f"{tool:<34} {r['players']:>7} {stats['count']:>9} " + " ".join(cells))
+    print("=" * 88 + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end league benchmark")
+    parser.add_argument("--mode", choices=["loopback", "process"], default="loopback")
+    parser.add_argument("--sizes", default="4,32,256,1024", help="Comma-separated player counts")
+    parser.add_argument("--referees", type=int, default=None,
+                        help="Referees per league (default: one per 8 players, 1..8)")
+    parser.add_argument("--strategies", default="random,always_even,always_odd,alternating")
+    parser.add_argument("--max-rounds", type=int, default=None,
+                        help="Loopback mode: play only the first N rounds of each league")
+    parser.add_argument("--players-per-process", type=int, default=1,
+                        help="Process mode: players per player_host process (1 = one process per player)")
+    parser.add_argument("--registration-timeout", type=float, default=120.0,
+                        help="Process mode: seconds allowed for every agent to register")
+    parser.add_argument("--timeout", type=float, default=3600.0, help="Seconds allowed per league")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--work-dir", default=None,
+                        help="Directory for per-run state, logs and agent output (default: temporary)")
+    parser.add_argument("--json", default=None, help="Write the results as JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Compare with this stored result file")
+    parser.add_argument("--threshold", action="append", default=[],
+                        help=f"Regression threshold metric=percent (repeatable; defaults {DEFAULT_THRESHOLDS})")
+    parser.add_argument("--save-baseline", default=None, help="Also store the results as a baseline here")
+    args = parser.parse_args()
+
+    try:
+        thresholds = parse_thresholds(args.threshold)
+    except ValueError as e:
+        parser.error(str(e))
+    sizes = sorted(int(s) for s in args.sizes.split(",") if s.strip())
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="league-bench-")).resolve()
+
+    results = []
+    for players in sizes:
+        referees = args.referees or min(8, max(1, players // 8))
+        run_dir = work_dir / f"{args.mode}-{players}p-{referees}r"
+        print(f"Running {args.mode} league: {players} players, {referees} referees ...", flush=True)
+        if args.mode == "loopback":
+            result = run_loopback(players, referees, run_dir, args.seed, args.max_rounds, args.timeout)
+        else:
+            league = ProcessLeague(players, referees, run_dir, strategies,
+                                   args.players_per_process, args.seed)
+            result = league.run(args.registration_timeout, args.timeout)
+        results.append(result)
+
+    document = {
+        "created": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "mode": args.mode,
+        "seed": args.seed,
+        "results": results,
+    }
+    print_results(results)
+    print(f"Runs: {work_dir}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(document, indent=2))
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(document, indent=2))
+
+    if args.baseline:
+        rows = compare(document, json.loads(Path(args.baseline).read_text()), thresholds)
+        print_comparison(rows)
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    code = main()
+    print(f"Benchmark finished in {time.perf_counter() - started:.1f}s")
+    sys.exit(code)
@@ -0,0 +1,331 @@
+"""League Bench - Runners.
+
+Each run plays one league and returns a result dict:
+
+  players, referees, mode, rounds, matches
+  registration_sec   all agents registered (from the first agent's launch)
+  league_sec         registration closed .. league completed
+  matches_per_sec
+  tools              handler latency per MCP tool: count, mean and percentiles in ms
+  agents             per role: processes, peak RSS (max and mean MB), CPU seconds
+  agent_usage        peak RSS and CPU seconds of every process
+
+``run_loopback`` plays the league in one child process with tools/simulation
+(no sockets). ``ProcessLeague`` launches the real league manager, referees and
+players as processes on localhost, detects progress from their /metrics
+endpoints instead of sleeping, and reads each process's peak RSS and CPU time
+from ``os.wait4`` when it exits.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SIMULATION_MAIN = REPO_ROOT / "tools" / "simulation" / "main.py"
+MANAGER_MAIN = REPO_ROOT / "agents" / "league_manager" / "main.py"
+REFEREE_MAIN = REPO_ROOT / "agents" / "referee_template" / "main.py"
+PLAYER_MAIN = REPO_ROOT / "agents" / "player_template" / "main.py"
+PLAYER_HOST_MAIN = REPO_ROOT / "agents" / "player_host" / "main.py"
+
+MANAGER_PORT = 8000
+REFEREE_BASE_PORT = 8000
+PLAYER_BASE_PORT = 8100
+LATENCY_METRIC = "mcp_server_tool_latency_seconds"
+
+
+def reap(process: subprocess.Popen, block: bool = True) -> Optional[Dict]:
+    """
+    Reap a child with ``os.wait4`` and return its peak RSS (MB) and CPU seconds.
+
+    Returns None if ``block`` is False and the child is still running. Children
+    must be reaped here rather than with Popen.poll/wait, which drop the usage.
+    """
+    pid, status, rusage = os.wait4(process.pid, 0 if block else os.WNOHANG)
+    if not pid:
+        return None
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    rss_kb = rusage.ru_maxrss / 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return {
+        "peak_rss_mb": round(rss_kb / 1024, 1),
+        "cpu_sec": round(rusage.ru_utime + rusage.ru_stime, 3),
+    }
+
+
+def summarize_agents(usage: List[Dict]) -> Dict[str, Dict]:
+    """Per-role process count, peak RSS (max and mean) and total CPU time."""
+    roles: Dict[str, List[Dict]] = defaultdict(list)
+    for entry in usage:
+        roles[entry["role"]].append(entry)
+    return {
+        role: {
+            "processes": len(entries),
+            "peak_rss_mb": max(e["peak_rss_mb"] for e in entries),
+            "mean_rss_mb": round(sum(e["peak_rss_mb"] for e in entries) / len(entries), 1),
+            "cpu_sec": round(sum(e["cpu_sec"] for e in entries), 3),
+        }
+        for role, entries in roles.items()
+    }
+
+
+def run_loopback(players: int, referees: int, run_dir: Path, seed: int,
+                 max_rounds: Optional[int] = None, timeout_sec: float = 3600) -> Dict:
+    """Play one league in a child simulation process."""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    report_path = run_dir / "simulation.json"
+    command = [sys.executable, str(SIMULATION_MAIN), "--players", str(players),
+               "--referees", str(referees), "--seed", str(seed),
+               "--work-dir", str(run_dir), "--json", str(report_path)]
+    if max_rounds is not None:
+        command += ["--max-rounds", str(max_rounds)]
+    with open(run_dir / "simulation.out", "w") as output:
+        process = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT,
+                                   cwd=SIMULATION_MAIN.parent, env=_agent_env())
+    deadline = time.monotonic() + timeout_sec
+    usage = reap(process, block=False)
+    while usage is None and time.monotonic() < deadline:
+        time.sleep(0.2)
+        usage = reap(process, block=False)
+    if usage is None:
+        process.kill()
+        usage = reap(process)
+    if process.returncode != 0 or not report_path.exists():
+        raise RuntimeError(f"simulation of {players} players failed (exit {process.returncode}), "
+                           f"see {run_dir / 'simulation.out'}")
+    report = json.loads(report_path.read_text())
+    usage = [{"name": "simulation", "role": "simulation", **usage}]
+    return {
+        "mode": "loopback",
+        "players": players,
+        "referees": referees,
+        "rounds": report["rounds"],
+        "matches": report["matches"],
+        "registration_sec": report["registration_sec"],
+        "league_sec": report["league_sec"],
+        "matches_per_sec": report["matches_per_sec"],
+        "tools": report["tools"],
+        "loop": report.get("loop"),
+        "agents": summarize_agents(usage),
+        "agent_usage": usage,
+    }
+
+
+def _agent_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # Agent output goes to its .out file as it happens, so a stuck run can be inspected
+    env.setdefault("PYTHONUNBUFFERED", "1")
+    return env
+
+
+def fetch_metrics(port: int, timeout: float = 2.0) -> Optional[str]:
+    """Prometheus text of the agent on ``port``, or None if it does not answer."""
+    try:
+        with urllib.request.urlopen(f"http://localhost:{port}/metrics", timeout=timeout) as response:
+            return response.read().decode("utf-8")
+    except OSError:
+        return None
+
+
+def parse_samples(text: str) -> List[Tuple[str, Dict[str, str], float]]:
+    """(name, labels, value) of every sample in a Prometheus text exposition."""
+    samples = []
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        series, _, value = line.rpartition(" ")
+        name, _, label_text = series.partition("{")
+        labels = {}
+        for pair in label_text.rstrip("}").split('",') if label_text else []:
+            key, _, raw = pair.partition("=")
+            labels[key] = raw.strip('"')
+        samples.append((name, labels, float(value)))
+    return samples
+
+
+def tool_count(text: Optional[str], tool: str) -> int:
+    """Requests a server has handled for ``tool``."""
+    if not text:
+        return 0
+    return int(sum(value for name, labels, value in parse_samples(text)
+                   if name == f"{LATENCY_METRIC}_count" and labels.get("tool") == tool))
+
+
+class LatencyBuckets:
+    """Prometheus histogram buckets of one tool, summed across agents."""
+
+    def __init__(self):
+        self.buckets: Dict[float, float] = defaultdict(float)
+        self.count = 0.0
+        self.sum = 0.0
+
+    def add(self, name: str, labels: Dict[str, str], value: float) -> None:
+        if name == f"{LATENCY_METRIC}_bucket" and labels["le"] != "+Inf":
+            self.buckets[float(labels["le"])] += value
+        elif name == f"{LATENCY_METRIC}_count":
+            self.count += value
+        elif name == f"{LATENCY_METRIC}_sum":
+            self.sum += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound (seconds) of the bucket holding quantile ``q`` (None above the last bound)."""
+        target = q * self.count
+        for bound in sorted(self.buckets):
+            if self.buckets[bound] >= target:
+                return bound
+        return None
+
+    def summary(self) -> Dict:
+        def ms(q):
+            bound = self.percentile(q)
+            return None if bound is None else round(bound * 1000, 4)
+        return {
+            "count": int(self.count),
+            "mean_ms": round(self.sum / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": ms(0.50),
+            "p90_ms": ms(0.90),
+            "p99_ms": ms(0.99),
+        }
+
+
+class ProcessLeague:
+    """A league of real agent processes on localhost."""
+
+    def __init__(self, players: int, referees: int, run_dir: Path, strategies: List[str],
+                 players_per_process: int = 1, seed: Optional[int] = None):
+        self.num_players = players
+        self.num_referees = referees
+        self.run_dir = run_dir
+        self.strategies = strategies
+        self.players_per_process = players_per_process
+        self.seed = seed
+        self.processes: List[Tuple[str, str, int, subprocess.Popen]] = []  # name, role, port, process
+        self.usage: Dict[str, Dict] = {}
+
+    def _launch(self, name: str, role: str, port: int, command: List[str]) -> None:
+        log = open(self.run_dir / f"{name}.out", "w")
+        process = subprocess.Popen([sys.executable] + command, stdout=log, stderr=subprocess.STDOUT,
+                                   cwd=self.run_dir, env=_agent_env())
+        log.close()
+        self.processes.append((name, role, port, process))
+
+    def _wait_for(self, condition, timeout_sec: float, what: str) -> None:
+        deadline = time.monotonic() + timeout_sec
+        while not condition():
+            for name, _, _, process in self.processes:
+                if self._reap(name, process, block=False):
+                    raise RuntimeError(f"{name} exited early (see {self.run_dir / (name + '.out')})")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"timed out waiting for {what}")
+            time.sleep(0.1)
+
+    def run(self, registration_timeout_sec: float, league_timeout_sec: float) -> Dict:
+        """Launch every agent, play the league and shut everything down."""
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        manager_url = f"http://localhost:{MANAGER_PORT}/mcp"
+        try:
+            self._launch("league_manager", "league_manager", MANAGER_PORT, [
+                str(MANAGER_MAIN), "--registration-timeout", str(registration_timeout_sec),
+                "--expect-players", str(self.num_players), "--expect-referees", str(self.num_referees)])
+            self._wait_for(lambda: fetch_metrics(MANAGER_PORT) is not None, 60, "the league manager")
+
+            started = time.perf_counter()
+            for index in range(1, self.num_referees + 1):
+                command = [str(REFEREE_MAIN), "--referee-id", f"REF{index:02d}",
+                           "--port", str(REFEREE_BASE_PORT + index), "--league-manager", manager_url]
+                if self.seed is not None:
+                    command += ["--rng-seed", str(self.seed + index)]
+                self._launch(f"REF{index:02d}", "referee", REFEREE_BASE_PORT + index, command)
+            self._launch_players(manager_url)
+
+            def registered() -> bool:
+                text = fetch_metrics(MANAGER_PORT)
+                return (tool_count(text, "register_player") >= self.num_players
+                        and tool_count(text, "register_referee") >= self.num_referees)
+
+            self._wait_for(registered, registration_timeout_sec, "registration")
+            registration_sec = time.perf_counter() - started
+
+            league_start = time.perf_counter()
+            player_ports = [port for _, role, port, _ in self.processes if role in ("player", "player_host")]
+
+            def completed() -> bool:
+                return sum(tool_count(fetch_metrics(port), "notify_league_completed")
+                           for port in player_ports) >= self.num_players
+
+            self._wait_for(completed, league_timeout_sec, "the league to complete")
+            league_sec = time.perf_counter() - league_start
+
+            latency: Dict[str, LatencyBuckets] = defaultdict(LatencyBuckets)
+            for _, _, port, _ in self.processes:
+                for name, labels, value in parse_samples(fetch_metrics(port) or ""):
+                    if name.startswith(LATENCY_METRIC):
+                        latency[labels["tool"]].add(name, labels, value)
+        finally:
+            usage = self.shutdown()
+
+        matches = latency["receive_game_over"].count // 2 if "receive_game_over" in latency else 0
+        return {
+            "mode": "process",
+            "players": self.num_players,
+            "referees": self.num_referees,
+            "rounds": self.num_players - 1 + self.num_players % 2,
+            "matches": int(matches),
+            "registration_sec": round(registration_sec, 4),
+            "league_sec": round(league_sec, 4),
+            "matches_per_sec": round(matches / league_sec, 1) if league_sec else 0.0,
+            "tools": {tool: buckets.summary() for tool, buckets in sorted(latency.items())},
+            "agents": summarize_agents(usage),
+            "agent_usage": usage,
+        }
+
+    def _launch_players(self, manager_url: str) -> None:
+        if self.players_per_process <= 1:
+            for index in range(1, self.num_players + 1):
+                strategy = self.strategies[(index - 1) % len(self.strategies)]
+                self._launch(f"P{index:04d}", "player", PLAYER_BASE_PORT + index, [
+                    str(PLAYER_MAIN), "--player-id", f"P{index:04d}", "--port", str(PLAYER_BASE_PORT + index),
+                    "--strategy", strategy, "--league-manager", manager_url])
+            return
+        remaining, host = self.num_players, 0
+        while remaining > 0:
+            host += 1
+            count = min(self.players_per_process, remaining)
+            remaining -= count
+            self._launch(f"HOST{host:03d}", "player_host", PLAYER_BASE_PORT + host, [
+                str(PLAYER_HOST_MAIN), "--players", str(count), "--key-prefix", f"H{host}-",
+                "--strategies", ",".join(self.strategies), "--port", str(PLAYER_BASE_PORT + host),
+                "--league-manager", manager_url])
+
+    def _reap(self, name: str, process: subprocess.Popen, block: bool) -> bool:
+        """Record the usage of an agent that has exited; False if it is still running."""
+        if process.returncode is None:
+            usage = reap(process, block)
+            if usage is None:
+                return False
+            self.usage[name] = usage
+        return True
+
+    def shutdown(self) -> List[Dict]:
+        """Stop every agent and return each one's peak RSS and CPU time."""
+        for name, _, _, process in self.processes:
+            if process.returncode is None:
+                process.send_signal(signal.SIGINT)
+        deadline = time.monotonic() + 10
+        for name, _, _, process in self.processes:
+            while not self._reap(name, process, block=False) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            if process.returncode is None:
+                process.kill()
+                self._reap(name, process, block=True)
+        usage = [{"name": name, "role": role, **self.usage[name]}
+                 for name, role, _, _ in self.processes]
+        self.processes = []
+        return usage
@@ -0,0 +1,133 @@
+"""Micro Bench - Benchmark cases.
+
+Every case is a setup function returning the zero-argument call to time.
+Inputs are built from the protocol examples in doc/message-examples, scaled to
+league sizes where the function's cost depends on them. SDK modules are
+imported inside the setup, so one case's missing dependency only fails that
+case.
+"""
+
+import copy
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple
+
+EXAMPLES_ROOT = Path(__file__).resolve().parent.parent.parent / "doc" / "message-examples"
+
+
+def example(name: str) -> Dict:
+    """One message from doc/message-examples (e.g., "game-flow/choose_parity_call")."""
+    with (EXAMPLES_ROOT / f"{name}.json").open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def player_ids(count: int) -> List[str]:
+    return [f"P{index:02d}" for index in range(1, count + 1)]
+
+
+def league_results(players: int, seed: int = 7) -> Dict[str, Dict]:
+    """Manager ``results`` of a full round robin, one entry per match_result_report."""
+    from league_sdk.helpers import generate_round_robin_schedule
+
+    rng = random.Random(seed)
+    report = example("game-flow/match_result_report")["result"]
+    results = {}
+    for player_A, player_B, round_id, match_num in generate_round_robin_schedule(player_ids(players)):
+        result = copy.deepcopy(report)
+        winner = rng.choice([player_A, player_B, player_A, player_B, None])
+        if winner is None:
+            score = {player_A: 1, player_B: 1}
+        else:
+            score = {player_A: 3 if winner == player_A else 0, player_B: 3 if winner == player_B else 0}
+        result.update(winner=winner, score=score)
+        results[f"R{round_id}M{match_num}"] = result
+    return results
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    note: str
+
+
+def _standings(players: int):
+    def setup():
+        from league_sdk.helpers import calculate_standings
+        results = league_results(players)
+        return lambda: calculate_standings(results)
+    return setup
+
+
+def _schedule(players: int):
+    def setup():
+        from league_sdk.helpers import generate_round_robin_schedule
+        ids = player_ids(players)
+        return lambda: generate_round_robin_schedule(ids)
+    return setup
+
+
+def _auth_token():
+    from league_sdk.helpers import generate_auth_token
+    return lambda: generate_auth_token("player", "P01")
+
+
+def _conversation_id():
+    from league_sdk.helpers import generate_conversation_id
+    return lambda: generate_conversation_id("match-R1M1")
+
+
+def _iso_timestamp():
+    from league_sdk.helpers import get_iso_timestamp
+    return get_iso_timestamp
+
+
+def _json_logger():
+    from league_sdk.logger import JsonLogger
+    logger = JsonLogger("referee:REF01", log_root=Path(tempfile.mkdtemp(prefix="micro-bench-logs-")))
+    message = example("game-flow/choose_parity_call")
+
+    def log():
+        logger.log_message_sent(message["message_type"], message["player_id"],
+                                match_id=message["match_id"], conversation_id=message["conversation_id"])
+    return log
+
+
+def _envelope(name: str):
+    def setup():
+        from league_sdk.schemas import MessageEnvelope
+        message = example(name)
+        return lambda: MessageEnvelope(**message)
+    return setup
+
+
+def _update_player(players: int):
+    def setup():
+        from league_sdk.repositories import StandingsRepository
+        repository = StandingsRepository("league_bench", data_root=Path(tempfile.mkdtemp(prefix="micro-bench-data-")))
+        for player_id in player_ids(players):
+            repository.update_player(player_id, "DRAW", 1)
+        ids = player_ids(players)
+        position = [0]
+
+        def update():
+            position[0] = (position[0] + 1) % players
+            repository.update_player(ids[position[0]], "WIN", 3)
+        return update
+    return setup
+
+
+CASES: List[Case] = [
+    Case("calculate_standings[32]", _standings(32), "full round robin, 496 results"),
+    Case("calculate_standings[256]", _standings(256), "full round robin, 32640 results"),
+    Case("generate_round_robin_schedule[32]", _schedule(32), "496 matches"),
+    Case("generate_round_robin_schedule[256]", _schedule(256), "32640 matches"),
+    Case("generate_auth_token", _auth_token, "one per registration"),
+    Case("generate_conversation_id", _conversation_id, "one per match"),
+    Case("get_iso_timestamp", _iso_timestamp, "several per message"),
+    Case("JsonLogger.log_message_sent", _json_logger, "choose_parity_call, appended to a temp log"),
+    Case("MessageEnvelope[choose_parity_call]", _envelope("game-flow/choose_parity_call"), "pydantic validators"),
+    Case("MessageEnvelope[match_result_report]", _envelope("game-flow/match_result_report"), "pydantic validators"),
+    Case("StandingsRepository.update_player[32]", _update_player(32), "load, update and save standings.json"),
+]
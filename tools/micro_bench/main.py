@@ -0,0 +1,159 @@
+"""
+Micro Bench - Ops/s and allocations of league_sdk hot functions.
+
+Times the SDK functions called per message or per match (standings,
+scheduling, ids and tokens, timestamps, JSONL logging, envelope validation,
+the standings repository) with timeit, on inputs built from
+doc/message-examples. Each case is calibrated to run for at least --min-time
+per repeat; the median of the repeats gives ops/s. Memory is measured with
+tracemalloc in a separate pass: the peak allocated above the starting point
+during one call, and the bytes still held per call afterwards (growth).
+
+Usage:
+  python main.py
+  python main.py --only standings --only schedule --repeat 7
+  python main.py --json micro.json
+  python main.py --baseline micro.json --threshold 10
+"""
+
+import argparse
+import array
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
+
+from cases import CASES
+
+
+def measure_time(fn: Callable, repeat: int, min_time: float) -> Dict:
+    """Per-call time from ``repeat`` timeit runs, each at least ``min_time`` long."""
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    per_call = sorted(total / number for total in timer.repeat(repeat=repeat, number=number))
+    median = statistics.median(per_call)
+    return {
+        "ops_per_sec": round(1 / median, 1),
+        "median_us": round(median * 1e6, 3),
+        "best_us": round(per_call[0] * 1e6, 3),
+        "spread_pct": round((per_call[-1] - per_call[0]) / median * 100, 1),
+        "calls_per_repeat": number,
+    }
+
+
+def measure_memory(fn: Callable, calls: int = 200) -> Dict:
+    """Peak bytes allocated during one call (median) and bytes retained per call."""
+    fn()  # warm caches so one-time allocations are not charged to every call
+    tracemalloc.start()
+    try:
+        # Preallocated C array: storing a peak must not allocate an int object
+        peaks = array.array("q", bytes(8 * calls))
+        start, _ = tracemalloc.get_traced_memory()
+        for index in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            peaks[index] = tracemalloc.get_traced_memory()[1] - current
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_bytes": int(statistics.median(peaks)),
+        "retained_bytes_per_call": round((end - start) / calls, 1),
+    }
+
+
+def run_case(case, repeat: int, min_time: float, memory_calls: int) -> Dict:
+    try:
+        fn = case.setup()
+    except ImportError as e:
+        return {"name": case.name, "note": case.note, "error": f"missing dependency: {e.name}"}
+    result = {"name": case.name, "note": case.note}
+    result.update(measure_time(fn, repeat, min_time))
+    result.update(measure_memory(fn, memory_calls))
+    return result
+
+
+def print_results(results) -> None:
+    print("\n" + "=" * 100)
+    print("  LEAGUE SDK MICRO-BENCHMARKS")
+    print("=" * 100)
+    print(f"{'Case':<40} {'ops/s':>12} {'median us':>11} {'spread':>8} {'peak alloc B':>13} {'retained B':>11}")
+    print("-" * 100)
+    for r in results:
+        if "error" in r:
+            print(f"{r['name']:<40} {r['error']}")
+            continue
+        print(f"{r['name']:<40} {r['ops_per_sec']:>12,.0f} {r['median_us']:>11.2f} {r['spread_pct']:>7.1f}% "
+              f"{r['alloc_peak_bytes']:>13,} {r['retained_bytes_per_call']:>11.1f}")
+    print("=" * 100 + "\n")
+
+
+def compare(results, baseline: Dict, threshold_pct: float) -> int:
+    """Print ops/s changes against a baseline file; returns the number of regressions."""
+    previous = {r["name"]: r for r in baseline.get("results", []) if "ops_per_sec" in r}
+    regressions = 0
+    print(f"{'Case':<40} {'baseline ops/s':>15} {'ops/s':>12} {'change':>8}")
+    for r in results:
+        old = previous.get(r["name"])
+        if old is None or "ops_per_sec" not in r:
+            continue
+        change = (r["ops_per_sec"] - old["ops_per_sec"]) / old["ops_per_sec"] * 100
+        regressed = -change > threshold_pct
+        regressions += regressed
+        print(f"{r['name']:<40} {old['ops_per_sec']:>15,.0f} {r['ops_per_sec']:>12,.0f} {change:>+7.1f}%"
+              + ("  REGRESSION" if regressed else ""))
+    print(f"\n{regressions} regression(s) beyond -{threshold_pct}% ops/s\n")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of league_sdk hot functions")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Run cases whose name contains this text (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repeat")
+    parser.add_argument("--memory-calls", type=int, default=200, help="Calls traced for allocations")
+    parser.add_argument("--json", default=None, help="Write the results as JSON to this path")
+    parser.add_argument("--baseline", default=None, help="Compare ops/s with this result file")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Ops/s drop in percent that counts as a regression")
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if not args.only or any(text in c.name for text in args.only)]
+    if args.list:
+        for case in cases:
+            print(f"{case.name:<40} {case.note}")
+        return 0
+
+    results = []
+    for case in cases:
+        print(f"  {case.name} ...", flush=True)
+        results.append(run_case(case, args.repeat, args.min_time, args.memory_calls))
+    print_results(results)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "created": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "results": results,
+        }, indent=2))
+    if args.baseline:
+        if compare(results, json.loads(Path(args.baseline).read_text()), args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Match Replay - Rebuild drawn numbers from the league seed.
+
+Referees started with --rng-seed draw each match's number from a stream derived
+from the seed, the league_id and the match_id. This tool recomputes those
+numbers and, given referee JSONL logs, checks them against the MATCH_COMPLETE
+entries (each entry names its league).
+
+Usage:
+  python main.py --seed 42 --league-id league_2025_even_odd --match-id R1M1 --match-id R2M3
+  python main.py --seed 42 --logs ../../SHARED/logs/league/league_2025_even_odd
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from league_sdk.game_rules.rng import replay_draw
+
+
+def read_logged_draws(paths: Iterable[Path]) -> Dict[Tuple[str, str], Dict]:
+    """Collect MATCH_COMPLETE entries ((league_id, match_id) -> entry) from referee logs."""
+    logged = {}
+    for path in paths:
+        files = sorted(path.glob("referee*.log.jsonl")) if path.is_dir() else [path]
+        for log_file in files:
+            with log_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if (entry.get("event_type") == "MATCH_COMPLETE" and entry.get("league_id")
+                            and entry.get("drawn_number") is not None):
+                        logged[(entry["league_id"], entry["match_id"])] = entry
+    return logged
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay seeded match draws")
+    parser.add_argument("--seed", required=True, help="League seed given to the referees (--rng-seed)")
+    parser.add_argument("--league-id", default="league_2025_even_odd",
+                        help="League of the matches given with --match-id")
+    parser.add_argument("--match-id", action="append", default=[], help="Match to replay (repeatable)")
+    parser.add_argument("--logs", action="append", default=[],
+                        help="Referee log file or directory to verify against (repeatable)")
+    args = parser.parse_args()
+
+    logged = read_logged_draws(Path(p) for p in args.logs)
+    matches: List[Tuple[str, str]] = [(args.league_id, match_id) for match_id in args.match_id] or sorted(logged)
+    if not matches:
+        parser.error("give --match-id or --logs with MATCH_COMPLETE entries")
+
+    mismatches = 0
+    print(f"{'League':<24} {'Match':<10} {'Replayed':>9} {'Logged':>7}  Status")
+    for league_id, match_id in matches:
+        number = replay_draw(args.seed, league_id, match_id)
+        entry = logged.get((league_id, match_id))
+        if entry is None:
+            print(f"{league_id:<24} {match_id:<10} {number:>9} {'-':>7}  replayed")
+            continue
+        status = "OK" if entry["drawn_number"] == number else "MISMATCH"
+        mismatches += status != "OK"
+        print(f"{league_id:<24} {match_id:<10} {number:>9} {entry['drawn_number']:>7}  {status} ({entry['component']})")
+
+    if mismatches:
+        print(f"\n{mismatches} match(es) do not match the seed")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Simulation - League engine.
+
+Builds a complete league in one process: the real LeagueManager with its
+LeagueHandlers and LeagueScheduler, RefereeHandlers for every referee and
+PlayerHandlers for every player, all connected through the SDK loopback
+transport (calls are dispatched in-process, no sockets).
+Each league phase is timed so scheduling or strategy changes can be compared.
+
+The manager persists its state relative to the current working directory, so
+callers run the simulation from a scratch directory (see main.py).
+"""
+
+import contextlib
+import io
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from league_sdk import ConfigLoader, JsonLogger
+from league_sdk.agent_loader import load_agent_modules
+from league_sdk.game_rules.even_odd import EvenOddRules
+from league_sdk.game_rules.rng import create_rng_provider
+from league_sdk.helpers import calculate_standings, tool_result
+from league_sdk.loop_monitor import start_loop_monitor
+from league_sdk.loopback import LoopbackRegistry
+from league_sdk.mcp_client import MCPClient
+from league_sdk.mcp_server import MCPServer
+from league_sdk.metrics import Histogram, mcp_metrics
+
+
+MANAGER_ENDPOINT = "loopback://league_manager/mcp"
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated event-loop time for one league phase."""
+    calls: int = 0
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.wall_sec * 1000, 3),
+            "cpu_ms": round(self.cpu_sec * 1000, 3),
+        }
+
+
+@dataclass
+class SimulationReport:
+    """Outcome and timing of one simulated league."""
+    players: int
+    referees: int
+    rounds: int
+    matches: int
+    registration_sec: float
+    league_sec: float
+    loopback_calls: int
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    standings: List[Dict] = field(default_factory=list)
+    loop: Optional[Dict] = None
+    tools: Dict[str, Dict] = field(default_factory=dict)
+    seed: Optional[int] = None
+
+    @property
+    def matches_per_sec(self) -> float:
+        return self.matches / self.league_sec if self.league_sec else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "seed": self.seed,
+            "players": self.players,
+            "referees": self.referees,
+            "rounds": self.rounds,
+            "matches": self.matches,
+            "registration_sec": round(self.registration_sec, 4),
+            "league_sec": round(self.league_sec, 4),
+            "matches_per_sec": round(self.matches_per_sec, 1),
+            "loopback_calls": self.loopback_calls,
+            "phases": {name: stats.to_dict() for name, stats in self.phases.items()},
+            "loop": self.loop,
+            "tools": self.tools,
+            "top_standings": self.standings[:10],
+        }
+
+
+class SimPlayer:
+    """Minimal player agent state for PlayerHandlers."""
+
+    def __init__(self, local_id: str, league_id: str, strategy: str, log_root: Path):
+        self.player_id = local_id
+        self.league_id = league_id
+        self.strategy = strategy
+        self.auth_token = None
+        self.current_match = None
+        self.endpoint = f"loopback://player/{local_id}/mcp"
+        self.logger = JsonLogger(f"player:{local_id}", league_id=league_id, log_root=log_root)
+
+    async def notify_round_completed(self, args: dict) -> dict:
+        self.logger.info("ROUND_COMPLETED", round_id=args.get('round_id'))
+        return {"status": "ACK"}
+
+    async def notify_league_completed(self, args: dict) -> dict:
+        self.logger.info("LEAGUE_COMPLETED", champion=args.get('champion', {}).get('player_id'))
+        return {"status": "ACK"}
+
+
+class SimReferee:
+    """Minimal referee agent state for RefereeHandlers."""
+
+    def __init__(self, local_id: str, league_id: str, system_config, log_root: Path,
+                 rng_seed: Optional[int] = None):
+        self.referee_id = local_id
+        self.league_id = league_id
+        self.system_config = system_config
+        self.auth_token = None
+        self.game = EvenOddRules(create_rng_provider(rng_seed))
+        self.endpoint = f"loopback://referee/{local_id}/mcp"
+        self.league_manager_endpoint = MANAGER_ENDPOINT
+        self.logger = JsonLogger(f"referee:{local_id}", league_id=league_id, log_root=log_root)
+
+    async def notify_league_completed(self, args: dict) -> dict:
+        self.logger.info("LEAGUE_COMPLETED", champion=args.get('champion', {}).get('player_id'))
+        return {"status": "ACK"}
+
+
+class LeagueSimulation:
+    """Run a whole league in-process over the loopback transport."""
+
+    def __init__(
+        self,
+        num_players: int,
+        num_referees: int,
+        strategies: List[str],
+        league_id: str,
+        work_dir: Path,
+        max_rounds: Optional[int] = None,
+        rng_seed: Optional[int] = None,
+        quiet: bool = True,
+        standings_delta: bool = False,
+    ):
+        self.num_players = num_players
+        self.num_referees = num_referees
+        self.strategies = strategies
+        self.league_id = league_id
+        self.work_dir = Path(work_dir)
+        self.max_rounds = max_rounds
+        self.rng_seed = rng_seed
+        self.quiet = quiet
+        self.standings_delta = standings_delta
+        # A registry of its own keeps concurrent simulations apart
+        self.loopback = LoopbackRegistry()
+        self.client = MCPClient(timeout=None, loopback_registry=self.loopback)
+        # Dispatches the tool tables of the simulated referees and players
+        self.agent_server = MCPServer("Loopback")
+        self.phases: Dict[str, PhaseStats] = {}
+        self.players: List[SimPlayer] = []
+        self.referees: List[SimReferee] = []
+        self.referee_handlers = []
+
+        manager_modules = load_agent_modules("league_manager", ["handlers", "scheduler", "main"])
+        self.manager_module = manager_modules["main"]
+        player_modules = load_agent_modules("player_template", ["strategy", "handlers"])
+        self.player_handlers_cls = player_modules["handlers"].PlayerHandlers
+        referee_modules = load_agent_modules("referee_template", ["game_logic", "handlers"])
+        self.referee_handlers_cls = referee_modules["handlers"].RefereeHandlers
+
+    async def run(self) -> SimulationReport:
+        """Build all agents, register them and play the league."""
+        monitor = start_loop_monitor("Simulation")
+        manager = self._build_manager()
+        self._build_referees()
+        self._build_players()
+
+        registration = PhaseStats()
+        wall, cpu = time.perf_counter(), time.process_time()
+        await self._register_all()
+        registration.calls = len(self.players) + len(self.referees)
+        registration.wall_sec = time.perf_counter() - wall
+        registration.cpu_sec = time.process_time() - cpu
+        self.phases["registration"] = registration
+
+        # Registration is driven explicitly above, so no waiting window
+        manager.registration_timeout = 0
+        output = io.StringIO() if self.quiet else None
+        league_start = time.perf_counter()
+        with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+            await manager.run_league()
+        league_sec = time.perf_counter() - league_start
+        await self.client.close()
+
+        return SimulationReport(
+            players=len(self.players),
+            referees=len(self.referees),
+            rounds=manager.total_rounds,
+            matches=manager.expected_matches,
+            registration_sec=registration.wall_sec,
+            league_sec=league_sec,
+            loopback_calls=self.loopback.calls,
+            phases=self.phases,
+            standings=calculate_standings(manager.results),
+            loop=monitor.summary() if monitor else None,
+            tools=self._tool_latency(),
+            seed=self.rng_seed,
+        )
+
+    def _build_manager(self):
+        """Create the real LeagueManager and route its traffic over loopback."""
+        manager = self.manager_module.LeagueManager(self.league_id, log_root=self.work_dir / "logs")
+        manager.mcp_client = self.client
+        manager.max_rounds = self.max_rounds
+        manager.standings_delta = self.standings_delta
+
+        scheduler = manager.scheduler
+        scheduler.announce_round = self._timed("announce", scheduler.announce_round)
+        scheduler.check_rounds_completion = self._timed("round_completion", scheduler.check_rounds_completion)
+        manager._start_round_matches = self._timed("matches", manager._start_round_matches)
+        manager._wait_for_completion = self._timed("completion", self._drain_then(manager._wait_for_completion))
+        manager._finalize_league = self._timed("finalize", manager._finalize_league)
+
+        tools = dict(manager.mcp_server.tools)
+        tools["report_match_results"] = self._timed("results", tools["report_match_results"])
+        manager.mcp_server.register_loopback(MANAGER_ENDPOINT, tools, self.loopback)
+        self.manager = manager
+        return manager
+
+    def _build_referees(self) -> None:
+        config_loader = ConfigLoader()
+        system_config = config_loader.load_system()
+        for index in range(1, self.num_referees + 1):
+            referee = SimReferee(f"SIMREF{index:02d}", self.league_id, system_config,
+                                 self.work_dir / "logs", rng_seed=self.rng_seed)
+            handlers = self.referee_handlers_cls(referee, mcp_client=self.client)
+            self.agent_server.register_loopback(referee.endpoint, {
+                "start_match": handlers.start_match,
+                "notify_league_completed": referee.notify_league_completed,
+            })
+            self.referees.append(referee)
+            self.referee_handlers.append(handlers)
+
+    def _build_players(self) -> None:
+        for index in range(1, self.num_players + 1):
+            strategy = self.strategies[(index - 1) % len(self.strategies)]
+            player = SimPlayer(f"SIM{index:04d}", self.league_id, strategy, self.work_dir / "logs")
+            handlers = self.player_handlers_cls(player, mcp_client=self.client)
+            self.agent_server.register_loopback(player.endpoint, {
+                "notify_round": handlers.notify_round,
+                "notify_standings": handlers.notify_standings,
+                "notify_round_completed": player.notify_round_completed,
+                "notify_league_completed": player.notify_league_completed,
+                "receive_game_invitation": handlers.receive_game_invitation,
+                "choose_parity": handlers.choose_parity,
+                "receive_game_over": handlers.receive_game_over,
+            })
+            self.players.append(player)
+
+    async def _register_all(self) -> None:
+        """Register referees and players through the manager's real tools."""
+        for referee in self.referees:
+            result = tool_result(await self.client.call_tool(MANAGER_ENDPOINT, "register_referee", {
+                "referee_meta": {
+                    "display_name": f"Referee-{referee.referee_id}",
+                    "version": "2.1.0",
+                    "game_types": ["even_odd"],
+                    "contact_endpoint": referee.endpoint,
+                    "max_concurrent_matches": 1
+                }
+            }))
+            referee.referee_id = result["referee_id"]
+            referee.auth_token = result["auth_token"]
+
+        for player in self.players:
+            result = tool_result(await self.client.call_tool(MANAGER_ENDPOINT, "register_player", {
+                "player_meta": {
+                    "protocol_version": "2.1.0",
+                    "display_name": f"Player-{player.player_id}",
+                    "game_types": ["even_odd"],
+                    "contact_endpoint": player.endpoint,
+                    "strategy": player.strategy,
+                    "standings_delta": True
+                }
+            }))
+            player.player_id = result["player_id"]
+            player.auth_token = result["auth_token"]
+
+    @staticmethod
+    def _tool_latency() -> Dict[str, Dict]:
+        """Handler latency per tool, across every simulated agent."""
+        merged: Dict[str, Histogram] = {}
+        for (_, tool), histogram in mcp_metrics.tool_latency.series.items():
+            merged.setdefault(tool, Histogram()).merge(histogram)
+        return {tool: histogram.summary() for tool, histogram in sorted(merged.items())}
+
+    def _timed(self, phase: str, fn):
+        """Wrap a coroutine function so its time is added to a phase."""
+        stats = self.phases.setdefault(phase, PhaseStats())
+
+        async def wrapper(*args, **kwargs):
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                stats.calls += 1
+                stats.wall_sec += time.perf_counter() - wall
+                stats.cpu_sec += time.process_time() - cpu
+        return wrapper
+
+    def _drain_then(self, wait_for_completion):
+        """Flush queued referee reports before the manager's completion wait."""
+        async def wrapper():
+            for handlers in self.referee_handlers:
+                await handlers.flush_results()
+            await wait_for_completion()
+        return wrapper
@@ -0,0 +1,68 @@
+"""
+Standings Watch - Live standings from the shared-memory snapshot.
+
+Polls the file the league manager publishes with --standings-snapshot and
+prints the table whenever a new version appears. No HTTP and no auth token
+are needed, only read access to the file on the same host.
+
+Usage:
+  python main.py --path /dev/shm/league_2025_even_odd.standings
+  python main.py --path /dev/shm/league_2025_even_odd.standings --player P03 --once
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from league_sdk.standings_snapshot import StandingsReader
+
+
+def print_snapshot(snapshot, top: int, player_id: str = None) -> None:
+    """Print one standings snapshot."""
+    updated = datetime.fromtimestamp(snapshot.updated_at).strftime("%H:%M:%S")
+    state = "final" if snapshot.league_completed else f"after round {snapshot.round_id}"
+    print(f"\nStandings v{snapshot.version} ({state}, {updated})")
+    print(f"{'Rank':<6} {'Player':<12} {'Played':<8} {'W':<4} {'D':<4} {'L':<4} {'Points':<8}")
+    rows = [snapshot.find(player_id)] if player_id else snapshot.entries[:top]
+    for entry in rows:
+        if entry is None:
+            print(f"{player_id} not ranked yet")
+            continue
+        print(f"{entry.rank:<6} {entry.player_id:<12} {entry.played:<8} {entry.wins:<4} "
+              f"{entry.draws:<4} {entry.losses:<4} {entry.points:<8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch the shared-memory standings snapshot")
+    parser.add_argument("--path", required=True, help="File given to the manager's --standings-snapshot")
+    parser.add_argument("--player", default=None, help="Show only this player's row")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.5, help="Poll interval in seconds")
+    parser.add_argument("--once", action="store_true", help="Print the current snapshot and exit")
+    args = parser.parse_args()
+
+    while not Path(args.path).exists():
+        time.sleep(args.interval)
+    reader = StandingsReader(args.path)
+    seen = 0
+    try:
+        while True:
+            snapshot = reader.wait_for_update(seen, timeout=3600, poll_interval=args.interval)
+            if snapshot is None:
+                continue
+            seen = snapshot.version
+            print_snapshot(snapshot, args.top, args.player)
+            if args.once or snapshot.league_completed:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Strategy Tournament - Entry point.
+
+Plays every player strategy against every other one over millions of seeded
+Monte Carlo matches, spread over a process pool, and reports win rates with
+95% confidence intervals plus throughput.
+
+Usage:
+  python main.py
+  python main.py --matches-per-pair 2000000 --workers 8 --seed 42 --json results.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runner import STRATEGIES, PairResult, plan_tasks, play_chunk, summarize
+
+
+def run_tournament(args) -> dict:
+    """Play all pairings and aggregate the results."""
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    tasks = plan_tasks(strategies, args.matches_per_pair, args.series_length,
+                       args.chunk_size, args.seed)
+
+    pairs = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for chunk in pool.map(play_chunk, tasks):
+            key = (chunk.strategy_A, chunk.strategy_B)
+            pairs.setdefault(key, PairResult(*key)).merge(chunk)
+    elapsed = time.perf_counter() - start
+
+    records = summarize(list(pairs.values()))
+    total_matches = sum(pair.matches for pair in pairs.values())
+    return {
+        "seed": args.seed,
+        "workers": args.workers,
+        "total_matches": total_matches,
+        "elapsed_sec": round(elapsed, 3),
+        "matches_per_sec": round(total_matches / elapsed, 1) if elapsed else 0.0,
+        "strategies": {
+            name: {
+                "matches": record.matches,
+                "wins": record.wins,
+                "draws": record.draws,
+                "points_per_match": round(record.points / record.matches, 4) if record.matches else 0.0,
+                "win_rate": dict(zip(("rate", "ci_low", "ci_high"),
+                                     (round(v, 5) for v in record.win_rate()))),
+                "win_rate_vs": {k: round(v, 5) for k, v in record.opponents.items()},
+            }
+            for name, record in records.items()
+        },
+    }
+
+
+def print_summary(summary: dict) -> None:
+    """Print win rates (95% CI) ordered by points per match."""
+    print("\n" + "=" * 72)
+    print("  STRATEGY TOURNAMENT")
+    print("=" * 72)
+    print(f"Matches: {summary['total_matches']:,}  Workers: {summary['workers']}  "
+          f"Time: {summary['elapsed_sec']:.2f}s  "
+          f"Throughput: {summary['matches_per_sec']:,.0f} matches/s")
+    print("-" * 72)
+    print(f"{'Strategy':<14} {'Matches':>12} {'Win rate':>10} {'95% CI':>21} {'Pts/match':>11}")
+    print("-" * 72)
+    ranked = sorted(summary["strategies"].items(), key=lambda item: -item[1]["points_per_match"])
+    for name, stats in ranked:
+        win = stats["win_rate"]
+        print(f"{name:<14} {stats['matches']:>12,} {win['rate']:>10.4f} "
+              f"  [{win['ci_low']:.4f}, {win['ci_high']:.4f}] {stats['points_per_match']:>11.4f}")
+    print("=" * 72 + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo strategy tournament")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES),
+                        help="Comma-separated strategies from player_template/strategy.py")
+    parser.add_argument("--matches-per-pair", type=int, default=500_000)
+    parser.add_argument("--series-length", type=int, default=100,
+                        help="Consecutive matches between the same two players (history is kept within a series)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Matches per worker task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    summary = run_tournament(args)
+    print_summary(summary)
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Tournament - Monte Carlo match runner.
+
+Plays the player_template strategies against each other. Choices come from the
+real strategy functions, one match at a time, so stateful strategies see a
+realistic history. Outcomes of a whole chunk are then scored in one call to
+EvenOddRules.evaluate_batch().
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+from league_sdk.agent_loader import load_agent_modules
+from league_sdk.game_rules import even_odd
+from league_sdk.game_rules.even_odd import EvenOddRules, WINNER_A, WINNER_B, WINNER_DRAW
+from league_sdk.game_rules.rng import SeededRandomProvider, derive_seed
+
+
+STRATEGIES = ["random", "always_even", "always_odd", "alternating", "adaptive"]
+
+_strategy_module = None
+
+
+@dataclass
+class ChunkTask:
+    """A slice of one pairing's matches, played in independent series."""
+    strategy_A: str
+    strategy_B: str
+    matches: int
+    series_length: int
+    seed: int
+
+
+@dataclass
+class PairResult:
+    """Aggregated outcome of one pairing (A's perspective)."""
+    strategy_A: str
+    strategy_B: str
+    matches: int = 0
+    wins_A: int = 0
+    wins_B: int = 0
+    draws: int = 0
+    points_A: int = 0
+    points_B: int = 0
+
+    def merge(self, other: "PairResult") -> None:
+        self.matches += other.matches
+        self.wins_A += other.wins_A
+        self.wins_B += other.wins_B
+        self.draws += other.draws
+        self.points_A += other.points_A
+        self.points_B += other.points_B
+
+
+@dataclass
+class StrategyRecord:
+    """Totals for one strategy across every pairing it played."""
+    strategy: str
+    matches: int = 0
+    wins: int = 0
+    draws: int = 0
+    points: int = 0
+    opponents: Dict[str, float] = field(default_factory=dict)
+
+    def win_rate(self) -> Tuple[float, float, float]:
+        """Win rate with a 95% Wilson score interval."""
+        return wilson_interval(self.wins, self.matches)
+
+
+class ChoiceTally:
+    """
+    Opponent choice history with O(1) counts.
+
+    Behaves like the list adaptive_strategy expects (append/count/len), so the
+    strategy sees exactly the choices it would have observed in GAME_OVER
+    messages, without re-counting an ever growing list on every match.
+    """
+
+    __slots__ = ("even", "odd")
+
+    def __init__(self):
+        self.even = 0
+        self.odd = 0
+
+    def append(self, choice: str) -> None:
+        if choice == "even":
+            self.even += 1
+        elif choice == "odd":
+            self.odd += 1
+
+    def count(self, choice: str) -> int:
+        if choice == "even":
+            return self.even
+        if choice == "odd":
+            return self.odd
+        return 0
+
+    def __len__(self) -> int:
+        return self.even + self.odd
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.959964) -> Tuple[float, float, float]:
+    """Return (rate, low, high) using the Wilson score interval."""
+    if trials == 0:
+        return 0.0, 0.0, 0.0
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return rate, max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def plan_tasks(
+    strategies: List[str],
+    matches_per_pair: int,
+    series_length: int,
+    chunk_size: int,
+    seed: int,
+) -> List[ChunkTask]:
+    """Split every pairing into chunks of whole series."""
+    chunk_size = max(series_length, chunk_size - chunk_size % series_length)
+    tasks = []
+    for i, strategy_A in enumerate(strategies):
+        for strategy_B in strategies[i + 1:]:
+            remaining, chunk_index = matches_per_pair, 0
+            while remaining > 0:
+                matches = min(chunk_size, remaining)
+                tasks.append(ChunkTask(
+                    strategy_A, strategy_B, matches, series_length,
+                    derive_seed(seed, f"{strategy_A}:{strategy_B}:{chunk_index}")
+                ))
+                remaining -= matches
+                chunk_index += 1
+    return tasks
+
+
+def _chooser(name: str) -> Callable[[Dict, str, Dict], str]:
+    """Build a choice function for a strategy from player_template/strategy.py."""
+    global _strategy_module
+    if _strategy_module is None:
+        _strategy_module = load_agent_modules("player_template", ["strategy"])["strategy"]
+    module = _strategy_module
+    if name == "adaptive":
+        return module.adaptive_strategy
+    return lambda match_info, opponent_id, history: module.determine_parity_choice(name, match_info)
+
+
+def play_chunk(task: ChunkTask) -> PairResult:
+    """Play one chunk (runs inside a worker process)."""
+    # Strategies draw from the global random module
+    random.seed(task.seed)
+    choose_A = _chooser(task.strategy_A)
+    choose_B = _chooser(task.strategy_B)
+
+    choices_A, choices_B = [], []
+    info_A = {"match_id": "", "opponent_id": "B", "round_id": 1}
+    info_B = {"match_id": "", "opponent_id": "A", "round_id": 1}
+    played = 0
+    while played < task.matches:
+        # A new series is a fresh encounter: no shared history yet
+        seen_by_A = {"B": ChoiceTally()}
+        seen_by_B = {"A": ChoiceTally()}
+        for round_id in range(1, min(task.series_length, task.matches - played) + 1):
+            info_A["round_id"] = info_B["round_id"] = round_id
+            choice_A = choose_A(info_A, "B", seen_by_A)
+            choice_B = choose_B(info_B, "A", seen_by_B)
+            choices_A.append(choice_A)
+            choices_B.append(choice_B)
+            # Choices are revealed to both players in GAME_OVER
+            seen_by_A["B"].append(choice_B)
+            seen_by_B["A"].append(choice_A)
+            played += 1
+
+    rules = EvenOddRules(SeededRandomProvider(task.seed))
+    outcome = rules.evaluate_batch(choices_A, choices_B, rules.draw_numbers(played, stream_key="draws"))
+    return PairResult(
+        task.strategy_A, task.strategy_B, matches=played,
+        wins_A=_count(outcome.winners, WINNER_A),
+        wins_B=_count(outcome.winners, WINNER_B),
+        draws=_count(outcome.winners, WINNER_DRAW),
+        points_A=_total(outcome.points_A),
+        points_B=_total(outcome.points_B),
+    )
+
+
+def _count(values, code: int) -> int:
+    """Count occurrences of a code in an outcome array."""
+    if even_odd.np is not None:
+        return int((values == code).sum())
+    return sum(1 for value in values if value == code)
+
+
+def _total(values) -> int:
+    """Sum an outcome array."""
+    return int(values.sum()) if even_odd.np is not None else sum(values)
+
+
+def summarize(pair_results: List[PairResult]) -> Dict[str, StrategyRecord]:
+    """Fold pairing results into per-strategy records."""
+    records: Dict[str, StrategyRecord] = {}
+    for pair in pair_results:
+        for name, opponent, wins, points in (
+            (pair.strategy_A, pair.strategy_B, pair.wins_A, pair.points_A),
+            (pair.strategy_B, pair.strategy_A, pair.wins_B, pair.points_B),
+        ):
+            record = records.setdefault(name, StrategyRecord(name))
+            record.matches += pair.matches
+            record.wins += wins
+            record.draws += pair.draws
+            record.points += points
+            record.opponents[opponent] = wins / pair.matches if pair.matches else 0.0
+    return records
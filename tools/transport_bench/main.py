@@ -0,0 +1,193 @@
+"""
+Transport Benchmark - Per-call latency of MCPClient transports.
+
+Starts an MCPServer with a choose_parity tool in a child process and measures
+the round-trip latency of MCPClient.call_tool over each transport: one call at
+a time, then with --concurrency calls in flight on one client. The ``unix``
+transport is HTTP over a Unix domain socket the server also listens on.
+
+Usage:
+  python main.py --calls 2000
+  python main.py --transports http,websocket,unix --concurrency 32 --json transports.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from league_sdk.mcp_client import MCPClient
+from league_sdk.unix_socket import server_sockets, unix_endpoint
+
+
+PARITY_CALL = {
+    "protocol": "league.v2",
+    "message_type": "CHOOSE_PARITY_CALL",
+    "sender": "referee:REF01",
+    "timestamp": "2025-01-15T10:15:00Z",
+    "conversation_id": "parity-R1M1-P01",
+    "auth_token": "tok_REF01_abc123def456",
+    "league_id": "league_2025_even_odd",
+    "match_id": "R1M1",
+    "player_id": "P01",
+    "game_type": "even_odd",
+    "context": {"opponent_id": "P02", "round_id": 1,
+                "your_standings": {"wins": 0, "losses": 0, "draws": 0}},
+    # Never expires: clients and servers drop calls past their deadline
+    "deadline": "2099-01-01T00:00:00Z"
+}
+
+
+def run_server(host: str, port: int, uds_path: str) -> None:
+    """Child process: serve a player-like choose_parity tool."""
+    import uvicorn
+    from league_sdk.mcp_server import MCPServer
+
+    logging.basicConfig(level=logging.WARNING)
+    server = MCPServer("BenchPlayer")
+
+    async def choose_parity(args: dict) -> dict:
+        return {
+            "protocol": "league.v2",
+            "message_type": "CHOOSE_PARITY_RESPONSE",
+            "sender": f"player:{args.get('player_id')}",
+            "timestamp": args.get("timestamp"),
+            "match_id": args.get("match_id"),
+            "parity_choice": "even"
+        }
+
+    server.register_tool("choose_parity", choose_parity)
+    config = uvicorn.Config(server.app, log_level="warning")
+    asyncio.run(uvicorn.Server(config).serve(sockets=server_sockets(host, port, uds_path)))
+
+
+def percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p50_ms": round(pick(0.50), 4),
+        "p90_ms": round(pick(0.90), 4),
+        "p99_ms": round(pick(0.99), 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+async def measure(client: MCPClient, endpoint: str, calls: int, concurrency: int) -> Dict:
+    """Latency of sequential calls and throughput with concurrent calls."""
+    for _ in range(min(50, calls)):  # warm up connections
+        await client.call_tool(endpoint, "choose_parity", PARITY_CALL)
+
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await client.call_tool(endpoint, "choose_parity", PARITY_CALL)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    async def worker(count: int):
+        for _ in range(count):
+            await client.call_tool(endpoint, "choose_parity", PARITY_CALL)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(calls // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "sequential": percentiles(samples),
+        "concurrent": {
+            "concurrency": concurrency,
+            "calls_per_sec": round(concurrency * (calls // concurrency) / elapsed, 1),
+        },
+    }
+
+
+async def wait_until_ready(endpoint: str, timeout: float = 15.0) -> None:
+    client = MCPClient(timeout=2)
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                await client.call_tool(endpoint, "choose_parity", PARITY_CALL)
+                return
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+    finally:
+        await client.close()
+
+
+async def run(args) -> Dict:
+    endpoint = f"http://{args.host}:{args.port}/mcp"
+    await wait_until_ready(endpoint)
+    results = {}
+    for transport in args.transports:
+        if transport == "unix":
+            client, target = MCPClient(), unix_endpoint(args.uds)
+        else:
+            client, target = MCPClient(transport=transport), endpoint
+        try:
+            results[transport] = await measure(client, target, args.calls, args.concurrency)
+            if client.ws_pool is not None and not client.ws_pool.connections:
+                results[transport]["note"] = "WebSocket unavailable, measured the HTTP fallback"
+        finally:
+            await client.close()
+    return results
+
+
+def print_results(results: Dict) -> None:
+    print("\n" + "=" * 72)
+    print("  MCP TRANSPORT LATENCY (choose_parity round trip)")
+    print("=" * 72)
+    print(f"{'Transport':<12} {'mean ms':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'calls/s':>12}")
+    print("-" * 72)
+    for transport, data in results.items():
+        seq = data["sequential"]
+        print(f"{transport:<12} {seq['mean_ms']:>9.3f} {seq['p50_ms']:>9.3f} {seq['p90_ms']:>9.3f} "
+              f"{seq['p99_ms']:>9.3f} {data['concurrent']['calls_per_sec']:>12.1f}")
+        if "note" in data:
+            print(f"  ({data['note']})")
+    print("=" * 72 + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCPClient transport latency benchmark")
+    parser.add_argument("--transports", default="http,websocket,unix",
+                        help="Comma-separated transports to measure")
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per transport and mode")
+    parser.add_argument("--concurrency", type=int, default=16, help="Calls in flight for throughput")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8390)
+    parser.add_argument("--uds", default=str(Path(tempfile.gettempdir()) / "transport_bench.sock"),
+                        help="Unix socket of the unix transport")
+    parser.add_argument("--json", default=None, help="Write the results as JSON to this path")
+    args = parser.parse_args()
+    args.transports = [t.strip() for t in args.transports.split(",") if t.strip()]
+    logging.basicConfig(level=logging.WARNING)
+
+    context = multiprocessing.get_context("spawn")
+    server = context.Process(target=run_server, args=(args.host, args.port, args.uds), daemon=True)
+    server.start()
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        server.terminate()
+    print_results(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()